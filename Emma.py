@@ -22,6 +22,7 @@ import Emma
 import Emma.emma
 import Emma.emma_vis
 import Emma.emma_deltas
+import Emma.emma_pipeline
 import Emma.shared_libs.emma_helper
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 
@@ -63,6 +64,12 @@ def initParser():
         help="Emma Deltas",
         conflict_handler="resolve",                                         # Since there are conflicting help messages of the top level and sub parsersr
     )
+    subparser.add_parser(
+        Emma.SUBPARSER_STRINGS.ANALYSER_AND_VISUALISER,
+        parents=[Emma.emma_pipeline.initParser()],
+        help="Emma Analyser and Visualiser in one process",
+        conflict_handler="resolve",                                         # Since there are conflicting help messages of the top level and sub parsersr
+    )
     return topLevelParser
 
 
@@ -78,7 +85,8 @@ def main(arguments=""):
     emmaModuleLUT = {
         Emma.SUBPARSER_STRINGS.ANALYSER: Emma.emma.main,
         Emma.SUBPARSER_STRINGS.VISUALISER: Emma.emma_vis.main,
-        Emma.SUBPARSER_STRINGS.DELTAS: Emma.emma_deltas.main
+        Emma.SUBPARSER_STRINGS.DELTAS: Emma.emma_deltas.main,
+        Emma.SUBPARSER_STRINGS.ANALYSER_AND_VISUALISER: Emma.emma_pipeline.main
     }
 
     # Display the top level help message if no argument is given
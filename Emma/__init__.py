@@ -20,6 +20,7 @@ class SUBPARSER_STRINGS:
     ANALYSER: str = "a"
     VISUALISER: str = "v"
     DELTAS: str = "d"
+    ANALYSER_AND_VISUALISER: str = "av"
 
 
 VERSION_MAJOR = "3"
@@ -121,6 +121,37 @@ def initParser():
         default=False,
         action="store_true"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        help="Maximal number of worker processes used to process the configIDs or the mapfiles of a configID in parallel.",
+        type=int,
+        default=1
+    )
+    parser.add_argument(
+        "--parser_engine",
+        help="Engine the mapfiles are parsed with: `lines` applies the regex patterns line-by-line, `mmap` memory-maps the mapfiles and scans their blocks with bytes patterns (only for the default patterns).",
+        choices=PARSER_ENGINES,
+        default=PARSER_ENGINE_LINES
+    )
+    parser.add_argument(
+        "--cache_dir",
+        help="Directory of the parse cache. If it is given, the elements extracted from the mapfiles are cached there and unchanged mapfiles will not be parsed again.",
+        default=None
+    )
+    parser.add_argument(
+        "--cache_size",
+        help="Size limit of the parse cache in MiB. If it is exceeded, the least recently used entries are removed.",
+        type=int,
+        default=DEFAULT_CACHE_SIZE_MB
+    )
+    parser.add_argument(
+        "--format",
+        help="Formats the results are stored in: `csv` writes a CSV report for every consumer collection, `sqlite` writes all of them into a single SQLite database, `npz` writes all of them into a single NumPy bundle that the Emma Visualiser and Emma Deltas can read without parsing text.",
+        nargs="+",
+        choices=REPORT_FORMATS,
+        default=[REPORT_FORMAT_CSV]
+    )
     parser.add_argument(
         "--noprompt",
         help="Exit program with an error if a user prompt occurs; useful for CI systems",
@@ -171,8 +202,19 @@ def processArguments(arguments):
     createCategories = arguments.create_categories
     removeUnmatched = arguments.remove_unmatched
     noPrompt = arguments.noprompt
-
-    return projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt
+    jobs = arguments.jobs
+    if jobs < 1:
+        sc().error("The number of jobs needs to be at least 1 (got " + str(jobs) + ")!")
+    parserEngine = arguments.parser_engine
+    # Get paths straight (only forward slashes) or leave it None if the cache is disabled
+    cacheDirectory = Emma.shared_libs.emma_helper.joinPath(arguments.cache_dir) if arguments.cache_dir is not None else None
+    cacheSize = arguments.cache_size
+    if cacheSize < 1:
+        sc().error("The size of the parse cache needs to be at least 1 MiB (got " + str(cacheSize) + ")!")
+    # Every format is only written once, even if it was given more times
+    reportFormats = tuple(dict.fromkeys(arguments.format))
+
+    return projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt, jobs, parserEngine, cacheDirectory, cacheSize, reportFormats
 
 
 def runEmma():
@@ -24,23 +24,26 @@ import pandas
 
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 import Emma.shared_libs.emma_helper
+import Emma.shared_libs.reportBundle
 
 
 class Delta:
     """
     Class used for the delta calculation
     """
-    def __init__(self, files: typing.List[str], outfile: str):
+    def __init__(self, files: typing.List[str], outfile: str, collectionType: str = FILE_IDENTIFIER_SECTION_SUMMARY):
         self.__inFilePaths: typing.List[str] = files
         self.__outFilePath: str = outfile
+        self.__collectionType: str = collectionType
 
-        self.__lhs: pandas.DataFrame = pandas.read_csv(self.__inFilePaths[0], index_col=3, sep=";")
-        self.__rhs: pandas.DataFrame = pandas.read_csv(self.__inFilePaths[1], index_col=3, sep=";")
+        # The files can be .csv reports or .npz bundles, the report of the collectionType is read from the bundles
+        self.__lhs: pandas.DataFrame = Emma.shared_libs.reportBundle.readReport(self.__inFilePaths[0], collectionType)
+        self.__rhs: pandas.DataFrame = Emma.shared_libs.reportBundle.readReport(self.__inFilePaths[1], collectionType)
         self.__delta: pandas.DataFrame = self.__buildDelta()
 
     def __buildDelta(self) -> pandas.DataFrame:
-        namelhs = os.path.split(self.__inFilePaths[0])[-1].replace(".csv", "").replace(FILE_IDENTIFIER_SECTION_SUMMARY, "")
-        namerhs = os.path.split(self.__inFilePaths[1])[-1].replace(".csv", "").replace(FILE_IDENTIFIER_SECTION_SUMMARY, "")
+        namelhs = os.path.splitext(os.path.split(self.__inFilePaths[0])[-1])[0].replace(self.__collectionType, "").replace(BUNDLE_REPORT_NAME, "")
+        namerhs = os.path.splitext(os.path.split(self.__inFilePaths[1])[-1])[0].replace(self.__collectionType, "").replace(BUNDLE_REPORT_NAME, "")
 
         LHS_SUFFIX = "_" + namelhs
         RHS_SUFFIX = "_" + namerhs
@@ -53,7 +56,7 @@ class Delta:
         delta = lhs.join(rhs, lsuffix=LHS_SUFFIX, rsuffix=RHS_SUFFIX)
 
         delta[DELTA_SIZE_DEC] = delta[SIZE_DEC + LHS_SUFFIX] - delta[SIZE_DEC + RHS_SUFFIX]
-        delta[DELTA_HUMAN_READABLE] = delta[DELTA_SIZE_DEC].apply(shared_libs.emma_helper.toHumanReadable)
+        delta[DELTA_HUMAN_READABLE] = delta[DELTA_SIZE_DEC].apply(Emma.shared_libs.emma_helper.toHumanReadable)
         delta[DELTA_PERCENTAGE] = delta[DELTA_SIZE_DEC] / delta[SIZE_DEC + LHS_SUFFIX]
 
         return delta
@@ -39,6 +39,8 @@ class FilePresenter:
 
     def __init__(self, fileSelector: Emma.emma_delta_libs.FileSelector):
         self.__fileSelector: Emma.emma_delta_libs.FileSelector = fileSelector
+        self.__filetype: str = FILE_IDENTIFIER_SECTION_SUMMARY
+        # self.__filetype stores the chosen summary, it is also the report that is read from the .npz bundles
 
     def chooseCandidates(self) -> typing.List[str]:
         # TODO: Validate all inputs (FM)
@@ -47,6 +49,7 @@ class FilePresenter:
             filetype: str = self.__filetypes[int(input("Choose File type >\n"))]
         except KeyError:
             sc().error("Select valid Summary.\n")
+        self.__filetype = filetype
 
         candidates: typing.List[str] = self.__fileSelector.getCandidates()
         self.__printCandidates(candidates)
@@ -60,6 +63,9 @@ class FilePresenter:
         self.__printSelectedFiles(selectedFiles)
         return selectedFiles
 
+    def getFiletype(self) -> str:
+        return self.__filetype
+
     def __printCandidates(self, candidates: typing.List[str]) -> None:
         for i, candidate in enumerate(candidates):
             string = "    " + str(i) + ": " + candidate
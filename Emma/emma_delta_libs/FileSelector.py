@@ -34,7 +34,7 @@ class FileSelector:
     def __init__(self, projectDir: str):
         self.__projectDir: str = projectDir
         self.__path: str = Emma.shared_libs.emma_helper.joinPath(projectDir, OUTPUT_DIR)
-        self.__versionCandidates: typing.List[str] = [f for f in os.listdir(self.__path) if os.path.isdir(shared_libs.emma_helper.joinPath(self.__path, f))]
+        self.__versionCandidates: typing.List[str] = [f for f in os.listdir(self.__path) if os.path.isdir(Emma.shared_libs.emma_helper.joinPath(self.__path, f))]
         # self.__versionCandidates stores the list of files for the analysis
 
     def getCandidates(self) -> typing.List[str]:
@@ -50,15 +50,15 @@ class FileSelector:
 
     def __fileToUse(self, subStringIdentifier: str, path: str) -> str:
         fileToUse = None
-        lastModifiedFiles: typing.List[str] = Emma.shared_libs.emma_helper.lastModifiedFilesInDir(path, ".csv")  # Newest/youngest file is last element
+        lastModifiedFiles: typing.List[str] = Emma.shared_libs.emma_helper.lastModifiedFilesInDir(path, (CSV_FILE_EXTENSION, BUNDLE_FILE_EXTENSION))  # Newest/youngest file is last element
 
         if not lastModifiedFiles:
             sc().error("No matching Files in: " + path)
 
         # Backwards iterate over file list (so newest file will be first)
         for i in range(len(lastModifiedFiles) - 1, -1, -1):
-            # Select module/image summary .csv file
-            if subStringIdentifier in lastModifiedFiles[i]:
+            # Select module/image summary .csv file or a .npz bundle (it contains every summary)
+            if subStringIdentifier in lastModifiedFiles[i] or lastModifiedFiles[i].endswith(BUNDLE_FILE_EXTENSION):
                 fileToUse = lastModifiedFiles[i]
                 # Exit in first match which is the newest file as we are backwards iterating
                 break
@@ -105,6 +105,8 @@ def main(arguments):
     TIME_START = timeit.default_timer()
     sc().info("Started processing at", datetime.datetime.now().strftime("%H:%M:%S"))
 
+    # The summary that is compared, the .npz bundles contain all of them
+    collectionType = FILE_IDENTIFIER_SECTION_SUMMARY
     if arguments.infiles and arguments.outfile is not None:
         candidates = arguments.infiles
     elif arguments.project:
@@ -112,16 +114,18 @@ def main(arguments):
         fileSelector = Emma.emma_delta_libs.FileSelector.FileSelector(projectDir=arguments.project)
         filePresenter = Emma.emma_delta_libs.FilePresenter.FilePresenter(fileSelector=fileSelector)
         candidates = filePresenter.chooseCandidates()
+        collectionType = filePresenter.getFiletype()
     elif not arguments.r:
         rootpath = Emma.emma_delta_libs.RootSelector.selectRoot()
         Emma.emma_delta_libs.RootSelector.saveNewRootpath(rootpath)
         fileSelector = Emma.emma_delta_libs.FileSelector.FileSelector(projectDir=rootpath)
         filePresenter = Emma.emma_delta_libs.FilePresenter.FilePresenter(fileSelector=fileSelector)
         candidates = filePresenter.chooseCandidates()
+        collectionType = filePresenter.getFiletype()
     else:
         sc().error("No matching arguments.")
 
-    delta = Emma.emma_delta_libs.Delta.Delta(files=candidates, outfile=arguments.outfile)
+    delta = Emma.emma_delta_libs.Delta.Delta(files=candidates, outfile=arguments.outfile, collectionType=collectionType)
     delta.tocsv()
     sc().info("Saved delta to " + arguments.outfile)
 
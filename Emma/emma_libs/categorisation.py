@@ -53,6 +53,15 @@ class Categorisation:
         self.categoriesSections = Categorisation.__readCategoriesJson(self.categoriesSectionsPath)
         self.categoriesObjectsKeywords = Categorisation.__readCategoriesJson(self.categoriesObjectsKeywordsPath)
         self.categoriesSectionsKeywords = Categorisation.__readCategoriesJson(self.categoriesSectionsKeywordsPath)
+        # Reverse indexes of the categories files: the element names with the comma separated categories found for them (None if the file is not present)
+        self.categoriesObjectsIndex = Categorisation.__createCategoriesIndex(self.categoriesObjects)
+        self.categoriesSectionsIndex = Categorisation.__createCategoriesIndex(self.categoriesSections)
+        # The compiled keywords of the categoriesKeywords files (None if the file is not present)
+        self.categoriesObjectsKeywordMatcher = KeywordMatcher(self.categoriesObjectsKeywords) if self.categoriesObjectsKeywords is not None else None
+        self.categoriesSectionsKeywordMatcher = KeywordMatcher(self.categoriesSectionsKeywords) if self.categoriesSectionsKeywords is not None else None
+        # The results of the keyword categorisation for the names that were already categorised by keywords (None if no keyword matched)
+        self.keywordCategoriesOfObjects = {}
+        self.keywordCategoriesOfSections = {}
 
     def fillOutCategories(self, sectionCollection, objectCollection):
         """
@@ -94,6 +103,27 @@ class Categorisation:
             sc().warning("There was no " + os.path.basename(path) + " file found, the categorization based on this will be skipped.")
         return categoriesJson
 
+    @staticmethod
+    def __createCategoriesIndex(categories):
+        """
+        Function to create a reverse index of a categories file, so the categories of a name can be looked up without iterating through the file.
+        It needs to be recreated every time the categories file content is changed.
+        :param categories: Content of the categories file or None.
+        :return: Dictionary with the element names as keys and the strings that contain their categories comma separated as values, else None.
+        """
+        result = None
+
+        # Did we get a file?
+        if categories is not None:
+            categoriesOfTheNames = {}
+            # Iterating trough the categories and the elements that shall be ordered to them
+            for category in categories:
+                for categoryElementName in categories[category]:
+                    categoriesOfTheNames.setdefault(categoryElementName, []).append(category)
+            # The categories found for a name are sorted and joined comma separated
+            result = {categoryElementName: ", ".join(sorted(categoriesOfTheName)) for categoryElementName, categoriesOfTheName in categoriesOfTheNames.items()}
+        return result
+
     def __fillOutSectionCategories(self, sectionCollection):
         """
         Function to fill out the categories in a section collection.
@@ -103,7 +133,7 @@ class Categorisation:
         # Filling out sections
         for consumer in sectionCollection:
             consumerName = consumer.sectionName
-            consumer.category = Categorisation.__evalCategoryOfAnElement(consumerName, self.categoriesSections, self.categoriesSectionsKeywords, self.keywordCategorisedSections)
+            consumer.category = Categorisation.__evalCategoryOfAnElement(consumerName, self.categoriesSectionsIndex, self.categoriesSectionsKeywordMatcher, self.keywordCategoriesOfSections, self.keywordCategorisedSections)
 
     def __fillOutObjectCategories(self, objectCollection):
         """
@@ -114,7 +144,7 @@ class Categorisation:
         # Filling out objects
         for consumer in objectCollection:
             consumerName = consumer.objectName
-            consumer.category = Categorisation.__evalCategoryOfAnElement(consumerName, self.categoriesObjects, self.categoriesObjectsKeywords, self.keywordCategorisedObjects)
+            consumer.category = Categorisation.__evalCategoryOfAnElement(consumerName, self.categoriesObjectsIndex, self.categoriesObjectsKeywordMatcher, self.keywordCategoriesOfObjects, self.keywordCategorisedObjects)
 
     def __manageSectionCategoriesFiles(self, updateCategoriesFromKeywordMatches, removeUnmatchedCategories, sectionCollection):
         """
@@ -154,6 +184,7 @@ class Categorisation:
             if text == "y":
                 sc().info("Remove unmatched modules from " + CATEGORIES_SECTIONS_JSON + "?\nIt will be overwritten.\n `y` to accept, any other key to discard.")
                 Categorisation.__removeUnmatchedFromCategoriesJson(self.categoriesSections, sectionCollection, Emma.emma_libs.memoryEntry.SectionEntry, self.categoriesSectionsPath)
+                self.categoriesSectionsIndex = Categorisation.__createCategoriesIndex(self.categoriesSections)
             else:
                 sc().info(text + " was entered, aborting the removal. The " + self.categoriesSectionsPath + " was not changed.")
 
@@ -194,80 +225,72 @@ class Categorisation:
             if text == "y":
                 sc().info("Remove unmatched modules from " + CATEGORIES_OBJECTS_JSON + "?\nIt will be overwritten.\n `y` to accept, any other key to discard.")
                 Categorisation.__removeUnmatchedFromCategoriesJson(self.categoriesObjects, objectCollection, Emma.emma_libs.memoryEntry.ObjectEntry, self.categoriesObjectsPath)
+                self.categoriesObjectsIndex = Categorisation.__createCategoriesIndex(self.categoriesObjects)
             else:
                 sc().info(text + " was entered, aborting the removal. The " + self.categoriesObjectsPath + " was not changed.")
 
     @staticmethod
-    def __evalCategoryOfAnElement(nameString, categories, categoriesKeywords, keywordCategorisedElements):
+    def __evalCategoryOfAnElement(nameString, categoriesIndex, keywordMatcher, keywordCategoriesOfNames, keywordCategorisedElements):
+        # pylint: disable=too-many-arguments
+        # Rationale: The categorisation files and the results of the keyword categorisation of the collection type need to be passed to this function.
+
         """
         Function to find the category of an element. First the categorisation will be tried with the categories file,
         and if that fails with the categoriesKeywords file. If this still fails a default value will be set for the category.
         If the element was categorised by a keyword then the element will be added to the keywordCategorisedElements list.
         :param nameString: The name string of the element that needs to be categorised.
-        :param categories: Content of the categories file.
-        :param categoriesKeywords: Content of the categoriesKeywords file.
+        :param categoriesIndex: Reverse index of the categories file (see __createCategoriesIndex()).
+        :param keywordMatcher: KeywordMatcher object of the categoriesKeywords file or None.
+        :param keywordCategoriesOfNames: Dictionary with the results of the keyword categorisation of the names that were already categorised by keywords.
         :param keywordCategorisedElements: List of elements that were categorised by keywords.
         :return: Category string
         """
-        foundCategory = Categorisation.__searchCategoriesJson(nameString, categories)
+        foundCategory = Categorisation.__searchCategoriesJson(nameString, categoriesIndex)
         if foundCategory is None:
             # If there is no match check for keyword specified in categoriesKeywordsJson
-            foundCategory = Categorisation.__categoriseByKeyword(nameString, categoriesKeywords, keywordCategorisedElements)
+            foundCategory = Categorisation.__categoriseByKeyword(nameString, keywordMatcher, keywordCategoriesOfNames, keywordCategorisedElements)
         if foundCategory is None:
             # If there is still no match then we will assign the default constant
             foundCategory = UNKNOWN_CATEGORY
         return foundCategory
 
     @staticmethod
-    def __searchCategoriesJson(nameString, categories):
+    def __searchCategoriesJson(nameString, categoriesIndex):
         """
         Function to search categories for a name in a categories file.
         :param nameString: String that categories needs to be searched for.
-        :param categories: File the categories needs to be searched in.
+        :param categoriesIndex: Reverse index of the file the categories needs to be searched in (see __createCategoriesIndex()).
         :return: String that contains the categories comma separated that were found for the nameString, else None.
         """
         result = None
 
         # Did we get a file?
-        if categories is not None:
-            categoriesFoundForTheName = []
-            # Iterating trough the categories
-            for category in categories:
-                # Look through elements that shall be ordered to this category
-                for categoryElementName in categories[category]:
-                    # If the element name matches the nameString then we will add this category as found
-                    if nameString == categoryElementName:
-                        categoriesFoundForTheName.append(category)
-            # If we have found categories then we will sort them and return them comma separated
-            if categoriesFoundForTheName:
-                categoriesFoundForTheName.sort()
-                result = ", ".join(categoriesFoundForTheName)
+        if categoriesIndex is not None:
+            result = categoriesIndex.get(nameString)
         return result
 
     @staticmethod
-    def __categoriseByKeyword(nameString, categoriesKeywords, keywordCategorisedElements):
+    def __categoriseByKeyword(nameString, keywordMatcher, keywordCategoriesOfNames, keywordCategorisedElements):
         """
         Function to search a category for a name in a categoriesKeywords file.
+        Every name is only matched once, the results are stored in the keywordCategoriesOfNames and reused for the names that repeat.
         :param nameString: String that categories needs to be searched for.
-        :param categoriesKeywords: File the categories needs to be searched in.
+        :param keywordMatcher: KeywordMatcher object of the categoriesKeywords file the categories needs to be searched in or None.
+        :param keywordCategoriesOfNames: Dictionary with the results of the keyword categorisation of the names that were already categorised by keywords.
         :param keywordCategorisedElements: List of pairs that contains elements that were categorised by keywords as (name, category).
         :return: String that contains the category that was found for the nameString, else None.
         """
-        result = None
+        if nameString in keywordCategoriesOfNames:
+            return keywordCategoriesOfNames[nameString]
 
+        result = None
         # If a categoriesKeywords file was received
-        if categoriesKeywords is not None:
-            # For all the categories
-            for category in categoriesKeywords:
-                # For all the keywords belonging to this category
-                for keyword in categoriesKeywords[category]:
-                    # Creating a regex pattern from the keyword
-                    pattern = r"""\w*""" + keyword + r"""\w*"""
-                    # Finding the first occurrence of the pattern in the nameString
-                    if re.search(pattern, nameString) is not None:
-                        # Adding the element to the list of elements that were keyword categorised as a pair of (name, category)
-                        keywordCategorisedElements.append((nameString, category))
-                        result = category
+        if keywordMatcher is not None:
+            result = keywordMatcher.match(nameString)
+            if result is not None:
+                # Adding the element to the list of elements that were keyword categorised as a pair of (name, category)
+                keywordCategorisedElements.append((nameString, result))
+        keywordCategoriesOfNames[nameString] = result
         return result
 
     @staticmethod
@@ -331,3 +354,50 @@ class Categorisation:
 
         # Write the data to the outputPath
         Emma.shared_libs.emma_helper.writeJson(outputPath, categoriesToRemoveFrom)
+
+
+class KeywordMatcher:
+    """
+    Class to find the category of a name based on the keywords of a categoriesKeywords file.
+    A name belongs to a category if any of its keywords can be found in it; if more categories match, then the last one in the file is used.
+    The keywords are compiled once. All the keywords are also compiled into a single alternation pattern that is used to quickly filter out the names
+    that none of the keywords match. For the rest of the names, the keywords are tried from the end of the file, so the first match is the result.
+    """
+    def __init__(self, categoriesKeywords):
+        # The (category, pattern) pairs of the keywords in reversed order of the file
+        self.reversedKeywordPatterns = []
+        for category in categoriesKeywords:
+            for keyword in categoriesKeywords[category]:
+                self.reversedKeywordPatterns.append((category, re.compile(r"""\w*""" + keyword + r"""\w*""")))
+        self.reversedKeywordPatterns.reverse()
+        # The pattern that matches the names that any of the keywords match (None if the keywords can not be combined)
+        self.combinedPattern = KeywordMatcher.__createCombinedPattern([pattern for _, pattern in self.reversedKeywordPatterns])
+
+    @staticmethod
+    def __createCombinedPattern(patterns):
+        """
+        Function to create a single pattern that can be found in a string if any of the patterns can be found in it.
+        :param patterns: List of compiled patterns.
+        :return: The compiled pattern or None if the patterns can not be combined (they contain groups that could be referenced by their numbers or global flags).
+        """
+        result = None
+        if patterns and all(pattern.groups == 0 for pattern in patterns):
+            try:
+                result = re.compile("|".join("(?:" + pattern.pattern + ")" for pattern in patterns))
+            except re.error:
+                result = None
+        return result
+
+    def match(self, nameString):
+        """
+        Function to find the category of a name.
+        :param nameString: The name that needs to be categorised.
+        :return: The category of the last keyword in the file that can be found in the nameString or None if there is no such keyword.
+        """
+        result = None
+        if self.combinedPattern is None or self.combinedPattern.search(nameString) is not None:
+            for category, pattern in self.reversedKeywordPatterns:
+                if pattern.search(nameString) is not None:
+                    result = category
+                    break
+        return result
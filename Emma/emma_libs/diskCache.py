@@ -0,0 +1,161 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import zlib
+import pickle
+import hashlib
+import tempfile
+
+from pypiscout.SCout_Logger import Logger as sc
+
+import Emma
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+
+
+def hashFile(filePath, hashObject=None):
+    """
+    Function to feed the content of a file to a hash object. The file is read in chunks so it never needs to be kept in the memory.
+    :param filePath: Path of the file.
+    :param hashObject: The hashlib object the content will be fed to. If it is None, a new sha256 object will be created.
+    :return: The hash object.
+    """
+    if hashObject is None:
+        hashObject = hashlib.sha256()
+    with open(filePath, "rb") as fp:
+        for chunk in iter(lambda: fp.read(CACHE_HASH_CHUNK_SIZE), b""):
+            hashObject.update(chunk)
+    return hashObject
+
+
+class DiskCache:
+    """
+    A content-addressed cache that stores python objects in a directory.
+    The keys are sha256 digests of everything the cached value depends on (see the createKey()), so an entry never needs to be invalidated:
+    if any of its inputs change, a different key will be looked up.
+    Every entry is stored as a compressed pickle in its own file. The modification time of the files is updated when they are read,
+    so when the size of the directory exceeds the limit, the least recently used entries are removed first.
+    The cache is safe to be used from more processes at the same time, the entries are written atomically.
+    """
+    def __init__(self, cacheDirectory, maxSizeInBytes):
+        # The directory the entries are stored in, it will be created if it does not exist yet
+        self.cacheDirectory = cacheDirectory
+        # The maximal size of the stored entries, if it is exceeded, the least recently used ones will be evicted
+        self.maxSizeInBytes = maxSizeInBytes
+
+    @staticmethod
+    def createKey(*components):
+        """
+        Function to create the key of an entry.
+        Besides the components, the Emma and the Python versions are part of every key, since the format of the cached data depends on them.
+        :param components: Picklable objects the cached value depends on (e.g. the hash of an input file, the patterns used to process it...).
+        :return: The key as a hexadecimal string.
+        """
+        hashObject = hashlib.sha256()
+        hashObject.update(Emma.EMMA_VERSION.encode())
+        hashObject.update(sys.version.encode())
+        for component in components:
+            # The representation is used instead of the pickle of the components because the pickle of equal objects can differ (e.g. the order of the set elements)
+            hashObject.update(repr(component).encode())
+            hashObject.update(b"\0")
+        return hashObject.hexdigest()
+
+    def load(self, key):
+        """
+        Function to load an entry from the cache.
+        :param key: The key of the entry.
+        :return: The value stored with the key or None if the key was not found (or its entry could not be read).
+        """
+        value = None
+        entryPath = self.__getEntryPath(key)
+        try:
+            with open(entryPath, "rb") as fp:
+                value = pickle.loads(zlib.decompress(fp.read()))
+            # Marking the entry as recently used
+            os.utime(entryPath)
+        except FileNotFoundError:
+            pass
+        except (OSError, EOFError, zlib.error, pickle.UnpicklingError, AttributeError, ImportError, TypeError, ValueError) as exception:
+            sc().warning(f"The cache entry `{entryPath}` could not be read ({exception}), it will be recreated.")
+            self.__removeEntry(entryPath)
+        return value
+
+    def store(self, key, value):
+        """
+        Function to store an entry in the cache. If the cache exceeds its size limit after that, the least recently used entries will be removed.
+        :param key: The key of the entry.
+        :param value: The picklable object that will be stored.
+        :return: None
+        """
+        try:
+            os.makedirs(self.cacheDirectory, exist_ok=True)
+            # The entry is written to a temporary file first and moved to its place afterwards, so other processes never see a partially written entry
+            fileDescriptor, temporaryPath = tempfile.mkstemp(dir=self.cacheDirectory, suffix=CACHE_TEMPORARY_FILE_EXTENSION)
+            with os.fdopen(fileDescriptor, "wb") as fp:
+                fp.write(zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+            os.replace(temporaryPath, self.__getEntryPath(key))
+        except OSError as exception:
+            sc().warning(f"The cache entry could not be stored to `{os.path.abspath(self.cacheDirectory)}` ({exception}).")
+            return
+        self.__evict()
+
+    def __getEntryPath(self, key):
+        """
+        Function to get the path of the file of an entry.
+        :param key: The key of the entry.
+        :return: The path of the file.
+        """
+        return os.path.join(self.cacheDirectory, key + CACHE_FILE_EXTENSION)
+
+    @staticmethod
+    def __removeEntry(entryPath):
+        """
+        Function to remove the file of an entry. The file might have already been removed by another process, this is not an error.
+        :param entryPath: The path of the file.
+        :return: None
+        """
+        try:
+            os.remove(entryPath)
+        except OSError:
+            pass
+
+    def __evict(self):
+        """
+        Function to remove the least recently used entries until the size of the cache is within its limit.
+        :return: None
+        """
+        entries = []
+        totalSize = 0
+        with os.scandir(self.cacheDirectory) as directoryEntries:
+            for directoryEntry in directoryEntries:
+                if directoryEntry.name.endswith(CACHE_FILE_EXTENSION):
+                    try:
+                        status = directoryEntry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((status.st_mtime, status.st_size, directoryEntry.path))
+                    totalSize += status.st_size
+        if totalSize > self.maxSizeInBytes:
+            # Removing the entries starting with the least recently used one
+            for _, size, entryPath in sorted(entries):
+                if totalSize <= self.maxSizeInBytes:
+                    break
+                self.__removeEntry(entryPath)
+                totalSize -= size
@@ -20,6 +20,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 import os
 import sys
 import re
+import collections
 
 from pypiscout.SCout_Logger import Logger as sc
 
@@ -29,6 +30,10 @@ import Emma.emma_libs.specificConfiguration
 import Emma.emma_libs.ghsMapfileRegexes
 
 
+# An entry of the monolith table: the addresses, the offset (= physical - virtual) and the size are int's, the section is a str
+MonolithEntry = collections.namedtuple("MonolithEntry", ["virtual", "physical", "offset", "size", "section"])
+
+
 class GhsConfiguration(Emma.emma_libs.specificConfiguration.SpecificConfiguration):
     """
     Class to handle a GHS compiler specific configuration.
@@ -167,18 +172,19 @@ class GhsConfiguration(Emma.emma_libs.specificConfiguration.SpecificConfiguratio
     def __addTabularisedMonoliths(self, configuration):
         """
         Manages Monolith selection, parsing and converting to a list.
+        Every monolith file is parsed only once: the table of the selected one is stored for the address translation,
+        the section names of all of them are stored for the checking of the configuration.
         :param configuration: Configuration to which the monoliths need to be added.
         :return: None
         """
 
-        def loadMonolithFile(configuration, noprompt):
+        def selectMonolithFile(configuration, noprompt):
             """
-            Function to Load monolith file.
+            Function to select the monolith file that will be used for the address translation.
             :param configuration: Configuration to which the monoliths need to be added.
             :param noprompt: True if no user prompts shall be made, False otherwise, in which case a program exit will be made.
-            :return: Content of the monolith file if it could be read, else None.
+            :return: Path of the selected monolith file.
             """
-            result = None
             mapfileIndexChosen = 0  # Take the first monolith file in list (default case)
             numMonolithFiles = len(configuration["patterns"]["monoliths"])
             keyMonolithMapping = {}
@@ -205,42 +211,38 @@ class GhsConfiguration(Emma.emma_libs.specificConfiguration.SpecificConfiguratio
             elif numMonolithFiles < 1:
                 sc().error("No monolith file found but needed for processing")
 
-            # Finally load the file
             configuration["monolithLoaded"] = True
-            monolithFilepath = keyMonolithMapping[str(mapfileIndexChosen)]
-            try:
-                with open(monolithFilepath, "r") as fp:
-                    result = fp.readlines()
-            except FileNotFoundError:
-                sc().error(f"The monolith file `{os.path.abspath(monolithFilepath)}` was not found!")
-
-            return result
+            return keyMonolithMapping[str(mapfileIndexChosen)]
 
-        def tabulariseAndSortMonolithContent(monolithContent):
+        def tabulariseMonolithContent(monolithContent):
             """
-            Parses the monolith file and returns a "table" (addresses are int's) of the following structure:
-            table[n-th_entry][0] = virtual(int), ...[1] = physical(int), ...[2] = offset(int), ...[3] = size(int), ...[4] = section(str)
+            Parses the monolith file and returns a table of MonolithEntry objects (addresses are int's) in the order of the monolith file.
+            The order is kept because if the virtual sections of a VAS overlap, the first one that contains an element is used for its address translation.
             Offset = physical - virtual
-            :param monolithContent: Content from monolith as text (all lines)
-            :return: list of lists
+            :param monolithContent: Content from monolith as text (iterable of lines)
+            :return: list of MonolithEntry
             """
-            table = []  # "headers": virtual, physical, size, section
+            table = []
             monolithPattern = Emma.emma_libs.ghsMapfileRegexes.UpperMonolithPattern()
             for line in monolithContent:
-                match = re.search(Emma.emma_libs.ghsMapfileRegexes.UpperMonolithPattern().pattern, line)
+                match = monolithPattern.pattern.search(line)
                 if match:
-                    table.append([
-                        int(match.group(monolithPattern.Groups.virtualAdress), 16),
-                        int(match.group(monolithPattern.Groups.physicalAdress), 16),
-                        (int(match.group(monolithPattern.Groups.physicalAdress), 16) - int(match.group(monolithPattern.Groups.virtualAdress), 16)),
-                        int(match.group(monolithPattern.Groups.size), 16),
-                        match.group(monolithPattern.Groups.section)
-                    ])
+                    virtual = int(match.group(monolithPattern.Groups.virtualAdress), 16)
+                    physical = int(match.group(monolithPattern.Groups.physicalAdress), 16)
+                    table.append(MonolithEntry(virtual, physical, physical - virtual, int(match.group(monolithPattern.Groups.size), 16), match.group(monolithPattern.Groups.section)))
             return table
 
-        # Load and register Monoliths
-        monolithContent = loadMonolithFile(configuration, self.noPrompt)
-        configuration["sortMonolithTabularised"] = tabulariseAndSortMonolithContent(monolithContent)
+        # Select, load and register Monoliths
+        selectedMonolithFilepath = selectMonolithFile(configuration, self.noPrompt)
+        monolithSectionNames = set()
+        for monolith in configuration["patterns"]["monoliths"]:
+            monolithFilepath = configuration["patterns"]["monoliths"][monolith]["associatedFilename"]
+            # The content of the file will be read lazily line-by-line
+            monolithTable = tabulariseMonolithContent(Emma.shared_libs.emma_helper.readLinesLazily(monolithFilepath))
+            monolithSectionNames.update(entry.section for entry in monolithTable)
+            if monolithFilepath == selectedMonolithFilepath:
+                configuration["sortMonolithTabularised"] = monolithTable
+        configuration["monolithSectionNames"] = frozenset(monolithSectionNames)
 
     @staticmethod
     def __checkNumberOfFoundMapfiles(configId, configuration):
@@ -271,31 +273,15 @@ class GhsConfiguration(Emma.emma_libs.specificConfiguration.SpecificConfiguratio
         """
         result = False
         foundInConfigID = []
-        foundInMonolith = []
-
-        # Extract sections from monolith file
-        monolithPattern = Emma.emma_libs.ghsMapfileRegexes.UpperMonolithPattern()
 
         # Check if a monolith was loaded to this configID that can be checked
         # In case there was no monolith loaded, the configuration does not need it so the check is passed
         if configuration["monolithLoaded"]:
-            for entry in configuration["patterns"]["monoliths"]:
-                try:
-                    monolithFilepath = configuration["patterns"]["monoliths"][entry]["associatedFilename"]
-                    with open(monolithFilepath, "r") as monolithFile:
-                        monolithContent = monolithFile.readlines()
-                except FileNotFoundError:
-                    sc().error(f"The file `{os.path.abspath(monolithFilepath)}` was not found!")
-                for line in monolithContent:
-                    lineComponents = re.search(monolithPattern.pattern, line)
-                    if lineComponents:  # if match
-                        foundInMonolith.append(lineComponents.group(monolithPattern.Groups.section))
-
             for vas in configuration["virtualSections"]:
                 foundInConfigID += configuration["virtualSections"][vas]
 
-            # Compare sections from configID with found in monolith file
-            sectionsNotInConfigID = set(foundInMonolith) - set(foundInConfigID)
+            # Compare sections from configID with the ones that were found in the monolith files while they were loaded
+            sectionsNotInConfigID = configuration["monolithSectionNames"] - set(foundInConfigID)
             if sectionsNotInConfigID:
                 sc().warning("Monolith File has the following sections. You might want to add it them the respective VAS in " + configuration["virtualSectionsPath"] + "!")
                 for section in sectionsNotInConfigID:
@@ -19,8 +19,11 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 
 import os
 import re
+import mmap
 import bisect
-import collections
+import operator
+import itertools
+import concurrent.futures
 
 from pypiscout.SCout_Logger import Logger as sc
 
@@ -29,14 +32,149 @@ import Emma.shared_libs.emma_helper
 import Emma.emma_libs.mapfileProcessor
 import Emma.emma_libs.ghsMapfileRegexes
 import Emma.emma_libs.memoryEntry
+import Emma.emma_libs.diskCache
+
+
+# The compiler specific data of the MemEntry objects created by the GhsMapfileProcessor; the equal data are shared between the MemEntry objects
+COMPILER_SPECIFIC_DATA_SCHEMA = Emma.emma_libs.memoryEntry.CompilerSpecificDataSchema(("DMA", "vasName", "vasSectionName"))
+
+# The title lines of the mapfile blocks (see the line classifier of the GhsMapfileProcessor.importMapfile())
+BLOCK_TITLE_LINE_PATTERN = re.compile(rb"^[A-Z]", re.M)
+
+
+class LineCounter:
+    """
+    Determines the line numbers of positions in a memory-mapped mapfile.
+    The last position and its line number are kept, so only the part of the buffer between the previous and the new position needs to be counted.
+    The matches of finditer() arrive in ascending order, so every part of the mapfile is counted about once and the buffer is never copied from its beginning.
+    """
+    __slots__ = ("buffer", "position", "lineNumber")
+
+    def __init__(self, buffer):
+        # The buffer of the mapfile (mmap objects have no count(), the parts between the positions are sliced)
+        self.buffer = buffer
+        # The last position and the number of its line, counted from 1
+        self.position = 0
+        self.lineNumber = 1
+
+    def getLineNumber(self, position):
+        """
+        Function to determine the number of the line a position is in.
+        :param position: The offset in the buffer.
+        :return: The line number, counted from 1.
+        """
+        if position >= self.position:
+            self.lineNumber += self.buffer[self.position:position].count(b"\n")
+        else:
+            self.lineNumber -= self.buffer[position:self.position].count(b"\n")
+        self.position = position
+        return self.lineNumber
+
+
+class BytesLineComponents:
+    """
+    Wrapper around a match of a bytes pattern in a memory-mapped mapfile.
+    It provides the part of the str match interface that is used for the MemEntry creation, the groups are only decoded when they are accessed.
+    """
+    __slots__ = ("match", "lineCounter")
+
+    def __init__(self, match, lineCounter):
+        self.match = match
+        # The LineCounter of the buffer the match was found in
+        self.lineCounter = lineCounter
+
+    def group(self, name):
+        """
+        Function to get a group of the match as a str.
+        :param name: The name of the group.
+        :return: The decoded content of the group.
+        """
+        return self.match.group(name).decode()
+
+    def lineNumber(self):
+        """
+        Function to determine the number of the line the match was found in.
+        :return: The line number, counted from 1.
+        """
+        return self.lineCounter.getLineNumber(self.match.start())
+
+
+class VirtualSectionIndex:
+    """
+    Index of the virtual sections of a VAS for the translation of virtual addresses to physical ones.
+    The patterns config file can assign a VAS to a mapfile. Every VAS has VAS sections that are defined in the
+    virtualSections file. The monolith file contains all the virtual sections of all the VAS-es with data
+    based on which the address translation can be done.
+
+    The virtual sections of the VAS are collected from the monolith table once and sorted by their start addresses.
+    If they do not overlap, the only section that can contain an element is found with a binary search.
+    Otherwise the sections are searched in the order of the monolith table, as the first section containing the element has to be used.
+    """
+    def __init__(self, virtualSectionsOfTheVas, monolithFileContent):
+        # This are indexes used for accessing the elements of one monolith file entry
+        monolithIndexVirtual = 0
+        monolithIndexOffset = 2
+        monolithIndexSize = 3
+        monolithIndexSectionName = 4
+
+        # The virtual sections of the VAS in the order of the monolith table: (virtualStartAddress, virtualEndAddress, addressTranslationOffset, virtualSectionName)
+        # For the end addresses we need to be careful in case we have zero lengths
+        virtualSectionNames = set(virtualSectionsOfTheVas)
+        virtualSections = [(entry[monolithIndexVirtual],
+                            (entry[monolithIndexVirtual] + (entry[monolithIndexSize] - 1)) if entry[monolithIndexSize] > 0 else entry[monolithIndexVirtual],
+                            entry[monolithIndexOffset],
+                            entry[monolithIndexSectionName]) for entry in monolithFileContent if entry[monolithIndexSectionName] in virtualSectionNames]
+        sortedVirtualSections = sorted(virtualSections, key=operator.itemgetter(0))
+        # The binary search can only be used if the sections do not overlap
+        if all(previous[1] < following[0] for previous, following in zip(sortedVirtualSections, sortedVirtualSections[1:])):
+            self.virtualSections = sortedVirtualSections
+            self.startAddresses = [virtualSection[0] for virtualSection in sortedVirtualSections]
+        else:
+            self.virtualSections = virtualSections
+            self.startAddresses = None
+        # The section the last translation was done with; the consecutive elements of a mapfile usually belong to the same section
+        self.lastHit = None
+
+    def translateAddress(self, elementVirtualStartAddress, elementSize):
+        """
+        Calculates the physical address for an element (= section or object).
+        :param elementVirtualStartAddress: The start address of the element in the VAS
+        :param elementSize: The size of the element in bytes
+        :return: Physical start address of the element and the name of the virtual section the translation was done with or (None, None) if no virtual section contains the element.
+        """
+        elementVirtualEndAddress = elementVirtualStartAddress + (elementSize - 1) if elementSize > 0 else elementVirtualStartAddress
+
+        if self.startAddresses is not None:
+            # The sections do not overlap, so the only candidate is the last one that starts before or at the element
+            if self.lastHit is not None and self.lastHit[0] <= elementVirtualStartAddress <= elementVirtualEndAddress <= self.lastHit[1]:
+                candidates = (self.lastHit,)
+            else:
+                index = bisect.bisect_right(self.startAddresses, elementVirtualStartAddress)
+                candidates = self.virtualSections[(index - 1):index] if index > 0 else ()
+        else:
+            candidates = self.virtualSections
+
+        for virtualSection in candidates:
+            virtualSectionStartAddress, virtualSectionEndAddress, addressTranslationOffset, virtualSectionName = virtualSection
+            # If the element is contained by this virtual section then we will use this one for the translation
+            if virtualSectionStartAddress <= elementVirtualStartAddress <= elementVirtualEndAddress <= virtualSectionEndAddress:
+                self.lastHit = virtualSection
+                return elementVirtualStartAddress + addressTranslationOffset, virtualSectionName
+        return None, None
 
 
 class GhsMapfileProcessor(Emma.emma_libs.mapfileProcessor.MapfileProcessor):
     """
     A class to handle mapfile processing for GHS specific mapfiles.
     """
-    def __init__(self):
+    def __init__(self, jobs=1, parserEngine=PARSER_ENGINE_LINES, parseCache=None):
         self.analyseDebug = None
+        # The maximal number of worker processes the mapfiles of a configId can be processed with in parallel
+        self.jobs = jobs
+        # The engine the mapfiles will be parsed with (one of the PARSER_ENGINES)
+        self.parserEngine = parserEngine
+        # The DiskCache the extracted elements of the mapfiles are stored in, so unchanged mapfiles need not to be parsed again; None if no cache shall be used
+        self.parseCache = parseCache
 
     def processMapfiles(self, configId, configuration, analyseDebug):
         """
@@ -48,124 +186,337 @@ class GhsMapfileProcessor(Emma.emma_libs.mapfileProcessor.MapfileProcessor):
         """
         self.analyseDebug = analyseDebug
 
-        sectionCollection = self.__importData(configId, configuration, Emma.emma_libs.ghsMapfileRegexes.ImageSummaryPattern())
-        objectCollection = self.__importData(configId, configuration, Emma.emma_libs.ghsMapfileRegexes.ModuleSummaryPattern())
+        sectionCollection, objectCollection = self.__importData(configId, configuration)
 
         return sectionCollection, objectCollection
 
-    def __importData(self, configId, configuration, defaultRegexPattern):
-        # pylint: disable=too-many-locals
-        # Rationale: This is legacy code, it will not be changed.
-
+    def __importData(self, configId, configuration):
         """
-        Function to import data from the mapfiles.
+        Function to import the sections and the objects from the mapfiles.
+        The mapfiles are processed independently from each other (in worker processes if more than one job is allowed),
+        then their results are merged in the order of the mapfiles, so the result does not depend on the number of jobs.
         :param configId: A configId to which the configuration belongs to.
         :param configuration: A configuration that contains the information about the mapfiles.
-        :param defaultRegexPattern: The default regex pattern that shall be used for the data extraction.
-        :return: A list of MemEntry objects made from the data created.
+        :return: A tuple of two lists of MemEntry objects made from the data created: (sectionCollection, objectCollection).
         """
-        result = []
+        sectionCollection = []
+        objectCollection = []
         memoryRegionsToExcludeFromMapfiles = {}
 
-        # Reading the hexadecimal offset value from the addresSpaces*.json. This value is optional, in case it is not defined, we will assume that it is 0.
-        offset = int(configuration["addressSpaces"]["offset"], 16) if "offset" in configuration["addressSpaces"].keys() else 0
-        # Defining a list of sections that will be excluded (including the objects residing in it) from the analysis based on the value that was loaded from the arguments
-        listOfExcludedSections = [".unused_ram"] if self.analyseDebug else SECTIONS_TO_EXCLUDE
-
-        # Importing every mapfile that was found
-        for mapfile in configuration["patterns"]["mapfiles"]:
-            # Opening the mapfile and reading in its content
-            mapfilePath = configuration["patterns"]["mapfiles"][mapfile]["associatedFilename"]
-            try:
-                with open(mapfilePath, "r") as mapfileFileObject:
-                    mapfileContent = mapfileFileObject.readlines()
-            except FileNotFoundError:
-                sc().error(f"The map file `{os.path.abspath(mapfilePath)}` was not found!")
-
-            # Storing the name of the mapfile
-            mapfileName = os.path.split(configuration["patterns"]["mapfiles"][mapfile]["associatedFilename"])[-1]
+        mapfiles = list(configuration["patterns"]["mapfiles"])
+
+        # Building the address translation indexes of the VAS-es that are used by the mapfiles, these are shared by all the mapfiles of the configId
+        virtualSectionIndexes = {}
+        for mapfile in mapfiles:
+            if "VAS" in configuration["patterns"]["mapfiles"][mapfile]:
+                vasName = configuration["patterns"]["mapfiles"][mapfile]["VAS"]
+                if vasName not in virtualSectionIndexes and vasName in configuration["virtualSections"]:
+                    virtualSectionIndexes[vasName] = VirtualSectionIndex(configuration["virtualSections"][vasName], configuration["sortMonolithTabularised"])
+
+        numberOfWorkers = min(self.jobs, len(mapfiles))
+        if numberOfWorkers > 1:
+            sc().info(f"Processing the {len(mapfiles)} mapfiles of \"{configId}\" with {numberOfWorkers} jobs...")
+            with concurrent.futures.ProcessPoolExecutor(max_workers=numberOfWorkers) as executor:
+                # The map() returns the results in the order of the mapfiles, regardless of the order in which the jobs finish
+                mapfileResults = list(executor.map(GhsMapfileProcessor.importMapfile, itertools.repeat(configId), itertools.repeat(configuration), mapfiles,
+                                                   itertools.repeat(virtualSectionIndexes), itertools.repeat(self.analyseDebug), itertools.repeat(self.parserEngine),
+                                                   itertools.repeat(self.parseCache)))
+        else:
+            mapfileResults = [GhsMapfileProcessor.importMapfile(configId, configuration, mapfile, virtualSectionIndexes, self.analyseDebug, self.parserEngine, self.parseCache) for mapfile in mapfiles]
 
+        # Merging the results of the mapfiles
+        for mapfile, (mapfileName, sectionEntries, objectEntries) in zip(mapfiles, mapfileResults):
+            sectionCollection.extend(sectionEntries)
+            objectCollection.extend(objectEntries)
             # Storing the list of ignored memory areas to this mapfile
             # This will be a necessary parameter for the MapfileProcessor::fillOutMemoryRegionsAndMemoryTypes()
             if "memRegionExcludes" in configuration["patterns"]["mapfiles"][mapfile]:
                 memoryRegionsToExcludeFromMapfiles[mapfileName] = configuration["patterns"]["mapfiles"][mapfile]["memRegionExcludes"]
 
-            # If there is a VAS defined for the mapfile, then the addresses found in it are virtual addresses, otherwise they are physical addresses
-            mapfileContainsVirtualAddresses = ("VAS" in configuration["patterns"]["mapfiles"][mapfile])
-            # Loading the regex pattern that will be used for this mapfile
-            regexPatternData = self.__getRegexPattern(defaultRegexPattern, configuration["patterns"]["mapfiles"][mapfile])
+        # Ordering the collected elements by their start addresses (the order of the mapfiles and their lines is kept for the equal ones)
+        Emma.emma_libs.memoryEntry.sortMemEntries(sectionCollection)
+        Emma.emma_libs.memoryEntry.sortMemEntries(objectCollection)
 
-            # Analysing the mapfile with the loaded regex line-by-line
+        # Filling out the memory regions and memory types and ignoring the entries that did not have a match
+        super().fillOutMemoryRegionsAndMemoryTypes(sectionCollection, configuration, True, memoryRegionsToExcludeFromMapfiles)
+        super().fillOutMemoryRegionsAndMemoryTypes(objectCollection, configuration, True, memoryRegionsToExcludeFromMapfiles)
+
+        return sectionCollection, objectCollection
+
+    @staticmethod
+    def importMapfile(configId, configuration, mapfile, virtualSectionIndexes, analyseDebug, parserEngine=PARSER_ENGINE_LINES, parseCache=None):
+        # pylint: disable=too-many-arguments, too-many-locals, too-many-statements
+        # Rationale: This is legacy code, it will not be changed.
+
+        """
+        Function to import the sections and the objects from a single mapfile.
+        Every mapfile is read only once: each of its lines is offered both to the section and to the object extractor.
+        This is a static method so that it can be run in a worker process as well.
+        :param configId: A configId to which the configuration belongs to.
+        :param configuration: A configuration that contains the information about the mapfiles.
+        :param mapfile: The key of the mapfile in the patterns configuration.
+        :param virtualSectionIndexes: Dictionary with the VAS names as keys and their VirtualSectionIndex objects as values.
+        :param analyseDebug: True if the debug sections and objects need to be analysed as well, False otherwise.
+        :param parserEngine: The engine the mapfile will be parsed with (one of the PARSER_ENGINES).
+                             The mmap engine can only be used with the default patterns, for unique patterns the lines engine will be used.
+        :param parseCache: The DiskCache the extracted elements are looked up in and stored to or None if the mapfile shall be parsed in any case.
+        :return: A tuple: (mapfileName, sectionEntries, objectEntries), where the entries are lists of MemEntry objects in the order of the mapfile lines.
+        """
+        sectionEntries = []
+        objectEntries = []
+        mapfileEntry = configuration["patterns"]["mapfiles"][mapfile]
+
+        # Reading the hexadecimal offset value from the addresSpaces*.json. This value is optional, in case it is not defined, we will assume that it is 0.
+        offset = int(configuration["addressSpaces"]["offset"], 16) if "offset" in configuration["addressSpaces"].keys() else 0
+        # Defining a list of sections that will be excluded (including the objects residing in it) from the analysis based on the value that was loaded from the arguments
+        listOfExcludedSections = [".unused_ram"] if analyseDebug else SECTIONS_TO_EXCLUDE
+
+        mapfilePath = mapfileEntry["associatedFilename"]
+
+        # Storing the name of the mapfile
+        mapfileName = os.path.split(mapfileEntry["associatedFilename"])[-1]
+
+        # If there is a VAS defined for the mapfile, then the addresses found in it are virtual addresses, otherwise they are physical addresses
+        vasName = None
+        virtualSectionIndex = None
+        if "VAS" in mapfileEntry:
+            # Name of the Virtual address space to which the elements of this mapfile belongs
+            vasName = mapfileEntry["VAS"]
+            # The index of the virtual sections that were belong to this mapfile. The address translation is done with the help of these sections.
+            if not vasName in configuration["virtualSections"]:
+                sc().error(f"VAS name `{vasName}` stated in patterns configuration but not found in virtualSections.")
+            virtualSectionIndex = virtualSectionIndexes[vasName]
+
+        # Loading the regex patterns that will be used for this mapfile
+        sectionPatternData = GhsMapfileProcessor.__getRegexPattern(Emma.emma_libs.ghsMapfileRegexes.ImageSummaryPattern(), mapfileEntry)
+        objectPatternData = GhsMapfileProcessor.__getRegexPattern(Emma.emma_libs.ghsMapfileRegexes.ModuleSummaryPattern(), mapfileEntry)
+
+        # If the mapfile was already processed with the same inputs, the elements are restored from the cache instead of parsing it again
+        cacheKey = None
+        if parseCache is not None:
+            cacheKey = GhsMapfileProcessor.__createParseCacheKey(configId, mapfileEntry, (sectionPatternData, objectPatternData), virtualSectionIndex, offset, analyseDebug)
+            cachedElements = parseCache.load(cacheKey) if cacheKey is not None else None
+            if cachedElements is not None:
+                return GhsMapfileProcessor.__restoreCachedElements(configId, mapfileName, vasName, cachedElements)
+
+        # The warnings are collected so they can be stored in the cache and shown again when the elements are restored from it
+        warnings = []
+
+        def warning(message):
+            """
+            Function to show a warning about the mapfile and record it.
+            :param message: The message of the warning.
+            :return: None
+            """
+            warnings.append(message)
+            sc().warning(message)
+
+        def createMemEntry(lineComponents, regexPatternData, lineNumber=None):
+            """
+            Function to create a MemEntry object from the components of a mapfile line.
+            :param lineComponents: The match object that was created by the regex pattern from the line or a BytesLineComponents object.
+            :param regexPatternData: The regex pattern that was used to create the lineComponents.
+            :param lineNumber: The number of the line in the mapfile. If it is None, it will be determined by the lineComponents when it is needed.
+            :return: The created MemEntry object or None if the line needs to be skipped.
+            """
+            # If the section name of this element is in the list that we want to exclude then we can continue with the next line
+            if lineComponents.group(regexPatternData.Groups.section).rstrip() in listOfExcludedSections:
+                return None
+            # If this mapfile contains virtual addresses then we need to translate the address of this element
+            vasSectionName = None
+            if vasName is not None:
+                # Calculating the physical address and getting the name of the virtual section based on which the translation was done
+                physicalAddress, vasSectionName = virtualSectionIndex.translateAddress(int(lineComponents.group(regexPatternData.Groups.origin), 16),
+                                                                                       int(lineComponents.group(regexPatternData.Groups.size), 16))
+                # Check whether the address translation failed
+                if physicalAddress is None:
+                    if lineNumber is None:
+                        lineNumber = lineComponents.lineNumber()
+                    warningSectionName = lineComponents.group(regexPatternData.Groups.section).rstrip()
+                    warningObjectName = ("::" + lineComponents.group(regexPatternData.Groups.module).rstrip()) if hasattr(regexPatternData.Groups, "module") else ""
+                    warning("Address translation failed for the element: " + f"{configId}::{mapfileName}:{lineNumber}::{warningSectionName}" + ("::"  + warningObjectName if warningObjectName != "" else "")
+                                 + " (size: " + str(int(lineComponents.group(regexPatternData.Groups.size), 16)) + " B)! Section not found in VAS or outside address range.")
+                    # We will not store this element and continue with the next one
+                    return None
+            # In case the mapfile contains phyisical addresses, no translation is needed, we are just reading the address that is in the mapfile
+            else:
+                physicalAddress = int(lineComponents.group(regexPatternData.Groups.origin), 16) - offset
+
+            # Determining the addressLength
+            addressLength = int(lineComponents.group(regexPatternData.Groups.size), 16)
+            # Check whether the address is valid
+            if addressLength < 0:
+                warning("Negative addressLength found.")
+
+            # Creating a MemEntry object from the data that we got from the mapfile
+            # The compiler specific data (DMA, vasName, vasSectionName) is shared with the other elements of the same virtual section
+            return Emma.emma_libs.memoryEntry.MemEntry(configID=configId,
+                                                       mapfileName=mapfileName,
+                                                       addressStart=physicalAddress,
+                                                       addressLength=addressLength,
+                                                       sectionName=lineComponents.group(regexPatternData.Groups.section).rstrip(),
+                                                       objectName=regexPatternData.getModuleName(lineComponents),
+                                                       compilerSpecificData=COMPILER_SPECIFIC_DATA_SCHEMA.create(vasName is None, vasName, vasSectionName))
+
+        # The extractors: the patterns bound to a mapfile block are only active inside of their block, the others on every line
+        extractors = ((sectionPatternData, sectionEntries), (objectPatternData, objectEntries))
+
+        # The mmap engine needs the bytes version of the patterns, these only exist for the default patterns
+        if parserEngine == PARSER_ENGINE_MMAP and all(regexPatternData.bytesPattern is not None for regexPatternData, _ in extractors):
+            foundBlockTitles = GhsMapfileProcessor.__scanMemoryMappedMapfile(mapfilePath, extractors, createMemEntry)
+        else:
+            # Opening the mapfile, its content will be read lazily line-by-line so the whole file never needs to be kept in the memory
+            mapfileContent = Emma.shared_libs.emma_helper.readLinesLazily(mapfilePath)
+            activeExtractors = [extractor for extractor in extractors if extractor[0].blockTitle is None]
+            foundBlockTitles = set()
+
+            # Analysing the mapfile with the loaded regexes line-by-line
             lineNumber = 0
             for line in mapfileContent:
                 lineNumber += 1
 
-                # Extracting the components from the line with the regex, if there was no match, we will continue with the next line
-                lineComponents = re.search(regexPatternData.pattern, line)
-                if lineComponents:
-                    # If the section name of this element is in the list that we want to exclude then we can continue with the next line
-                    if lineComponents.group(regexPatternData.Groups.section).rstrip() in listOfExcludedSections:
-                        continue
-                    # If this mapfile contains virtual addresses then we need to translate the address of this element
-                    vasName = None
-                    vasSectionName = None
-                    if mapfileContainsVirtualAddresses:
-                        # Name of the Virtual address space to which the elements of this mapfile belongs
-                        vasName = configuration["patterns"]["mapfiles"][mapfile]["VAS"]
-                        # List of the virtual sections that were belong to this mapfile. The address translation is done with the help of these sections.
-                        if not vasName in configuration["virtualSections"]:
-                            sc().error(f"VAS name `{vasName}` stated in patterns configuration but not found in virtualSections.")
-                        virtualSectionsOfThisMapfile = configuration["virtualSections"][vasName]
-                        # The part of the monolith file that contains the address translation data
-                        monolithFileContent = configuration["sortMonolithTabularised"]
-                        # Calculating the physical address and getting the name of the virtual section based on which the translation was done
-                        physicalAddress, vasSectionName = self.__translateAddress(lineComponents.group(regexPatternData.Groups.origin),
-                                                                                  lineComponents.group(regexPatternData.Groups.size),
-                                                                                  virtualSectionsOfThisMapfile,
-                                                                                  monolithFileContent)
-                        # Check whether the address translation failed
-                        if physicalAddress is None:
-                            warningSectionName = lineComponents.group(regexPatternData.Groups.section).rstrip()
-                            warningObjectName = ("::" + lineComponents.group(regexPatternData.Groups.module).rstrip()) if hasattr(regexPatternData.Groups, "module") else ""
-                            sc().warning("Address translation failed for the element: " + f"{configId}::{mapfileName}:{lineNumber}::{warningSectionName}" + ("::"  + warningObjectName if warningObjectName != "" else "")
-                                         + " (size: " + str(int(lineComponents.group(regexPatternData.Groups.size), 16)) + " B)! Section not found in VAS or outside address range.")
-                            # We will not store this element and continue with the next one
-                            continue
-                    # In case the mapfile contains phyisical addresses, no translation is needed, we are just reading the address that is in the mapfile
-                    else:
-                        physicalAddress = int(lineComponents.group(regexPatternData.Groups.origin), 16) - offset
-
-                    # Determining the addressLength
-                    addressLength = int(lineComponents.group(regexPatternData.Groups.size), 16)
-                    # Check whether the address is valid
-                    if addressLength < 0:
-                        sc().warning("Negative addressLength found.")
-
-                    # Creating the compiler specific data that we will store in the memEntry
-                    # This will be a collections.OrderedDict as the MemEntry requires it
-                    compilerSpecificData = collections.OrderedDict()
-                    compilerSpecificData["DMA"] = (vasName is None)
-                    compilerSpecificData["vasName"] = vasName
-                    compilerSpecificData["vasSectionName"] = vasSectionName
-
-                    # Creating a MemEntry object from the data that we got from the mapfile
-                    memEntry = Emma.emma_libs.memoryEntry.MemEntry(configID=configId,
-                                                              mapfileName=mapfileName,
-                                                              addressStart=physicalAddress,
-                                                              addressLength=addressLength,
-                                                              sectionName=lineComponents.group(regexPatternData.Groups.section).rstrip(),
-                                                              objectName=regexPatternData.getModuleName(lineComponents),
-                                                              compilerSpecificData=compilerSpecificData)
-
-                    # Finding the index, where we need to insert the memEntry
-                    index = bisect.bisect_right(result, memEntry)
-                    # Inserts at index, elements to right will be pushed "one index up"
-                    result.insert(index, memEntry)
+                # Cheap line classifier: the block titles of the GHS mapfiles (e.g. `Image Summary`, `Global Symbols`, ...) start in the first column with a capital letter,
+                # while the lines of the summaries start either with a whitespace or with a lower case hexadecimal digit. Every title ends the previous block.
+                if line[:1].isupper():
+                    activeExtractors = [extractor for extractor in extractors if extractor[0].blockTitle is None or line.startswith(extractor[0].blockTitle)]
+                    foundBlockTitles.update(extractor[0].blockTitle for extractor in activeExtractors)
+
+                # Every line is offered to the extractors that are active in the current block
+                for regexPatternData, result in activeExtractors:
+                    # Extracting the components from the line with the tokenizer if the line is in the default layout, otherwise with the regex
+                    # If there was no match, we will continue with the next extractor
+                    lineComponents = regexPatternData.lineTokenizer(line) if regexPatternData.lineTokenizer is not None else None
+                    if lineComponents is None:
+                        lineComponents = re.search(regexPatternData.pattern, line)
+                    if lineComponents:
+                        memEntry = createMemEntry(lineComponents, regexPatternData, lineNumber)
+                        if memEntry is not None:
+                            result.append(memEntry)
+
+        # Notifying the user if the mapfile did not contain the block of a pattern, since then no elements could be extracted with it
+        for regexPatternData, _ in extractors:
+            if regexPatternData.blockTitle is not None and regexPatternData.blockTitle not in foundBlockTitles:
+                warning(f"The mapfile `{mapfileName}` does not contain a `{regexPatternData.blockTitle}` block, no elements were extracted with the default {type(regexPatternData).__name__}!")
+
+        if cacheKey is not None:
+            parseCache.store(cacheKey, GhsMapfileProcessor.__createCachedElements(sectionEntries, objectEntries, warnings))
+
+        return mapfileName, sectionEntries, objectEntries
 
-        # Filling out the memory regions and memory types and ignoring the entries that did not have a match
-        super().fillOutMemoryRegionsAndMemoryTypes(result, configuration, True, memoryRegionsToExcludeFromMapfiles)
+    @staticmethod
+    def __createParseCacheKey(configId, mapfileEntry, patterns, virtualSectionIndex, offset, analyseDebug):
+        # pylint: disable=too-many-arguments
+        # Rationale: The key has to contain every input the extracted elements depend on.
+
+        """
+        Function to create the key the extracted elements of a mapfile are cached with.
+        The key depends on the content of the mapfile, the effective regex patterns, the virtual sections used for the address translation (these come from the monolith file),
+        the address offset, whether the debug sections are analysed and the mapfile configuration. The path of the mapfile is not part of it, so moved mapfiles are found as well.
+        :param configId: A configId to which the mapfile belongs to.
+        :param mapfileEntry: The mapfile entry of the configuration.
+        :param patterns: The regex pattern objects the mapfile will be processed with.
+        :param virtualSectionIndex: The VirtualSectionIndex of the VAS of the mapfile or None if the mapfile contains physical addresses.
+        :param offset: The address offset from the addressSpaces configuration.
+        :param analyseDebug: True if the debug sections and objects need to be analysed as well, False otherwise.
+        :return: The key or None if the mapfile could not be read (in this case the error will be reported by the parsing).
+        """
+        try:
+            mapfileHash = Emma.emma_libs.diskCache.hashFile(mapfileEntry["associatedFilename"]).hexdigest()
+        except OSError:
+            return None
+        mapfileConfiguration = {key: value for key, value in mapfileEntry.items() if key != "associatedFilename"}
+        # The compiled patterns are represented by their source and their flags (the representation of a compiled pattern is truncated)
+        effectivePatterns = [(type(regexPatternData).__name__, getattr(regexPatternData.pattern, "pattern", regexPatternData.pattern), getattr(regexPatternData.pattern, "flags", None),
+                              regexPatternData.blockTitle) for regexPatternData in patterns]
+        virtualSections = virtualSectionIndex.virtualSections if virtualSectionIndex is not None else None
+        return Emma.emma_libs.diskCache.DiskCache.createKey(configId, os.path.split(mapfileEntry["associatedFilename"])[-1], mapfileHash, mapfileConfiguration,
+                                                            effectivePatterns, virtualSections, offset, analyseDebug)
+
+    @staticmethod
+    def __createCachedElements(sectionEntries, objectEntries, warnings):
+        """
+        Function to convert the extracted elements of a mapfile into the compact form they are cached in.
+        Only the values that come from the mapfile are stored, the ones that are the same for every element of the mapfile are part of the cache key.
+        :param sectionEntries: List of the MemEntry objects of the sections.
+        :param objectEntries: List of the MemEntry objects of the objects.
+        :param warnings: List of the warning messages that were shown during the processing of the mapfile.
+        :return: A tuple of (sectionRows, objectRows, warnings), where the rows are tuples of (addressStart, addressLength, sectionName, objectName, vasSectionName).
+        """
+        def toRows(memEntries):
+            """
+            Function to convert MemEntry objects into rows.
+            :param memEntries: List of MemEntry objects.
+            :return: List of the rows.
+            """
+            return [(memEntry.addressStart, memEntry.addressLength, memEntry.sectionName, memEntry.objectName, memEntry.compilerSpecificData["vasSectionName"]) for memEntry in memEntries]
+        return toRows(sectionEntries), toRows(objectEntries), warnings
 
-        return result
+    @staticmethod
+    def __restoreCachedElements(configId, mapfileName, vasName, cachedElements):
+        """
+        Function to create the result of the GhsMapfileProcessor.importMapfile() from the cached elements of a mapfile.
+        The warnings that were shown when the mapfile was parsed are shown again.
+        :param configId: A configId to which the mapfile belongs to.
+        :param mapfileName: The name of the mapfile.
+        :param vasName: Name of the VAS of the mapfile or None if the mapfile contains physical addresses.
+        :param cachedElements: The cached elements, see the GhsMapfileProcessor.__createCachedElements().
+        :return: A tuple: (mapfileName, sectionEntries, objectEntries), the same as the one of the GhsMapfileProcessor.importMapfile().
+        """
+        sectionRows, objectRows, warnings = cachedElements
+        for message in warnings:
+            sc().warning(message)
+
+        def toMemEntries(rows):
+            """
+            Function to create MemEntry objects from cached rows.
+            :param rows: List of the rows.
+            :return: List of MemEntry objects.
+            """
+            memEntries = []
+            for addressStart, addressLength, sectionName, objectName, vasSectionName in rows:
+                memEntries.append(Emma.emma_libs.memoryEntry.MemEntry(configID=configId, mapfileName=mapfileName, addressStart=addressStart, addressLength=addressLength,
+                                                                      sectionName=sectionName, objectName=objectName,
+                                                                      compilerSpecificData=COMPILER_SPECIFIC_DATA_SCHEMA.create(vasName is None, vasName, vasSectionName)))
+            return memEntries
+        return mapfileName, toMemEntries(sectionRows), toMemEntries(objectRows)
+
+    @staticmethod
+    def __scanMemoryMappedMapfile(mapfilePath, extractors, createMemEntry):
+        """
+        Function to extract the elements of a mapfile with the mmap parser engine.
+        The mapfile is memory-mapped and the bytes patterns are run with finditer() over the blocks they belong to, so no line objects are created
+        and only the groups of the matches that are used for the MemEntry creation will be decoded.
+        The results are the same as the ones of the lines engine (the block titles are identified in the same way).
+        :param mapfilePath: Path of the mapfile.
+        :param extractors: Tuple of (regexPatternData, result) pairs: the elements found with the bytesPattern of the regexPatternData will be appended to the result list.
+                           All the regexPatternData objects need to have a bytesPattern and a blockTitle.
+        :param createMemEntry: Function that creates a MemEntry object from (lineComponents, regexPatternData) or returns None if the element needs to be skipped.
+        :return: Set of the block titles of the extractors that were found in the mapfile.
+        """
+        foundBlockTitles = set()
+        try:
+            with open(mapfilePath, "rb") as fp:
+                # An empty file can not be memory-mapped but there is nothing to extract from it anyway
+                if os.fstat(fp.fileno()).st_size == 0:
+                    return foundBlockTitles
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    # The blocks start with their title lines (these start in the first column with a capital letter) and last until the next title line
+                    blockStarts = [blockTitleMatch.start() for blockTitleMatch in BLOCK_TITLE_LINE_PATTERN.finditer(buffer)]
+                    blockEnds = blockStarts[1:] + [len(buffer)]
+                    lineCounter = LineCounter(buffer)
+                    for blockStart, blockEnd in zip(blockStarts, blockEnds):
+                        for regexPatternData, result in extractors:
+                            blockTitle = regexPatternData.blockTitle.encode()
+                            if buffer[blockStart:(blockStart + len(blockTitle))] != blockTitle:
+                                continue
+                            foundBlockTitles.add(regexPatternData.blockTitle)
+                            for match in regexPatternData.bytesPattern.finditer(buffer, blockStart, blockEnd):
+                                memEntry = createMemEntry(BytesLineComponents(match, lineCounter), regexPatternData)
+                                if memEntry is not None:
+                                    result.append(memEntry)
+        except FileNotFoundError:
+            sc().error(f"The file `{os.path.abspath(mapfilePath)}` was not found!")
+        return foundBlockTitles
 
     @staticmethod
     def __getRegexPattern(defaultPattern: Emma.emma_libs.ghsMapfileRegexes.RegexPatternBase, mapfileEntry):
@@ -184,6 +535,11 @@ class GhsMapfileProcessor(Emma.emma_libs.mapfileProcessor.MapfileProcessor):
                 # If a unique regex pattern is needed, e.g. when the mapfile has a different format and cannot be parsed with the default pattern
                 # Overwrite default pattern with unique one
                 sectionPattern.pattern = mapfileEntry[UNIQUE_PATTERN_SECTIONS]
+                # The bytes pattern and the line tokenizer belong to the default pattern, they can not be used with the unique one
+                sectionPattern.bytesPattern = None
+                sectionPattern.lineTokenizer = None
+                # The format of the mapfile is unknown, so the unique pattern will be applied to every line
+                sectionPattern.blockTitle = None
                 regexPattern = sectionPattern
         elif isinstance(defaultPattern, Emma.emma_libs.ghsMapfileRegexes.ModuleSummaryPattern):
             if UNIQUE_PATTERN_OBJECTS in mapfileEntry.keys():
@@ -192,57 +548,13 @@ class GhsMapfileProcessor(Emma.emma_libs.mapfileProcessor.MapfileProcessor):
                 # If a unique regex pattern is needed, e.g. when the mapfile has a different format and cannot be parsed with the default pattern
                 # Overwrite default pattern with unique one
                 objectPattern.pattern = mapfileEntry[UNIQUE_PATTERN_OBJECTS]
+                # The bytes pattern and the line tokenizer belong to the default pattern, they can not be used with the unique one
+                objectPattern.bytesPattern = None
+                objectPattern.lineTokenizer = None
+                # The format of the mapfile is unknown, so the unique pattern will be applied to every line
+                objectPattern.blockTitle = None
                 regexPattern = objectPattern
         else:
             sc().error("Unexpected default regex pattern (" + type(defaultPattern).__name__ + ")!")
 
         return regexPattern
-
-    @staticmethod
-    def __translateAddress(elementVirtualStartAddress, elementSize, virtualSectionsOfThisMapfile, monolithFileContent):
-        # pylint: disable=too-many-locals
-        # Rationale: This is legacy code, it will not be changed.
-
-        """
-        Calculates the physical address for an element (= section or object).
-        The patterns config file can assign a VAS to a mapfile. Every VAS has VAS sections that are defined in the
-        virtualSections file. The monolith file contains all the virtual sections of all the VAS-es with data
-        based on which the address translation can be done.
-
-        In order to do the translation we loop trough the entries in the monolith file and see whether the entry belongs
-        to the VAS of this element. If so, when we need to make sure that the element resides within the virtual section.
-        If that is also true, the address translation can be easily done with the data found in the monolith file.
-        :param elementVirtualStartAddress: The start address of the element in the VAS
-        :param elementSize: The size of the element in bytes
-        :param virtualSectionsOfThisMapfile: List of virtual sections that belong to the VAS of the element
-        :param monolithFileContent: List of all the virtual sections from the monolith file.
-        :return: Physical start address of the element and the name of the virtual section the translation was done with.
-        """
-        # This are indexes used for accessing the elements of one monolith file entry
-        monolithIndexVirtual = 0
-        monolithIndexOffset = 2
-        monolithIndexSize = 3
-        monolithIndexSectionName = 4
-        # Converting the received start address and size to decimal
-        _, elementVirtualStartAddress = Emma.shared_libs.emma_helper.unifyAddress(elementVirtualStartAddress)
-        _, elementSize = Emma.shared_libs.emma_helper.unifyAddress(elementSize)
-        # Setting up the return values with default values
-        elementPhysicalStartAddress = None
-        virtualSectionName = None
-
-        # We will go trough all the entries in the monolith file to find the virtual section this element belongs to
-        for entry in monolithFileContent:
-            # If the element belongs to this virtual section we will try to do the address translation
-            virtualSectionName = entry[monolithIndexSectionName]
-            if virtualSectionName in virtualSectionsOfThisMapfile:
-                # Setting up data for the translation (for the end addresses we need to be careful in case we have zero lengths)
-                virtualSectionStartAddress = entry[monolithIndexVirtual]
-                virtualSectionEndAddress = virtualSectionStartAddress + (entry[monolithIndexSize] - 1) if entry[monolithIndexSize] > 0 else virtualSectionStartAddress
-                elementVirtualEndAddress = elementVirtualStartAddress + (elementSize - 1) if elementSize > 0 else elementVirtualStartAddress
-                # If the element is contained by this virtual section then we will use this one for the translation
-                if virtualSectionStartAddress <= elementVirtualStartAddress <= elementVirtualEndAddress <= virtualSectionEndAddress:
-                    addressTranslationOffset = entry[monolithIndexOffset]
-                    elementPhysicalStartAddress = elementVirtualStartAddress + addressTranslationOffset
-                    # FIXME: maybe it should be displayed/captured if we got more than one matches! (It should never happen but still...) (MSc)
-                    break
-        return elementPhysicalStartAddress, virtualSectionName
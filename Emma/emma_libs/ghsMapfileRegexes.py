@@ -20,6 +20,8 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 #     This File containes classes holding the regex patterns.
 #     The default patterns are specific for Green Hills mapfiles.
 #     The default patterns can be overriden by adding a JSON entry in patterns*.json. Refer to the Documentation for more info
+#     The default mapfile patterns are only applied inside of their own mapfile block (e.g. `Image Summary`), the unique ones to every line
+#     The module summary lines of the default layout are split into tokens by a line tokenizer, the regex pattern is only used for the lines that differ from this layout
 
 
 import re
@@ -55,7 +57,13 @@ class RegexPatternBase:
     """
     def __init__(self):
         self.pattern = None
+        # The same pattern compiled for bytes, used by the mmap parser engine; None if the pattern can only be used on decoded lines
+        self.bytesPattern = None
+        # Function that creates the line components of a line in the default layout without the regex pattern (returns None for other lines); None if there is no such function
+        self.lineTokenizer = None
         self.Groups = Groups()
+        # Title of the mapfile block the pattern shall be applied in; None if the pattern shall be applied to every line
+        self.blockTitle = None
 
 
 class ModuleSummaryPattern(RegexPatternBase):
@@ -74,12 +82,25 @@ class ModuleSummaryPattern(RegexPatternBase):
             (?:\s+)(?P<section>.+)                                # Section (i.e.: `.text`, `.debug_abbrev`, `.rodata`, ...)
             (?:\s+)(?P<module>([\w.]+\.([oa]|bin)*.*)|(<.*>))     # Module (i.e.: `crt0.o`, ...) 
             """, re.X)
+        # The bytes version of the pattern is applied to a whole block, so it must not match over line ends:
+        # the whitespaces are restricted to the ones inside of a line, `.` to the characters that are not line ends
+        # and the rest of the line is consumed, so there can be only one match per line
+        self.bytesPattern = re.compile(rb"""
+            (?P<origin>[0-9a-f]{8})                                             # Origin
+            (?:\+)(?P<size>[0-9a-f]{6})                                         # Size
+            (?:[ \t\f\v]+)(?P<section>[^\r\n]+)                                 # Section
+            (?:[ \t\f\v]+)(?P<module>([\w.]+\.([oa]|bin)*[^\r\n]*)|(<[^\r\n]*>))     # Module
+            [^\r\n]*                                                            # Rest of the line
+            """, re.X)
 
         self.Groups.origin = "origin"
         self.Groups.size = "size"
         self.Groups.section = "section"
         self.Groups.name = "module"
 
+        self.blockTitle = "Module Summary"
+        self.lineTokenizer = tokenizeModuleSummaryLine
+
     def getModuleName(self, lineComponents):
         return lineComponents.group(self.Groups.name).rstrip()
 
@@ -101,6 +122,15 @@ class ImageSummaryPattern(RegexPatternBase):
             (?:\s+)(?P<sizeDec>\d+)									        # Size(dec)
             (?:\s{3})(?P<sectionOffset>[0-9a-f]+)						    # Sec Offs
             """, re.X)
+        # The bytes version of the pattern, see the ModuleSummaryPattern for the differences
+        self.bytesPattern = re.compile(rb"""
+            (?:[ \t\f\v]{2})(?P<section>[.*\w]+)                               # Section
+            (?:[ \t\f\v]+)(?P<baseAddr>[0-9a-f]+)                               # Base Address
+            (?:[ \t\f\v]{2})(?P<sizeHex>[0-9a-f]+)                              # Size(hex)
+            (?:[ \t\f\v]+)(?P<sizeDec>\d+)                                      # Size(dec)
+            (?:[ \t\f\v]{3})(?P<sectionOffset>[0-9a-f]+)                        # Sec Offs
+            [^\r\n]*                                                            # Rest of the line
+            """, re.X)
 
         self.Groups.name = "section"
         self.Groups.section = "section"
@@ -108,6 +138,8 @@ class ImageSummaryPattern(RegexPatternBase):
         self.Groups.size = "sizeHex"
         self.Groups.sectionOffset = "sectionOffset"
 
+        self.blockTitle = "Image Summary"
+
     def getModuleName(self, lineComponents):    # pylint: disable=unused-argument, no-self-use
                                                 # Rationale: Sections do not have object names. This function has to have the same prototype as the other subclasses of the RegexPatternBase.
         """
@@ -117,6 +149,65 @@ class ImageSummaryPattern(RegexPatternBase):
         return ""       # image has no module names (>> thus empty string)
 
 
+class TokenizedLineComponents:
+    # pylint: disable=too-few-public-methods
+    # Rationale: This class only needs to provide the group() function of the match objects.
+
+    """
+    Class holding the groups of a line that was split by a line tokenizer.
+    It provides the same group() interface as the match objects created by the regex patterns.
+    """
+    __slots__ = ("groupIndexes", "groups")
+
+    def __init__(self, groupIndexes, groups):
+        # Dictionary with the group names as keys and their indexes in the groups as values
+        self.groupIndexes = groupIndexes
+        self.groups = groups
+
+    def group(self, name):
+        """
+        Function to get a group of the line.
+        :param name: The name of the group.
+        :return: The content of the group.
+        """
+        return self.groups[self.groupIndexes[name]]
+
+
+HEX_DIGITS = "0123456789abcdef"
+# The beginning of the module names that can be matched by the ModuleSummaryPattern; the first alternative takes the whole rest of the line, the second one ends with its last `>`
+MODULE_NAME_START_PATTERN = re.compile(r"(?P<file>[\w.]+\.)|<.*>")
+MODULE_SUMMARY_GROUP_INDEXES = {"origin": 0, "size": 1, "section": 2, "module": 3}
+
+
+def tokenizeModuleSummaryLine(line):
+    """
+    Linear time replacement of the ModuleSummaryPattern for the default layout of the module summary lines: `<origin>+<size>  <section>  <module>`.
+    The regex pattern needs quadratic time in the length of the whitespace runs (e.g. trailing whitespaces) because of its greedy section group,
+    the tokenizer does not depend on them. The result is the same as the one of the regex pattern, the lines that differ from this layout are not handled.
+    :param line: A line of the mapfile.
+    :return: TokenizedLineComponents with the same groups as the ModuleSummaryPattern or None if the line is not in the default layout.
+    """
+    tokens = line.split()
+    if len(tokens) != 3:
+        return None
+    originAndSize, section, module = tokens
+    # The origin and the size need to be at the beginning of the line (a match found there is the first one of the regex search)
+    if len(originAndSize) != 15 or originAndSize[8] != "+" or line[0] != originAndSize[0]:
+        return None
+    origin = originAndSize[:8]
+    size = originAndSize[9:]
+    if origin.strip(HEX_DIGITS) or size.strip(HEX_DIGITS):
+        return None
+    # The greedy section group of the regex ends before the last token that is a valid module name.
+    # If the last token is not a valid one, then the regex may find a different split of the line, so this case is left for it.
+    moduleNameStart = MODULE_NAME_START_PATTERN.match(module)
+    if moduleNameStart is None:
+        return None
+    if moduleNameStart.group("file") is None:
+        module = moduleNameStart.group()
+    return TokenizedLineComponents(MODULE_SUMMARY_GROUP_INDEXES, (origin, size, section, module))
+
+
 class UpperMonolithPattern(RegexPatternBase):
     # pylint: disable=too-few-public-methods
     # Rationale: This is a special class to be used for mapfile processing, it does not have to have more public mehtods.
@@ -18,6 +18,9 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 
 
 import abc
+import bisect
+import operator
+import itertools
 
 from pypiscout.SCout_Logger import Logger as sc
 
@@ -73,43 +76,27 @@ class MapfileProcessor(abc.ABC):
             loggerLevel(f"Element: {memEntry.configID}::{memEntry.mapfile}::{memEntry.sectionName}" + ("::"  + memEntry.objectName if memEntry.objectName != "" else "")
                         + f" `(size: " + str(memEntry.addressLength) + f" B, starts @{memEntry.addressStartHex()}) was removed. Reason: " + reason)
 
-        def isElementMarkedAsExcluded(excludedMemoryRegionsFromMapfiles, memEntry):
-            """
-            Function to check whether the element was marked as excluded.
-            :param excludedMemoryRegionsFromMapfiles: See docstring of fillOutMemoryRegionsAndMemoryTypes().
-            :param memEntry: MemEntry object for which it should be decided whether it is excluded or not.
-            :return: True if element was marked as excluded, False otherwise.
-            """
-            result = False
-            # If there is an exclusion list for memory regions per mapfiles
-            if excludedMemoryRegionsFromMapfiles is not None:
-                # If there is an excluded memory region for the mapfile of the memory entry
-                if memEntry.mapfile in excludedMemoryRegionsFromMapfiles.keys():
-                    # If the memory region of the mem entry is excluded
-                    if memEntry.memTypeTag in excludedMemoryRegionsFromMapfiles[memEntry.mapfile]:
-                        result = True
-            return result
-
         listOfElementsToKeep = []
         memoryCandidates = configuration["addressSpaces"]["memory"]
+        memoryRegionTable = MemoryRegionTable(memoryCandidates)
+        # The excluded memory regions of the mapfiles as sets, so the exclusion can be checked with a single lookup
+        excludedMemoryRegionsOfMapfiles = {}
+        if memoryRegionsToExcludeFromMapfiles is not None:
+            excludedMemoryRegionsOfMapfiles = {mapfile: frozenset(memoryRegions) for mapfile, memoryRegions in memoryRegionsToExcludeFromMapfiles.items()}
+        noExcludedMemoryRegions = frozenset()
 
         # For every memEntryObject
         for element in listOfMemEntryObjects:
-            # For every defined memory region
-            for memoryRegion in memoryCandidates:
-                # If the element is in this memoryRegion
-                # For elements that do not have addressEnd the addressStart comparison is enough
-                if int(memoryCandidates[memoryRegion]["start"], 16) <= element.addressStart:
-                    if element.addressEnd() is None or (element.addressEnd() <= int(memoryCandidates[memoryRegion]["end"], 16)):
-                        # Then we store the memoryRegion data in the element
-                        element.memTypeTag = memoryRegion
-                        element.memType = memoryCandidates[memoryRegion]["type"]
-                        # If this region is not excluded for the mapfile the element belongs to then we will keep it
-                        if not isElementMarkedAsExcluded(memoryRegionsToExcludeFromMapfiles, element):
-                            listOfElementsToKeep.append(element)
-                        else:
-                            printElementRemovalMessage(element, sc().debug, "Its memory region was excluded for this mapfile!")
-                        break
+            # Looking up the memory region the element is in
+            memoryRegion = memoryRegionTable.lookUp(element.addressStart, element.addressEnd())
+            if memoryRegion is not None:
+                # Then we store the memoryRegion data in the element
+                element.memTypeTag, element.memType = memoryRegion
+                # If this region is not excluded for the mapfile the element belongs to then we will keep it
+                if element.memTypeTag not in excludedMemoryRegionsOfMapfiles.get(element.mapfile, noExcludedMemoryRegions):
+                    listOfElementsToKeep.append(element)
+                else:
+                    printElementRemovalMessage(element, sc().debug, "Its memory region was excluded for this mapfile!")
             # If we have reached this point, then we did not find a memory region
             else:
                 # If we do not have to remove elements without a memory region then we will fill it out with the default values and keep it
@@ -122,3 +109,52 @@ class MapfileProcessor(abc.ABC):
                     printElementRemovalMessage(element, sc().warning, "It does not belong to any of the memory regions!")
         # Overwriting the content of the list of memory entry objects with the elements that we will keep
         listOfMemEntryObjects[:] = listOfElementsToKeep
+
+
+class MemoryRegionTable:
+    """
+    Lookup table of the memory regions of a configuration ("addressSpaces" -> "memory").
+    The addresses of the regions are converted once and the regions are sorted by their start addresses.
+    If they do not overlap, the only region that can contain an element is found with a binary search.
+    Otherwise the regions are searched in the order of the configuration, as the first region containing the element has to be used.
+    Elements with zero length are only compared with the start addresses, so the first region in the configuration that starts at or before them is used.
+    """
+    def __init__(self, memoryCandidates):
+        # The memory regions in the order of the configuration: (startAddress, endAddress, memTypeTag, memType)
+        memoryRegions = [(int(memoryRegionData["start"], 16), int(memoryRegionData["end"], 16), memoryRegion, memoryRegionData["type"]) for memoryRegion, memoryRegionData in memoryCandidates.items()]
+        sortedMemoryRegions = sorted(memoryRegions, key=operator.itemgetter(0))
+        # The memory regions are sorted only if they can be searched with the binary search (they do not overlap)
+        if all(previous[1] < following[0] for previous, following in zip(sortedMemoryRegions, sortedMemoryRegions[1:])):
+            self.memoryRegions = sortedMemoryRegions
+            self.startAddresses = [memoryRegion[0] for memoryRegion in sortedMemoryRegions]
+            # For every sorted region, the region that comes first in the configuration from the ones that start at or before it (this is used for the zero length elements)
+            configurationOrder = {memoryRegion[2]: index for index, memoryRegion in enumerate(memoryRegions)}
+            self.firstConfiguredMemoryRegions = list(itertools.accumulate(sortedMemoryRegions, lambda first, memoryRegion: min(first, memoryRegion, key=lambda candidate: configurationOrder[candidate[2]])))
+        else:
+            self.memoryRegions = memoryRegions
+            self.startAddresses = None
+            self.firstConfiguredMemoryRegions = None
+
+    def lookUp(self, elementAddressStart, elementAddressEnd):
+        """
+        Function to find the memory region of an element.
+        :param elementAddressStart: The start address of the element.
+        :param elementAddressEnd: The end address of the element or None if it has zero length.
+        :return: The memTypeTag and the memType of the memory region or None if no memory region contains the element.
+        """
+        if self.startAddresses is not None:
+            index = bisect.bisect_right(self.startAddresses, elementAddressStart)
+            if index == 0:
+                return None
+            if elementAddressEnd is None:
+                candidates = self.firstConfiguredMemoryRegions[(index - 1):index]
+            else:
+                candidates = self.memoryRegions[(index - 1):index]
+        else:
+            candidates = self.memoryRegions
+
+        for memoryRegionStartAddress, memoryRegionEndAddress, memTypeTag, memType in candidates:
+            # For elements that do not have addressEnd the addressStart comparison is enough
+            if memoryRegionStartAddress <= elementAddressStart and (elementAddressEnd is None or elementAddressEnd <= memoryRegionEndAddress):
+                return memTypeTag, memType
+        return None
@@ -0,0 +1,303 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import array
+import collections
+import collections.abc
+
+import Emma.emma_libs.memoryEntry
+
+
+# The type code of the arrays the addresses and the lengths are stored in (signed 64 bit)
+ADDRESS_ARRAY_TYPECODE = "q"
+# The type code of the arrays the codes of the dictionary encoded columns are stored in (unsigned 32 bit)
+CODE_ARRAY_TYPECODE = "I"
+
+# The attributes of the MemEntry objects that are stored in typed arrays
+ADDRESS_COLUMNS = ("addressStart", "addressLength", "addressStartOriginal", "addressLengthOriginal")
+# The attributes of the MemEntry objects that are stored in dictionary encoded columns, these have only a few different values
+DICTIONARY_COLUMNS = ("configID", "mapfile", "sectionName", "objectName", "memType", "memTypeTag", "category",
+                      "overlapFlag", "containmentFlag", "duplicateFlag", "containingOthersFlag", "overlappingOthersFlag", "compilerSpecificData")
+
+
+class DictionaryEncodedColumn:
+    """
+    A column that stores every different value only once; the rows store the codes (indexes) of their values in a typed array.
+    The values need to be hashable, except for the compiler specific data, which is encoded by its items.
+    """
+    def __init__(self):
+        # The different values in the order of their first appearance, the code of a value is its index in this list
+        self.values = []
+        # The codes of the rows
+        self.codes = array.array(CODE_ARRAY_TYPECODE)
+        # Dictionary with the (keys of the) values as keys and their codes as values
+        self.index = {}
+
+    def __getstate__(self):
+        # The index is not pickled, it can be rebuilt from the values
+        return self.values, self.codes
+
+    def __setstate__(self, state):
+        self.values, self.codes = state
+        self.index = {DictionaryEncodedColumn.__getIndexKey(value): code for code, value in enumerate(self.values)}
+
+    def __len__(self):
+        return len(self.codes)
+
+    @staticmethod
+    def __getIndexKey(value):
+        """
+        Function to get the key a value is stored with in the index.
+        The types are part of the key, because equal values of different types (e.g. True, 1 and 1.0) have the same hash and would share a code.
+        :param value: The value.
+        :return: The type and the value or the type and the tuple of the items (with the types of their values) if it is a mapping (e.g. the compiler specific data).
+        """
+        if isinstance(value, collections.abc.Mapping):
+            return type(value), tuple((key, type(item), item) for key, item in value.items())
+        return type(value), value
+
+    def encode(self, value):
+        """
+        Function to get the code of a value. If the value was not stored yet, it will be added to the values.
+        :param value: The value.
+        :return: The code of the value.
+        """
+        indexKey = DictionaryEncodedColumn.__getIndexKey(value)
+        code = self.index.get(indexKey)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.index[indexKey] = code
+        return code
+
+    def append(self, value):
+        """
+        Function to append a row to the column.
+        :param value: The value of the row.
+        :return: None
+        """
+        self.codes.append(self.encode(value))
+
+    def extend(self, other):
+        """
+        Function to append the rows of another column to this one. The codes of the other column are translated, no value is compared more than once.
+        :param other: A DictionaryEncodedColumn object.
+        :return: None
+        """
+        translation = [self.encode(value) for value in other.values]
+        self.codes.extend(translation[code] for code in other.codes)
+
+    def get(self, row):
+        """
+        Function to get the value of a row.
+        :param row: The index of the row.
+        :return: The value.
+        """
+        return self.values[self.codes[row]]
+
+    def set(self, row, value):
+        """
+        Function to change the value of a row.
+        :param row: The index of the row.
+        :param value: The new value.
+        :return: None
+        """
+        self.codes[row] = self.encode(value)
+
+    def decode(self, start=0, stop=None):
+        """
+        Function to get the values of the rows.
+        :param start: The index of the first row.
+        :param stop: The index after the last row or None for all the rows until the end.
+        :return: An iterator over the values in the order of the rows.
+        """
+        codes = self.codes if (start == 0 and stop is None) else self.codes[start:stop]
+        return map(self.values.__getitem__, codes)
+
+
+class MemEntryCollection(collections.abc.Sequence):
+    """
+    A columnar (struct-of-arrays) collection of memory entries.
+    The addresses and the lengths are stored in typed arrays, the strings (and the flags and the compiler specific data) in dictionary encoded columns,
+    so a row costs a few dozen bytes instead of a full MemEntry object with its own compiler specific data.
+    The rows can be accessed through MemEntryView objects, these behave like MemEntry objects, but read and write the columns of the collection.
+    The compiler specific data is shared between the rows that have equal ones, so it must not be changed through a row.
+    """
+    def __init__(self, memEntries=()):
+        # The typed arrays of the addresses and the lengths
+        self.addressColumns = {name: array.array(ADDRESS_ARRAY_TYPECODE) for name in ADDRESS_COLUMNS}
+        # The dictionary encoded columns of the rest of the attributes
+        self.dictionaryColumns = {name: DictionaryEncodedColumn() for name in DICTIONARY_COLUMNS}
+        self.extend(memEntries)
+
+    def __len__(self):
+        return len(self.addressColumns["addressStart"])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return MemEntryCollection(MemEntryView(self, row) for row in range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("MemEntryCollection index out of range")
+        return MemEntryView(self, index)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield MemEntryView(self, row)
+
+    def append(self, memEntry):
+        """
+        Function to append a MemEntry object (or a row of another collection) to the collection. The values are copied, the object is not referenced.
+        :param memEntry: The MemEntry object.
+        :return: None
+        """
+        for name, column in self.addressColumns.items():
+            column.append(getattr(memEntry, name))
+        for name, column in self.dictionaryColumns.items():
+            column.append(getattr(memEntry, name))
+
+    def extend(self, memEntries):
+        """
+        Function to append more MemEntry objects to the collection.
+        If another MemEntryCollection is given, its columns are concatenated without creating row objects.
+        :param memEntries: Iterable of MemEntry objects or a MemEntryCollection object.
+        :return: None
+        """
+        if isinstance(memEntries, MemEntryCollection):
+            for name, column in self.addressColumns.items():
+                column.extend(memEntries.addressColumns[name])
+            for name, column in self.dictionaryColumns.items():
+                column.extend(memEntries.dictionaryColumns[name])
+        else:
+            for memEntry in memEntries:
+                self.append(memEntry)
+
+    def column(self, name, start=0, stop=None):
+        """
+        Function to get the values of an attribute of the rows without creating row objects.
+        :param name: The name of the MemEntry attribute (one of the ADDRESS_COLUMNS or DICTIONARY_COLUMNS).
+        :param start: The index of the first row.
+        :param stop: The index after the last row or None for all the rows until the end.
+        :return: An iterable of the values in the order of the rows.
+        """
+        if name in self.addressColumns:
+            return self.addressColumns[name] if (start == 0 and stop is None) else self.addressColumns[name][start:stop]
+        return self.dictionaryColumns[name].decode(start, stop)
+
+    def compilerSpecificHeaders(self):
+        """
+        Function to create a list of the headers that the compiler specific data of the rows have.
+        Only the different compiler specific data are checked, so this is independent of the number of rows.
+        :return: List of strings in the order of their first appearance.
+        """
+        collectedHeaders = []
+        for compilerSpecificData in self.dictionaryColumns["compilerSpecificData"].values:
+            for key in compilerSpecificData.keys():
+                if key not in collectedHeaders:
+                    collectedHeaders.append(key)
+        return collectedHeaders
+
+    def toMemEntries(self):
+        """
+        Function to materialise the rows as independent MemEntry objects.
+        :return: List of MemEntry objects.
+        """
+        return [row.toMemEntry() for row in self]
+
+
+def createColumnProperty(name, isAddressColumn):
+    """
+    Function to create a property that reads and writes a column of the collection of a MemEntryView.
+    :param name: The name of the column.
+    :param isAddressColumn: True if the column is a typed array, False if it is a DictionaryEncodedColumn.
+    :return: The property object.
+    """
+    if isAddressColumn:
+        def getter(self):
+            return self.collection.addressColumns[name][self.row]
+
+        def setter(self, value):
+            self.collection.addressColumns[name][self.row] = value
+    else:
+        def getter(self):
+            return self.collection.dictionaryColumns[name].get(self.row)
+
+        def setter(self, value):
+            self.collection.dictionaryColumns[name].set(self.row, value)
+    return property(getter, setter)
+
+
+class MemEntryView(Emma.emma_libs.memoryEntry.MemEntry):
+    # pylint: disable=super-init-not-called
+    # Rationale: The view has no data of its own, the attributes of the MemEntry are properties that access the columns of the collection.
+
+    """
+    A row of a MemEntryCollection. It has the same interface as a MemEntry object, its attributes are read from and written to the columns of the collection.
+    A deep copy of a view is an independent MemEntry object.
+    """
+    __slots__ = ("collection", "row")
+
+    def __init__(self, collection, row):
+        self.collection = collection
+        self.row = row
+
+    def __deepcopy__(self, memo):
+        return self.toMemEntry()
+
+    def addressEnd(self):
+        """
+        Function to get the addressEnd. The view does not cache it, it is calculated from the columns.
+        :return: The addressEnd if addressLength is not 0, None otherwise.
+        """
+        addressLength = self.addressLength
+        return (self.addressStart + addressLength - 1) if addressLength > 0 else None
+
+    def toMemEntry(self):
+        """
+        Function to materialise the row as an independent MemEntry object.
+        :return: The MemEntry object.
+        """
+        memEntry = Emma.emma_libs.memoryEntry.MemEntry(configID=self.configID, mapfileName=self.mapfile, addressStart=self.addressStart, addressLength=self.addressLength,
+                                                       sectionName=self.sectionName, objectName=self.objectName, memType=self.memType, memTypeTag=self.memTypeTag,
+                                                       category=self.category, compilerSpecificData=self.__copyCompilerSpecificData())
+        memEntry.addressStartOriginal = self.addressStartOriginal
+        memEntry.addressLengthOriginal = self.addressLengthOriginal
+        memEntry.overlapFlag = self.overlapFlag
+        memEntry.containmentFlag = self.containmentFlag
+        memEntry.duplicateFlag = self.duplicateFlag
+        memEntry.containingOthersFlag = self.containingOthersFlag
+        memEntry.overlappingOthersFlag = self.overlappingOthersFlag
+        return memEntry
+
+    def __copyCompilerSpecificData(self):
+        """
+        Function to create compiler specific data for a materialised row. The immutable CompilerSpecificData objects are shared, the others are copied.
+        :return: The compiler specific data.
+        """
+        compilerSpecificData = self.compilerSpecificData
+        if isinstance(compilerSpecificData, Emma.emma_libs.memoryEntry.CompilerSpecificData):
+            return compilerSpecificData
+        return collections.OrderedDict(compilerSpecificData)
+
+
+for columnName in ADDRESS_COLUMNS:
+    setattr(MemEntryView, columnName, createColumnProperty(columnName, True))
+for columnName in DICTIONARY_COLUMNS:
+    setattr(MemEntryView, columnName, createColumnProperty(columnName, False))
@@ -16,8 +16,11 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>
 """
 
+import sys
 import abc
+import operator
 import collections
+import collections.abc
 
 from pypiscout.SCout_Logger import Logger as sc
 
@@ -25,13 +28,93 @@ import Emma.shared_libs.emma_helper
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 
 
+def internString(value):
+    """
+    Function to intern a string, so the equal strings of the MemEntry objects (e.g. configIDs, mapfile and section names) are stored only once.
+    :param value: The value to intern.
+    :return: The interned string or the value itself if it is not a str.
+    """
+    return sys.intern(value) if type(value) is str else value      # pylint: disable=unidiomatic-typecheck
+                                                                    # Rationale: The subclasses of str can not be interned.
+
+
+class CompilerSpecificData(collections.abc.Mapping):
+    """
+    Immutable compiler specific data of MemEntry objects.
+    The objects are created by a CompilerSpecificDataSchema, that makes sure that the MemEntry objects with equal data share the same object.
+    Since it can not be changed, it does not need to be copied when a MemEntry object is copied.
+    """
+    __slots__ = ("__data", "__hash")
+
+    def __init__(self, keys, values):
+        self.__data = dict(zip(keys, values))
+        self.__hash = hash(tuple(self.__data.items()))
+
+    def __getitem__(self, key):
+        return self.__data[key]
+
+    def __iter__(self):
+        return iter(self.__data)
+
+    def __len__(self):
+        return len(self.__data)
+
+    def __hash__(self):
+        return self.__hash
+
+    def __eq__(self, other):
+        return self is other or super().__eq__(other)
+
+    def __repr__(self):
+        return type(self).__name__ + "(" + repr(self.__data) + ")"
+
+    def __reduce__(self):
+        return CompilerSpecificData, (tuple(self.__data.keys()), tuple(self.__data.values()))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class CompilerSpecificDataSchema:
+    """
+    The keys of the compiler specific data that a MapfileProcessor creates for its MemEntry objects.
+    Every different compiler specific data is created only once, the MemEntry objects with equal data share the same CompilerSpecificData object.
+    """
+    def __init__(self, keys):
+        # The keys of the data in the order they will appear in the reports
+        self.keys = tuple(keys)
+        # Dictionary with the tuples of values as keys and their CompilerSpecificData objects as values
+        self.instances = {}
+
+    def create(self, *values):
+        """
+        Function to get the compiler specific data with the given values.
+        :param values: The values in the order of the keys of the schema.
+        :return: The shared CompilerSpecificData object.
+        """
+        instance = self.instances.get(values)
+        if instance is None:
+            instance = CompilerSpecificData(self.keys, values)
+            self.instances[values] = instance
+        return instance
+
+
 class MemEntry:
     # pylint: disable=too-many-instance-attributes
     # Rationale: This class needs to store all the attributes of an entry.
     """
     A class to represent an entry in the memory. This is a generic class, it can represent both sections and objects.
     To handle objects of this class according to their type, please use one of the subclasses of the @ref:MemEntryHandler.
+    The attributes are stored in slots and the repetitive strings are interned, since there can be millions of these objects.
+    The end address is cached, it is updated whenever the addressStart or the addressLength is changed.
     """
+    __slots__ = ("configID", "mapfile", "__addressStart", "__addressLength", "__addressEnd", "sectionName", "objectName", "memType", "memTypeTag", "category",
+                 "compilerSpecificData", "overlapFlag", "containmentFlag", "duplicateFlag", "containingOthersFlag", "overlappingOthersFlag",
+                 "addressStartOriginal", "addressLengthOriginal")
+
     def __init__(self, configID, mapfileName, addressStart, addressLength=None, addressEnd=None, sectionName="", objectName="", memType="", memTypeTag="", category="", compilerSpecificData=None):
         # pylint: disable=too-many-arguments
         # Rationale: The constructor needs to be able to fully setup during construction.
@@ -48,11 +131,11 @@ class MemEntry:
         :param memType: [string] The type of the memory the entry is located in. For example: INT_FLASH, EXT_FLASH, INT_RAM, EXT_RAM...
         :param memTypeTag: [string] The name of the memory area the entry is located in. This is a logical subtype of the memType value. For example: Code, DataTable...
         :param category: [string] The name of the category, the entry belongs to. This is only a logical grouping. For example: GraphicFramework, EthernetDriver, HMI
-        :param compilerSpecificData: [collections.OrderedDict] Data that comes from the object of the MapfileProcessor subclasseses during the mapfile processing.
+        :param compilerSpecificData: [CompilerSpecificData or collections.OrderedDict] Data that comes from the object of the MapfileProcessor subclasseses during the mapfile processing.
         """
 
-        self.configID = configID
-        self.mapfile = mapfileName
+        self.configID = internString(configID)
+        self.mapfile = internString(mapfileName)
 
         # Converting the address related parameters to int
         if addressStart is not None:
@@ -62,10 +145,10 @@ class MemEntry:
         if addressEnd is not None:
             _, addressEnd = Emma.shared_libs.emma_helper.unifyAddress(addressEnd)
 
+        # Initializing the length to None. This will be later overwritten, but the member has to be created in __init__()
+        self.__addressLength = None
         self.addressStart = addressStart
 
-        # Initializing the length to None. This will be later overwritten, but the member has to be created in __init__()
-        self.addressLength = None
         if addressLength is None and addressEnd is None:
             sc().error("Either addressLength or addressEnd must be given!")
         elif addressEnd is not None and addressLength is None:
@@ -76,18 +159,18 @@ class MemEntry:
             sc().warning("MemEntry: addressLength AND addressEnd were both given. The addressLength will be used.")
             self.setAddressesGivenLength(addressLength)
 
-        self.sectionName = sectionName
+        self.sectionName = internString(sectionName)
         self.objectName = objectName
 
-        self.memType = memType
-        self.memTypeTag = memTypeTag
+        self.memType = internString(memType)
+        self.memTypeTag = internString(memTypeTag)
         self.category = category
 
         self.compilerSpecificData = None
-        if isinstance(compilerSpecificData, collections.OrderedDict):
+        if isinstance(compilerSpecificData, (CompilerSpecificData, collections.OrderedDict)):
             self.compilerSpecificData = compilerSpecificData
         else:
-            sc().error("The compilerSpecificData has to be of type " + type(collections.OrderedDict).__name__ + " instad of " + type(compilerSpecificData).__name__ + "!")
+            sc().error("The compilerSpecificData has to be of type " + CompilerSpecificData.__name__ + " or " + collections.OrderedDict.__name__ + " instad of " + type(compilerSpecificData).__name__ + "!")
 
         # Flags for overlapping, containment and duplicate
         self.overlapFlag = None
@@ -119,6 +202,69 @@ class MemEntry:
         # TODO: Do we want to compare the length (shortest first) when address ist the same? (MSc)
         return self.addressStart < other.addressStart
 
+    @property
+    def addressStart(self):
+        """
+        The start address of the entry in bytes.
+        """
+        return self.__addressStart
+
+    @addressStart.setter
+    def addressStart(self, addressStart):
+        self.__addressStart = addressStart
+        self.__updateAddressEnd()
+
+    @property
+    def addressLength(self):
+        """
+        The length of the entry in bytes.
+        """
+        return self.__addressLength
+
+    @addressLength.setter
+    def addressLength(self, addressLength):
+        self.__addressLength = addressLength
+        self.__updateAddressEnd()
+
+    def __updateAddressEnd(self):
+        """
+        Function to update the cached end address after the addressStart or the addressLength was changed.
+        :return: None
+        """
+        self.__addressEnd = MemEntry.__calculateAddressEnd(self.__addressStart, self.__addressLength) if (self.__addressStart is not None and self.__addressLength is not None) else None
+
+    def createDerivedEntry(self, objectName=None, addressStart=None, addressLength=None):
+        """
+        Function to create a lightweight entry that is derived from this one (e.g. a section entry or a section reserve).
+        The derived entry is a new MemEntry object that shares the attributes of this one, only the given ones are overridden.
+        Unlike a deep copy, this does not copy the strings and the compiler specific data (the immutable CompilerSpecificData is shared, a collections.OrderedDict is copied shallowly).
+        The original values (addressStartOriginal, addressLengthOriginal) are the ones of this entry.
+        :param objectName: The objectName of the derived entry or None if it shall be the same as the one of this entry.
+        :param addressStart: The addressStart of the derived entry or None if it shall be the same as the one of this entry.
+        :param addressLength: The addressLength of the derived entry or None if it shall be the same as the one of this entry.
+        :return: The derived MemEntry object.
+        """
+        derivedEntry = MemEntry.__new__(MemEntry)
+        derivedEntry.configID = self.configID
+        derivedEntry.mapfile = self.mapfile
+        derivedEntry.__addressStart = self.addressStart if addressStart is None else addressStart
+        derivedEntry.__addressLength = self.addressLength if addressLength is None else addressLength
+        derivedEntry.__updateAddressEnd()
+        derivedEntry.sectionName = self.sectionName
+        derivedEntry.objectName = self.objectName if objectName is None else objectName
+        derivedEntry.memType = self.memType
+        derivedEntry.memTypeTag = self.memTypeTag
+        derivedEntry.category = self.category
+        derivedEntry.compilerSpecificData = self.compilerSpecificData if isinstance(self.compilerSpecificData, CompilerSpecificData) else collections.OrderedDict(self.compilerSpecificData)
+        derivedEntry.overlapFlag = self.overlapFlag
+        derivedEntry.containmentFlag = self.containmentFlag
+        derivedEntry.duplicateFlag = self.duplicateFlag
+        derivedEntry.containingOthersFlag = self.containingOthersFlag
+        derivedEntry.overlappingOthersFlag = self.overlappingOthersFlag
+        derivedEntry.addressStartOriginal = self.addressStartOriginal
+        derivedEntry.addressLengthOriginal = self.addressLengthOriginal
+        return derivedEntry
+
     def addressStartHex(self):
         """
         Function to get the addressStart in hex.
@@ -138,7 +284,7 @@ class MemEntry:
         Objects that have 0 addressLength do not have end addresses by definition.
         :return: The addressEnd if addressLength is not 0, None otherwise.
         """
-        return self.__calculateAddressEnd(self.addressStart, self.addressLength)
+        return self.__addressEnd
 
     def addressEndHex(self):
         """
@@ -224,6 +370,21 @@ class MemEntry:
         return self.configID + sep + self.mapfile + sep + self.sectionName + (sep + self.objectName if self.objectName != "" and self.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY and self.objectName != OBJECTS_IN_SECTIONS_SECTION_RESERVE else "")
 
 
+# The key that is used for ordering MemEntry objects by their start address
+MEM_ENTRY_SORT_KEY = operator.attrgetter("addressStart")
+
+
+def sortMemEntries(listOfMemEntries):
+    """
+    Sorts a list of MemEntry objects in place, increasingly based on their addressStart.
+    The sort is stable: entries with the same addressStart keep their original order (e.g. the order of the mapfiles and their lines).
+    This gives the same order as inserting the entries one-by-one with bisect.bisect_right(), but it is done in O(n log n) and without calling MemEntry.__lt__().
+    :param listOfMemEntries: The list of MemEntry objects that will be sorted.
+    :return: None
+    """
+    listOfMemEntries.sort(key=MEM_ENTRY_SORT_KEY)
+
+
 class MemEntryHandler(abc.ABC):
     """
     Abstract class describing an interface that a class that´s purpose is the handling of MemEntry objects shall have.
@@ -18,17 +18,50 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 
 
 import os
+import contextlib
+import concurrent.futures
 
 from pypiscout.SCout_Logger import Logger as sc
 import graphviz
 
+import Emma
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 import Emma.shared_libs.emma_helper
+import Emma.shared_libs.reportBundle
 import Emma.emma_libs.memoryEntry
 import Emma.emma_libs.configuration
 import Emma.emma_libs.mapfileProcessorFactory
 import Emma.emma_libs.memoryMap
 import Emma.emma_libs.categorisation
+import Emma.emma_libs.diskCache
+import Emma.emma_libs.memEntryCollection
+import Emma.emma_libs.reportDatabase
+
+
+@contextlib.contextmanager
+def recordWarnings():
+    """
+    Context manager that records the warnings that are shown with the SCout logger while it is active. The warnings are still shown as usual.
+    :return: List to which the texts of the warnings are appended (one tuple per warning, with the arguments of sc().warning()).
+    """
+    logger = sc()
+    previousWarning = vars(logger).get("warning")
+    showWarning = logger.warning
+    warnings = []
+
+    def warning(*text, **kwargs):
+        warnings.append(text)
+        return showWarning(*text, **kwargs)
+
+    logger.warning = warning
+    try:
+        yield warnings
+    finally:
+        # Restoring the original method (or the one that was set on the logger before)
+        if previousWarning is None:
+            del logger.warning
+        else:
+            logger.warning = previousWarning
 
 
 class MemoryManager:
@@ -41,7 +74,7 @@ class MemoryManager:
         """
         Settings that influence the operation of the MemoryManager object.
         """
-        def __init__(self, projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt):
+        def __init__(self, projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt, jobs=1, parserEngine=PARSER_ENGINE_LINES, cacheDirectory=None, cacheSize=DEFAULT_CACHE_SIZE_MB, reportFormats=(REPORT_FORMAT_CSV,)):
             self.projectName = projectName
             self.configurationPath = configurationPath
             self.mapfilesPath = mapfilesPath
@@ -50,19 +83,24 @@ class MemoryManager:
             self.createCategories = createCategories
             self.removeUnmatched = removeUnmatched
             self.noPrompt = noPrompt
+            self.jobs = jobs
+            self.parserEngine = parserEngine
+            self.cacheDirectory = cacheDirectory
+            self.cacheSize = cacheSize
+            self.reportFormats = reportFormats
 
-    def __init__(self, projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt):
+    def __init__(self, projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt, jobs=1, parserEngine=PARSER_ENGINE_LINES, cacheDirectory=None, cacheSize=DEFAULT_CACHE_SIZE_MB, reportFormats=(REPORT_FORMAT_CSV,)):
         # pylint: disable=too-many-arguments
         # Rationale: We need to initialize the Settings, so the number of arguments are needed.
 
         # Processing the command line arguments and storing it into the settings member
-        self.settings = MemoryManager.Settings(projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt)
+        self.settings = MemoryManager.Settings(projectName, configurationPath, mapfilesPath, outputPath, analyseDebug, createCategories, removeUnmatched, noPrompt, jobs, parserEngine, cacheDirectory, cacheSize, reportFormats)
         # Check whether the configuration and the mapfiles folders exist
         Emma.shared_libs.emma_helper.checkIfFolderExists(self.settings.mapfilesPath)
         self.configuration = None                   # The configuration is empty at this moment, it can be read in with another method
-        # memoryContent [dict(list(memEntry))]
-        # Each key of this dict represents a configID; dict values are lists of consumerCollections
-        # consumerCollection: [list(memEntry)] lists of memEntry's; e.g. a Section_Summary which contains all memEnty objects per configID)
+        # memoryContent [dict(dict(MemEntryCollection))]
+        # Each key of this dict represents a configID; dict values are dicts of consumerCollections
+        # consumerCollection: [MemEntryCollection] columnar collections of memEntry's; e.g. a Section_Summary which contains all memEnty objects per configID)
         self.memoryContent = None                   # The memory content is empty at this moment, it can be loaded with another method
         self.categorisation = None                  # The categorisation object does not exist yet, it can be created after reading in the configuration
 
@@ -85,6 +123,8 @@ class MemoryManager:
     def processMapfiles(self):
         """
         A method to process the mapfiles.
+        The configIds are independent from each other, so if more than one job is allowed, they will be processed concurrently in worker processes.
+        This is not done if the categories files need to be managed, because that can prompt the user and changes files that are shared between the configIds.
         :return: None
         """
         # If the configuration was already loaded
@@ -93,75 +133,195 @@ class MemoryManager:
             # We will create an empty memory content that will be filled now
             self.memoryContent = {}
 
-            # Processing the mapfiles for every configId
-            for configId in self.configuration.globalConfig:
+            configIds = list(self.configuration.globalConfig)
+            numberOfWorkers = min(self.settings.jobs, len(configIds))
+            if numberOfWorkers > 1 and not self.settings.createCategories and not self.settings.removeUnmatched:
+                sc().info(f"Processing the {len(configIds)} configIds with {numberOfWorkers} jobs...")
+                with concurrent.futures.ProcessPoolExecutor(max_workers=numberOfWorkers) as executor:
+                    # The mapfiles of a configId are processed serially in its worker process
+                    futures = [executor.submit(MemoryManager.processConfigId, configId, self.configuration.globalConfig[configId], self.categorisation, self.settings, 1) for configId in configIds]
+                    # The results are stored in the order of the configIds, regardless of the order in which the jobs finish
+                    for configId, future in zip(configIds, futures):
+                        self.memoryContent[configId] = future.result()
+            else:
+                # Processing the mapfiles for every configId
+                for configId in configIds:
+                    self.memoryContent[configId] = MemoryManager.processConfigId(configId, self.configuration.globalConfig[configId], self.categorisation, self.settings, self.settings.jobs)
+        else:
+            sc().error("The configuration needs to be loaded before processing the mapfiles!")
 
-                # Creating the configId in the memory content
-                self.memoryContent[configId] = {}
+    @staticmethod
+    def processConfigId(configId, configuration, categorisation, settings, mapfileJobs):
+        """
+        Processes the mapfiles of a configId and creates its consumer collections.
+        If the cache is enabled and the inputs of the configId did not change since an earlier run, the consumer collections of that run will be reused and its warnings will be shown again.
+        This is a static method so that it can be run in a worker process as well.
+        :param configId: The configId that will be processed.
+        :param configuration: The configuration that belongs to the configId.
+        :param categorisation: The Categorisation object that will be used to fill out the categories.
+        :param settings: The MemoryManager.Settings that influence the processing.
+        :param mapfileJobs: The maximal number of worker processes the mapfiles of the configId can be processed with.
+        :return: The consumer collections of the configId: dict(MemEntryCollection) with the consumer collection types as keys.
+        """
+        # Creating the cache of the extracted mapfile elements and of the results of the configIds if it was enabled
+        parseCache = None
+        fingerprint = None
+        if settings.cacheDirectory is not None:
+            parseCache = Emma.emma_libs.diskCache.DiskCache(settings.cacheDirectory, settings.cacheSize * 1024 * 1024)
+            # The results can not be reused if the categories files need to be managed, since that is done based on the processed collections
+            if not settings.createCategories and not settings.removeUnmatched:
+                fingerprint = MemoryManager.__createConfigIdFingerprint(configId, configuration, categorisation, settings)
+                if fingerprint is not None:
+                    cachedResults = parseCache.load(fingerprint)
+                    if cachedResults is not None:
+                        cachedConsumerCollections, warnings = cachedResults
+                        sc().info("The inputs of \"" + configId + "\" did not change, reusing its results from the cache.")
+                        # The warnings of the processing are shown again, so a cached run fails with --Werror just like the uncached one
+                        for text in warnings:
+                            sc().warning(*text)
+                        return cachedConsumerCollections
 
-                sc().info("Importing Data for \"" + configId + "\", this may take some time...")
+        if fingerprint is None:
+            return MemoryManager.__createConsumerCollections(configId, configuration, categorisation, settings, mapfileJobs, parseCache)
 
-                # Creating a mapfile processor based on the compiler that was defined for the configId
-                usedCompiler = self.configuration.globalConfig[configId]["compiler"]
-                mapfileProcessor = Emma.emma_libs.mapfileProcessorFactory.createSpecificMapfileProcesor(usedCompiler)
+        # The warnings are recorded so they can be stored in the cache together with the results
+        with recordWarnings() as warnings:
+            consumerCollections = MemoryManager.__createConsumerCollections(configId, configuration, categorisation, settings, mapfileJobs, parseCache)
+        parseCache.store(fingerprint, (consumerCollections, warnings))
 
-                # Importing the mapfile contents for the configId with the created mapfile processor
-                sectionCollection, objectCollection = mapfileProcessor.processMapfiles(configId, self.configuration.globalConfig[configId], self.settings.analyseDebug)
+        return consumerCollections
 
-                # Filling out the categories in the consumerCollections
-                self.categorisation.fillOutCategories(sectionCollection, objectCollection)
+    @staticmethod
+    def __createConsumerCollections(configId, configuration, categorisation, settings, mapfileJobs, parseCache):
+        """
+        Processes the mapfiles of a configId and creates its consumer collections.
+        :param configId: The configId that will be processed.
+        :param configuration: The configuration that belongs to the configId.
+        :param categorisation: The Categorisation object that will be used to fill out the categories.
+        :param settings: The MemoryManager.Settings that influence the processing.
+        :param mapfileJobs: The maximal number of worker processes the mapfiles of the configId can be processed with.
+        :param parseCache: The DiskCache of the extracted mapfile elements or None if the cache is not enabled.
+        :return: The consumer collections of the configId: dict(MemEntryCollection) with the consumer collection types as keys.
+        """
+        consumerCollections = {}
 
-                # Updating the categorisation files from the categorisation keywords and remove the unmatched one based on the settings
-                self.categorisation.manageCategoriesFiles(self.settings.createCategories, self.settings.removeUnmatched, sectionCollection, objectCollection)
+        sc().info("Importing Data for \"" + configId + "\", this may take some time...")
 
-                # Resolving the duplicate, containment and Overlap in the consumerCollections
-                Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(sectionCollection, Emma.emma_libs.memoryEntry.SectionEntry)
-                Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(objectCollection, Emma.emma_libs.memoryEntry.ObjectEntry)
+        # Creating a mapfile processor based on the compiler that was defined for the configId
+        usedCompiler = configuration["compiler"]
+        mapfileProcessor = Emma.emma_libs.mapfileProcessorFactory.createSpecificMapfileProcesor(usedCompiler, jobs=mapfileJobs, parserEngine=settings.parserEngine, parseCache=parseCache)
 
-                # Storing the consumer collections
-                self.memoryContent[configId][FILE_IDENTIFIER_SECTION_SUMMARY] = sectionCollection
-                self.memoryContent[configId][FILE_IDENTIFIER_OBJECT_SUMMARY] = objectCollection
+        # Importing the mapfile contents for the configId with the created mapfile processor
+        sectionCollection, objectCollection = mapfileProcessor.processMapfiles(configId, configuration, settings.analyseDebug)
 
-                # Creating a common consumerCollection
-                self.memoryContent[configId][FILE_IDENTIFIER_OBJECTS_IN_SECTIONS] = Emma.emma_libs.memoryMap.calculateObjectsInSections(self.memoryContent[configId][FILE_IDENTIFIER_SECTION_SUMMARY],
-                                                                                                                                   self.memoryContent[configId][FILE_IDENTIFIER_OBJECT_SUMMARY])
-        else:
-            sc().error("The configuration needs to be loaded before processing the mapfiles!")
+        # Filling out the categories in the consumerCollections
+        categorisation.fillOutCategories(sectionCollection, objectCollection)
+
+        # Updating the categorisation files from the categorisation keywords and remove the unmatched one based on the settings
+        categorisation.manageCategoriesFiles(settings.createCategories, settings.removeUnmatched, sectionCollection, objectCollection)
+
+        # Resolving the duplicate, containment and Overlap in the consumerCollections
+        Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(sectionCollection, Emma.emma_libs.memoryEntry.SectionEntry)
+        Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(objectCollection, Emma.emma_libs.memoryEntry.ObjectEntry)
+
+        # Storing the consumer collections
+        consumerCollections[FILE_IDENTIFIER_SECTION_SUMMARY] = sectionCollection
+        consumerCollections[FILE_IDENTIFIER_OBJECT_SUMMARY] = objectCollection
+
+        # Creating a common consumerCollection
+        consumerCollections[FILE_IDENTIFIER_OBJECTS_IN_SECTIONS] = Emma.emma_libs.memoryMap.calculateObjectsInSections(consumerCollections[FILE_IDENTIFIER_SECTION_SUMMARY],
+                                                                                                                    consumerCollections[FILE_IDENTIFIER_OBJECT_SUMMARY])
+
+        # Storing the processed collections in columnar form, this needs much less memory and is much faster to transfer from the worker processes and to cache
+        for collectionType in consumerCollections:
+            consumerCollections[collectionType] = Emma.emma_libs.memEntryCollection.MemEntryCollection(consumerCollections[collectionType])
+
+        return consumerCollections
+
+    @staticmethod
+    def __createConfigIdFingerprint(configId, configuration, categorisation, settings):
+        """
+        Creates the fingerprint of the inputs of a configId. The consumer collections of the configId are cached with this key.
+        The fingerprint covers the configuration of the configId (its globalConfig entry, addressSpaces, patterns, virtualSections and the monolith table),
+        the content of the categories files, the content of the mapfiles and the settings that influence the processing.
+        :param configId: The configId.
+        :param configuration: The configuration that belongs to the configId.
+        :param categorisation: The Categorisation object that will be used to fill out the categories.
+        :param settings: The MemoryManager.Settings that influence the processing.
+        :return: The fingerprint or None if one of the mapfiles could not be read (in this case the error will be reported by the processing).
+        """
+        mapfileHashes = []
+        try:
+            for mapfile in configuration.get("patterns", {}).get("mapfiles", {}).values():
+                mapfileHashes.append(Emma.emma_libs.diskCache.hashFile(mapfile["associatedFilename"]).hexdigest())
+        except (OSError, KeyError):
+            return None
+        # The sets are replaced by sorted lists, since the order of their elements can differ between the runs
+        configurationItems = [(key, sorted(value) if isinstance(value, (set, frozenset)) else value) for key, value in configuration.items()]
+        categories = (categorisation.categoriesSections, categorisation.categoriesSectionsKeywords, categorisation.categoriesObjects, categorisation.categoriesObjectsKeywords)
+        return Emma.emma_libs.diskCache.DiskCache.createKey(CONFIG_ID_CACHE_KEY_TAG, configId, configurationItems, categories, mapfileHashes, settings.analyseDebug)
+
+    def groupConsumerCollectionsByType(self):
+        """
+        Groups each type of consumerCollection (memoryContent: dict(MemEntryCollection) -> consumerCollections: dict(list(MemEntryCollection)))
+        The collections of the configIDs are not concatenated, the reports are streamed from them one after the other.
+        :return: [dict(list(MemEntryCollection))] The consumerCollections of the configIDs per type (Section_Summary, Object_Summary, Objects_in_Sections)
+        """
+        # Putting the same consumer collection types together
+        # (At this points the collections are grouped by configID then by their types)
+        consumerCollections = {}
+        for configId in self.memoryContent:
+            for collectionType in self.memoryContent[configId]:
+                consumerCollections.setdefault(collectionType, []).append(self.memoryContent[configId][collectionType])
+        return consumerCollections
+
+    def createReportFrames(self):
+        """
+        Creates the reports as pandas DataFrames, so they can be processed in the same process (e.g. by the Emma Visualiser) without writing and parsing files.
+        :return: [dict(DataFrame)] The reports per consumerCollection type, these are the same as the DataFrames read from the CSV reports
+        """
+        if self.memoryContent is None:
+            sc().error("The mapfiles need to be processed before creating the reports!")
+        consumerCollections = self.groupConsumerCollectionsByType()
+        return {collectionType: Emma.shared_libs.reportBundle.createReportFrame(*Emma.emma_libs.memoryMap.createReport(consumerCollections[collectionType]))
+                for collectionType in consumerCollections}
 
     def createReports(self):
         """
         Creates the reports
         :return: None
         """
-        def consumerCollections2GlobalList():
-            """
-            Concatenate each type of consumerCollection (memoryContent: dict(list(memEntry)) -> consumerCollection: list(list(memEntry)))
-            Concatenates all values (per list (Section_Summary, Object_Summary, Objects_in_Sections)) within the memoryContent dict (-> keys are configIDs)
-            :return: [list(list(memEntry))] Concatenated list of consumerCollections
-            """
-            # Putting the same consumer collection types together
-            # (At this points the collections are grouped by configID then by their types)
-            consumerCollections = {}
-            for configId in self.memoryContent:
-                for collectionType in self.memoryContent[configId]:
-                    if collectionType not in consumerCollections:
-                        consumerCollections[collectionType] = []
-                    consumerCollections[collectionType].extend(self.memoryContent[configId][collectionType])
-            return consumerCollections
-
-
         def createStandardReports():
             """
             Create Section, Object and ObjectsInSections reports
             :return: None
             """
-            consumerCollections = consumerCollections2GlobalList()
+            consumerCollections = self.groupConsumerCollectionsByType()
 
             # Creating reports from the consumer collections
-            for collectionType in consumerCollections:
-                reportPath = Emma.emma_libs.memoryMap.createReportPath(self.settings.outputPath, self.settings.projectName, collectionType)
-                Emma.emma_libs.memoryMap.writeReportToDisk(reportPath, consumerCollections[collectionType])
-                sc().info("A report was stored:", os.path.abspath(reportPath))
+            if REPORT_FORMAT_CSV in self.settings.reportFormats:
+                for collectionType in consumerCollections:
+                    reportPath = Emma.emma_libs.memoryMap.createReportPath(self.settings.outputPath, self.settings.projectName, collectionType)
+                    Emma.emma_libs.memoryMap.streamReportToDisk(reportPath, consumerCollections[collectionType])
+                    sc().info("A report was stored:", os.path.abspath(reportPath))
+
+            # Creating a database with all the consumer collections
+            if REPORT_FORMAT_SQLITE in self.settings.reportFormats:
+                databasePath = Emma.emma_libs.memoryMap.createReportPath(self.settings.outputPath, self.settings.projectName, SQLITE_REPORT_NAME, SQLITE_FILE_EXTENSION)
+                compilersOfConfigIds = {configId: self.configuration.globalConfig[configId]["compiler"] for configId in self.memoryContent}
+                Emma.emma_libs.reportDatabase.writeDatabaseToDisk(databasePath, consumerCollections, self.settings.projectName, compilersOfConfigIds)
+                sc().info("A database was stored:", os.path.abspath(databasePath))
+
+            # Creating a bundle with the columns of all the consumer collections
+            if REPORT_FORMAT_NPZ in self.settings.reportFormats:
+                bundlePath = Emma.emma_libs.memoryMap.createReportPath(self.settings.outputPath, self.settings.projectName, BUNDLE_REPORT_NAME, BUNDLE_FILE_EXTENSION)
+                reports = {collectionType: Emma.emma_libs.memoryMap.createReport(consumerCollections[collectionType]) for collectionType in consumerCollections}
+                metadata = {"projectName": self.settings.projectName,
+                            "timestamp": Emma.emma_libs.memoryMap.TIMESTAMP,
+                            "emmaVersion": Emma.EMMA_VERSION,
+                            "compilersOfConfigIds": {configId: self.configuration.globalConfig[configId]["compiler"] for configId in self.memoryContent}}
+                Emma.shared_libs.reportBundle.writeBundleToDisk(bundlePath, reports, metadata)
+                sc().info("A bundle was stored:", os.path.abspath(bundlePath))
 
         # def createDotReports():
         #     GLOBAL_ATTRIBUTES = {
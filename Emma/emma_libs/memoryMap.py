@@ -18,14 +18,18 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 
 
 import csv
-import bisect
-import copy
+import heapq
 import datetime
+import functools
+import collections
+import itertools
 
 from pypiscout.SCout_Logger import Logger as sc
 
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 import Emma.shared_libs.emma_helper
+import Emma.emma_libs.memoryEntry
+import Emma.emma_libs.memEntryCollection
 
 
 # Timestamp for the report file names
@@ -33,69 +37,119 @@ TIMESTAMP = datetime.datetime.now().strftime("%Y-%m-%d-%Hh%Ms%S")
 
 
 def resolveDuplicateContainmentOverlap(consumerCollection, memEntryHandler):
-    # pylint: disable=too-many-nested-blocks, too-many-branches
-    # Rationale: Because of the complexity of the task this function implements, reducing the number of nested blocks and branches is not possible.
-
     """
     Goes trough the consumerCollection and checks  and resolves all the elements for the following situations:
         - Duplicate
         - Containment
         - Overlap
 
+    Every element is compared with the other elements in the order of the consumerCollection, in the same way as if every element was compared with every other one.
+    However, the elements that can not have an effect on each other are not compared: these are the ones of other configIDs and the ones with separated address ranges.
+    The resolution only shrinks the address ranges of the elements, so the pairs whose original address ranges are separated stay separated.
+    These pairs are excluded in advance with a sweep-line, so the complexity is O(n log n + k), where k is the number of the pairs with intersecting address ranges.
+
     :param consumerCollection: A list of MemEntry objects. It must be ordered increasingly based on the startAddress attribute of the elements.
                                The elements of the list will be changed during the processing.
     :param memEntryHandler: A subclass of the MemEntryHandler class.
     :return: None
     """
-    for actualElement in consumerCollection:
-        for otherElement in consumerCollection:
+    intersectingElements = collectIntersectingElements(consumerCollection)
+    for actualIndex, actualElement in enumerate(consumerCollection):
+        # The intersecting elements are compared in the order of the consumerCollection
+        for otherIndex in sorted(intersectingElements.get(actualIndex, ())):
+            resolveElementPair(actualElement, consumerCollection[otherIndex], memEntryHandler)
 
-            # Don't compare element with itself and only compare the same configID
-            if actualElement.equalConfigID(otherElement) and not memEntryHandler.isEqual(actualElement, otherElement):
 
-                # Case 0: actualElement and otherElement are completely separated : the otherElement begins only after the actualElement or the actualElement begins only after the otherElement
-                if (actualElement.addressStart + actualElement.addressLength) <= otherElement.addressStart or actualElement.addressStart >= (otherElement.addressStart + otherElement.addressLength):
-                    # There is not much to do here...
-                    pass
+def collectIntersectingElements(consumerCollection):
+    """
+    Function to collect the pairs of elements of the same configID whose address ranges intersect, with a sweep-line over the start addresses.
+    Two elements intersect if neither of them ends before the other one starts (the same check as in the Case 0 of the resolveElementPair()),
+    so an element with zero length intersects the elements that contain its address but do not start at it.
+    :param consumerCollection: A list of MemEntry objects.
+    :return: A dictionary with the indexes of the elements as keys and the lists of the indexes of their intersecting elements as values (the elements without intersections are missing).
+    """
+    intersectingElements = collections.defaultdict(list)
+
+    # The elements of the configIDs are handled separately, they can not have an effect on each other
+    indexesOfConfigIds = collections.defaultdict(list)
+    for index, element in enumerate(consumerCollection):
+        indexesOfConfigIds[element.configID].append(index)
+
+    for indexes in indexesOfConfigIds.values():
+        # The address ranges [start, end) of the elements, ordered by their start addresses
+        addressRanges = sorted((consumerCollection[index].addressStart, consumerCollection[index].addressStart + consumerCollection[index].addressLength, index) for index in indexes)
+        # The elements that were already swept and end after the actual sweep position, ordered by their end addresses
+        activeElements = []
+        for addressStart, addressEnd, index in addressRanges:
+            # Removing the elements that end before the actual one starts, these can not intersect with any of the following elements either
+            while activeElements and activeElements[0][0] <= addressStart:
+                heapq.heappop(activeElements)
+            for otherAddressEnd, otherAddressStart, otherIndex in activeElements:
+                if otherAddressStart < addressEnd and addressStart < otherAddressEnd:
+                    intersectingElements[index].append(otherIndex)
+                    intersectingElements[otherIndex].append(index)
+            heapq.heappush(activeElements, (addressEnd, addressStart, index))
+
+    return intersectingElements
+
+
+def resolveElementPair(actualElement, otherElement, memEntryHandler):
+    # pylint: disable=too-many-nested-blocks, too-many-branches
+    # Rationale: Because of the complexity of the task this function implements, reducing the number of nested blocks and branches is not possible.
+
+    """
+    Checks and resolves the duplicate, containment or overlap situation of an element with another element. Only the actualElement will be changed.
+    :param actualElement: The MemEntry object that is being resolved.
+    :param otherElement: The MemEntry object the actualElement is compared with.
+    :param memEntryHandler: A subclass of the MemEntryHandler class.
+    :return: None
+    """
+    # Don't compare element with itself and only compare the same configID
+    if actualElement.equalConfigID(otherElement) and not memEntryHandler.isEqual(actualElement, otherElement):
+
+        # Case 0: actualElement and otherElement are completely separated : the otherElement begins only after the actualElement or the actualElement begins only after the otherElement
+        if (actualElement.addressStart + actualElement.addressLength) <= otherElement.addressStart or actualElement.addressStart >= (otherElement.addressStart + otherElement.addressLength):
+            # There is not much to do here...
+            pass
+        else:
+            # Case 1: actualElement and otherElement are duplicates
+            if actualElement.addressStart == otherElement.addressStart and actualElement.addressLength == otherElement.addressLength:
+                # Setting the actualElement´s duplicateFlag if it was not already set
+                if actualElement.duplicateFlag is None:
+                    actualElement.duplicateFlag =  otherElement.configID + "::" + otherElement.mapfile + "::"  + otherElement.sectionName + ( "::"  + otherElement.objectName if otherElement.objectName != "" else "")
+                # Setting the actualElement to zero addressLength if this was not the first element of the duplicates
+                # This is needed to include only one of the duplicate elements with the real size in the report and not to distort the results
+                if otherElement.duplicateFlag is not None:
+                    actualElement.addressLength = 0
+            else:
+                # Case 2: actualElement contains otherElement
+                if actualElement.addressStart <= otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) >= (otherElement.addressStart + otherElement.addressLength):
+                    actualElement.containingOthersFlag = True
                 else:
-                    # Case 1: actualElement and otherElement are duplicates
-                    if actualElement.addressStart == otherElement.addressStart and actualElement.addressLength == otherElement.addressLength:
-                        # Setting the actualElement´s duplicateFlag if it was not already set
-                        if actualElement.duplicateFlag is None:
-                            actualElement.duplicateFlag =  otherElement.configID + "::" + otherElement.mapfile + "::"  + otherElement.sectionName + ( "::"  + otherElement.objectName if otherElement.objectName != "" else "")
-                        # Setting the actualElement to zero addressLength if this was not the first element of the duplicates
-                        # This is needed to include only one of the duplicate elements with the real size in the report and not to distort the results
-                        if otherElement.duplicateFlag is not None:
+                    # Case 3: actualElement is contained by otherElement
+                    if actualElement.addressStart >= otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) <= (otherElement.addressStart + otherElement.addressLength):
+                        # Setting the actualElement´s containmentFlag if it was not already set
+                        if actualElement.containmentFlag is None:
+                            actualElement.containmentFlag = otherElement.configID + "::" + otherElement.mapfile + "::"  + otherElement.sectionName + ( "::"  + otherElement.objectName if otherElement.objectName != "" else "")
+                            # Setting the actualElement to zero addressLength because this was contained by the otherElement
+                            # This is needed to include only one of these elements with the real size in the report and not to distort the results
                             actualElement.addressLength = 0
                     else:
-                        # Case 2: actualElement contains otherElement
-                        if actualElement.addressStart <= otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) >= (otherElement.addressStart + otherElement.addressLength):
-                            actualElement.containingOthersFlag = True
+                        # Case 4: actualElement overlaps otherElement: otherElement starts inside and ends outside actualElement
+                        if actualElement.addressStart < otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) < (otherElement.addressStart + otherElement.addressLength):
+                            actualElement.overlappingOthersFlag = True
                         else:
-                            # Case 3: actualElement is contained by otherElement
-                            if actualElement.addressStart >= otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) <= (otherElement.addressStart + otherElement.addressLength):
-                                # Setting the actualElement´s containmentFlag if it was not already set
-                                if actualElement.containmentFlag is None:
-                                    actualElement.containmentFlag = otherElement.configID + "::" + otherElement.mapfile + "::"  + otherElement.sectionName + ( "::"  + otherElement.objectName if otherElement.objectName != "" else "")
-                                    # Setting the actualElement to zero addressLength because this was contained by the otherElement
-                                    # This is needed to include only one of these elements with the real size in the report and not to distort the results
-                                    actualElement.addressLength = 0
+                            # Case 5: actualElement is overlapped by otherElement: otherElement starts before and ends inside actualElement
+                            if actualElement.addressStart > otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) > (otherElement.addressStart + otherElement.addressLength):
+                                actualElement.overlapFlag =  otherElement.configID + "::" + otherElement.mapfile + "::"  + otherElement.sectionName + ( "::"  + otherElement.objectName if otherElement.objectName != "" else "")
+                                # Adjusting the addresses and length of the actualElement: reducing its size by the overlapping part
+                                newAddressStart = otherElement.addressStart + otherElement.addressLength
+                                sizeOfOverlappingPart = newAddressStart - actualElement.addressStart
+                                actualElement.addressStart = newAddressStart
+                                actualElement.addressLength -= sizeOfOverlappingPart
+                            # Case X: SW error, unhandled case...
                             else:
-                                # Case 4: actualElement overlaps otherElement: otherElement starts inside and ends outside actualElement
-                                if actualElement.addressStart < otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) < (otherElement.addressStart + otherElement.addressLength):
-                                    actualElement.overlappingOthersFlag = True
-                                else:
-                                    # Case 5: actualElement is overlapped by otherElement: otherElement starts before and ends inside actualElement
-                                    if actualElement.addressStart > otherElement.addressStart and (actualElement.addressStart + actualElement.addressLength) > (otherElement.addressStart + otherElement.addressLength):
-                                        actualElement.overlapFlag =  otherElement.configID + "::" + otherElement.mapfile + "::"  + otherElement.sectionName + ( "::"  + otherElement.objectName if otherElement.objectName != "" else "")
-                                        # Adjusting the addresses and length of the actualElement: reducing its size by the overlapping part
-                                        newAddressStart = otherElement.addressStart + otherElement.addressLength
-                                        sizeOfOverlappingPart = newAddressStart - actualElement.addressStart
-                                        actualElement.addressStart = newAddressStart
-                                        actualElement.addressLength -= sizeOfOverlappingPart
-                                    # Case X: SW error, unhandled case...
-                                    else:
-                                        sc().error("MemoryManager::resolveOverlap(): Case X: SW error, unhandled case...")
+                                sc().error("MemoryManager::resolveOverlap(): Case X: SW error, unhandled case...")
 
 
 def calculateObjectsInSections(sectionContainer, objectContainer):
@@ -112,7 +166,8 @@ def calculateObjectsInSections(sectionContainer, objectContainer):
                             The overlapping, containing, duplicate sections must be are already edited and the addresses and lengths corrected.
     :return: A list of MemEntry objects that contains all the elements of the sectionContainer and the objectContainer.
     """
-    objectsInSections = []
+    # The section entries and the section reserves in the order they were created, this is ordered by the start addresses in most of the cases
+    sectionEntriesAndReserves = []
 
     def createASectionEntry(sourceSection):
         """
@@ -120,10 +175,7 @@ def calculateObjectsInSections(sectionContainer, objectContainer):
         :param sourceSection: MemEntry object to create a section entry from.
         :return: None
         """
-        sectionEntry = copy.deepcopy(sourceSection)
-        sectionEntry.objectName = OBJECTS_IN_SECTIONS_SECTION_ENTRY
-        sectionEntry.addressLength = 0
-        objectsInSections.append(sectionEntry)
+        sectionEntriesAndReserves.append(sourceSection.createDerivedEntry(objectName=OBJECTS_IN_SECTIONS_SECTION_ENTRY, addressLength=0))
 
     def createASectionReserve(sourceSection, addressEnd=None):
         """
@@ -134,17 +186,16 @@ def calculateObjectsInSections(sectionContainer, objectContainer):
         :return: None
         """
         # If we have received a specific addressEnd then we will use that one and recalculate the size of the section
-        # In this case we need to make a deepcopy of the sourceSection because the SW will continue to work with it
+        # In this case we need to derive a new entry from the sourceSection because the SW will continue to work with it
         if addressEnd is not None:
-            sourceSectionCopy = copy.deepcopy(sourceSection)
-            sourceSectionCopy.objectName = OBJECTS_IN_SECTIONS_SECTION_RESERVE
-            sourceSectionCopy.setAddressesGivenEnd(addressEnd)
-            objectsInSections.append(sourceSectionCopy)
+            sectionReserve = sourceSection.createDerivedEntry(objectName=OBJECTS_IN_SECTIONS_SECTION_RESERVE)
+            sectionReserve.setAddressesGivenEnd(addressEnd)
+            sectionEntriesAndReserves.append(sectionReserve)
         # If not, then the whole sourceSection will be stored as a reserve
         # In this case no copy needed because the SW does not need it anymore
         else:
             sourceSection.objectName = OBJECTS_IN_SECTIONS_SECTION_RESERVE
-            objectsInSections.append(sourceSection)
+            sectionEntriesAndReserves.append(sourceSection)
 
     def cutOffTheBeginningOfTheSection(sectionToCut, newAddressStart):
         """
@@ -163,7 +214,15 @@ def calculateObjectsInSections(sectionContainer, objectContainer):
                        sectionToCut.configID + "::" + sectionToCut.sectionName + ": The new newAddressStart(" +
                        str(newAddressStart) + ") would cause a cut that is bigger than the addressLength! (" + str(lengthThatWillBeCutOff) + "vs " + str(sectionToCut.addressLengthing) + ")")
 
-    for sectionContainerElement in sectionContainer:
+    # The objects of the configIDs in the order of the objectContainer, so the sections only need to look at the objects of their own configID
+    objectsOfConfigIds = collections.defaultdict(list)
+    for objectContainerElement in objectContainer:
+        objectsOfConfigIds[objectContainerElement.configID].append(objectContainerElement)
+    # The index of the first object of every configID that can still be inside one of the remaining sections, these only move forward
+    objectCursors = collections.defaultdict(int)
+    lowestRemainingSectionStarts = collectLowestRemainingSectionStarts(sectionContainer)
+
+    for sectionIndex, sectionContainerElement in enumerate(sectionContainer):
         # Creating a section entry
         createASectionEntry(sectionContainerElement)
 
@@ -174,15 +233,24 @@ def calculateObjectsInSections(sectionContainer, objectContainer):
             continue
 
         # This is the section we are working with in this loop. We will take it apart and create other objects from it.
-        # In order not to have any influence on the original sectionContainer elements, we will create a copy of it
-        sectionCopy = copy.deepcopy(sectionContainerElement)
-
-        for objectContainerElement in objectContainer:
+        # In order not to have any influence on the original sectionContainer elements, we will work with an entry derived from it
+        sectionCopy = sectionContainerElement.createDerivedEntry()
+
+        # Moving the cursor past the objects that have a zero length or end before all the remaining sections of the configID start,
+        # these can not be in this section or in any of the following ones
+        objects = objectsOfConfigIds.get(sectionCopy.configID, [])
+        objectCursor = objectCursors[sectionCopy.configID]
+        lowestRemainingSectionStart = lowestRemainingSectionStarts[sectionIndex]
+        while objectCursor < len(objects) and (objects[objectCursor].addressLength == 0 or (objects[objectCursor].addressStart + objects[objectCursor].addressLength) <= lowestRemainingSectionStart):
+            objectCursor += 1
+        objectCursors[sectionCopy.configID] = objectCursor
+
+        for objectIndex in range(objectCursor, len(objects)):
+            objectContainerElement = objects[objectIndex]
             # We will skip the objects if:
-            #   - is not belonging to the same configID as the section
-            #   - or have a zero length or
+            #   - have a zero length or
             #   - if it ends before this section, because it means that this object is outside the section.
-            if sectionCopy.configID != objectContainerElement.configID or objectContainerElement.addressLength == 0 or sectionCopy.addressStart >= (objectContainerElement.addressStart + objectContainerElement.addressLength):
+            if objectContainerElement.addressLength == 0 or sectionCopy.addressStart >= (objectContainerElement.addressStart + objectContainerElement.addressLength):
                 continue
 
             # Case 0: The object is completely overlapping the section
@@ -246,108 +314,253 @@ def calculateObjectsInSections(sectionContainer, objectContainer):
         if sectionCopy is not None:
             createASectionReserve(sectionCopy, None)
 
-    # We will need to add all the objects to the objectsInSections
-    # In order not to have any influence on the original objectContainer elements, we will create a copy of the elements
-    for objectContainerElement in objectContainer:
-        index = bisect.bisect_right(objectsInSections, objectContainerElement)
-        objectsInSections.insert(index, copy.deepcopy(objectContainerElement))
+    # Merging the section entries and reserves with entries derived from the objects (so the original objectContainer elements are not influenced)
+    return mergeSectionsAndObjects(sectionEntriesAndReserves, objectContainer)
 
-    return objectsInSections
+
+def collectLowestRemainingSectionStarts(sectionContainer):
+    """
+    Function to collect for every section the lowest start address of the sections of its configID that are not preceding it in the sectionContainer.
+    Only the sections that will be taken apart by the calculateObjectsInSections() are considered (not contained ones and not zero length ones).
+    The objects that end before this address can not be in any of the remaining sections of the configID.
+    This is needed because the sectionContainer is not necessarily ordered anymore after the overlaps of the sections were cut off.
+    :param sectionContainer: A list of MemEntry objects.
+    :return: List with the lowest start address (or None) for every element of the sectionContainer.
+    """
+    lowestRemainingSectionStarts = [None] * len(sectionContainer)
+    lowestSectionStartsOfConfigIds = {}
+    for sectionIndex in reversed(range(len(sectionContainer))):
+        section = sectionContainer[sectionIndex]
+        if section.containmentFlag is None and section.addressLength != 0:
+            lowestSectionStart = lowestSectionStartsOfConfigIds.get(section.configID)
+            if lowestSectionStart is None or section.addressStart < lowestSectionStart:
+                lowestSectionStartsOfConfigIds[section.configID] = section.addressStart
+        lowestRemainingSectionStarts[sectionIndex] = lowestSectionStartsOfConfigIds.get(section.configID)
+    return lowestRemainingSectionStarts
+
+
+def mergeSectionsAndObjects(sectionEntriesAndReserves, objectContainer):
+    """
+    Function to merge the section entries and reserves with the entries derived from the objects into a list ordered by the start addresses.
+    At equal start addresses the section entries and reserves come before the objects, otherwise the order of both lists is kept.
+    If both lists are ordered (this is the usual case), they are merged with two pointers, otherwise the concatenated list is sorted (stable).
+    :param sectionEntriesAndReserves: A list of MemEntry objects.
+    :param objectContainer: A list of MemEntry objects, entries derived from these will be added to the result.
+    :return: The merged list of MemEntry objects.
+    """
+    if not isOrderedByAddressStart(sectionEntriesAndReserves) or not isOrderedByAddressStart(objectContainer):
+        mergedEntries = sectionEntriesAndReserves + [objectContainerElement.createDerivedEntry() for objectContainerElement in objectContainer]
+        Emma.emma_libs.memoryEntry.sortMemEntries(mergedEntries)
+        return mergedEntries
+
+    mergedEntries = []
+    objectIndex = 0
+    numberOfObjects = len(objectContainer)
+    for sectionEntryOrReserve in sectionEntriesAndReserves:
+        while objectIndex < numberOfObjects and objectContainer[objectIndex].addressStart < sectionEntryOrReserve.addressStart:
+            mergedEntries.append(objectContainer[objectIndex].createDerivedEntry())
+            objectIndex += 1
+        mergedEntries.append(sectionEntryOrReserve)
+    mergedEntries.extend(objectContainer[objectIndex].createDerivedEntry() for objectIndex in range(objectIndex, numberOfObjects))
+    return mergedEntries
+
+
+def isOrderedByAddressStart(memEntries):
+    """
+    Function to check whether a list of MemEntry objects is ordered increasingly by the addressStart attribute of the elements.
+    :param memEntries: A list of MemEntry objects.
+    :return: True if the list is ordered, False otherwise.
+    """
+    return all(previous.addressStart <= following.addressStart for previous, following in zip(memEntries, itertools.islice(memEntries, 1, None)))
 
 
-def createReportPath(outputPath, projectName, reportName):
+def createReportPath(outputPath, projectName, reportName, fileExtension=CSV_FILE_EXTENSION):
     """
     Function to create a string representing the path of a report.
     :param outputPath: The folder where the report will be.
     :param projectName: The name of the project.
     :param reportName: The name of the report.
+    :param fileExtension: The extension of the report file.
     :return: The created path string.
     """
     Emma.shared_libs.emma_helper.mkDirIfNeeded(outputPath)
-    memStatsFileName = projectName + "_" + reportName + "_" + TIMESTAMP + ".csv"
+    memStatsFileName = projectName + "_" + reportName + "_" + TIMESTAMP + fileExtension
     return Emma.shared_libs.emma_helper.joinPath(outputPath, memStatsFileName)
 
 
-def collectCompilerSpecificHeaders(consumerCollection):
+def collectCompilerSpecificHeaders(consumerCollections):
     """
-    Function to create a list of the headers that the compiler specific data of a consumer collection has.
-    :param consumerCollection: The consumer collection that has elements with compiler specific data.
-    :return: List of strings.
+    Function to create a list of the headers that the compiler specific data of consumer collections have.
+    :param consumerCollections: List of consumer collections that have elements with compiler specific data.
+    :return: List of strings in the order of their first appearance.
     """
     collectedHeaders = []
 
-    for element in consumerCollection:
-        for key in element.compilerSpecificData.keys():
+    for consumerCollection in consumerCollections:
+        # The columnar collections store every different compiler specific data only once, so these do not need to be checked row-by-row
+        if isinstance(consumerCollection, Emma.emma_libs.memEntryCollection.MemEntryCollection):
+            headersOfTheCollection = consumerCollection.compilerSpecificHeaders()
+        else:
+            headersOfTheCollection = (key for element in consumerCollection for key in element.compilerSpecificData.keys())
+        for key in headersOfTheCollection:
             if key not in collectedHeaders:
                 collectedHeaders.append(key)
 
     return collectedHeaders
 
 
+# The human readable format of the sizes, these are cached because the same sizes repeat many times in the reports
+toHumanReadableCached = functools.lru_cache(maxsize=REPORT_HUMAN_READABLE_SIZE_CACHE_SIZE)(Emma.shared_libs.emma_helper.toHumanReadable)
+
+# The attributes of the MemEntry objects that the reports are created from, in the order they are used by the createReportRow()
+REPORT_ATTRIBUTES = ("addressStart", "addressLength", "addressStartOriginal", "addressLengthOriginal", "sectionName", "objectName", "configID", "compilerSpecificData",
+                     "memType", "memTypeTag", "category", "mapfile", "overlapFlag", "containmentFlag", "duplicateFlag", "containingOthersFlag")
+
+
+def createReportRow(values):
+    # pylint: disable=too-many-locals
+    # Rationale: Every value of a report row is needed.
+
+    """
+    Function to create the data of a report row from the attributes of a MemEntry object.
+    :param values: The values of the REPORT_ATTRIBUTES of the MemEntry object. Instead of the compiler specific data, the tuple of its values for the
+                   compiler specific headers of the report is expected (see createReportRows()).
+    :return: The list of the values of the CSV row.
+    """
+    addressStart, addressLength, addressStartOriginal, addressLengthOriginal, sectionName, objectName, configID, compilerSpecificValues, \
+        memType, memTypeTag, category, mapfile, overlapFlag, containmentFlag, duplicateFlag, containingOthersFlag = values
+    isSectionEntry = (objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY)
+    # By definition the elements with 0 addressLength do not have end addresses
+    addressEnd = (addressStart + addressLength - 1) if addressLength > 0 else None
+    addressEndOriginal = (addressStartOriginal + addressLengthOriginal - 1) if addressLengthOriginal > 0 else None
+
+    # Collecting the first part of the static data for the current row
+    rowData = [
+        hex(addressStart) if not isSectionEntry else "",
+        (hex(addressEnd) if addressEnd is not None else "") if not isSectionEntry else "",
+        hex(addressLength) if not isSectionEntry else "",
+        addressStart if not isSectionEntry else "",
+        addressEnd if not isSectionEntry else "",
+        addressLength if not isSectionEntry else "",
+        toHumanReadableCached(addressLength) if not isSectionEntry else "",
+        sectionName,
+        objectName,
+        configID
+    ]
+
+    # Extending it with the data part of the compiler specific data pairs of this MemEntry object
+    rowData.extend(compilerSpecificValues)
+
+    # Collecting the rest of the static data for the current row
+    rowData.extend([
+        memType,
+        memTypeTag,
+        category,
+        mapfile,
+        overlapFlag,
+        containmentFlag,
+        duplicateFlag,
+        containingOthersFlag,
+        # Addresses are modified in case of overlapping so we will post the original values so that the changes can be seen
+        hex(addressStartOriginal) if (isSectionEntry or (overlapFlag is not None)) else "",
+        (hex(addressEndOriginal) if addressEndOriginal is not None else "") if (isSectionEntry or (overlapFlag is not None)) else "",
+        # Lengths are modified in case of overlapping, containment and duplication so we will post the original values so that the changes can be seen
+        hex(addressLengthOriginal) if (isSectionEntry or (overlapFlag is not None) or (containmentFlag is not None) or (duplicateFlag is not None)) else "",
+        addressLengthOriginal if (isSectionEntry or (overlapFlag is not None) or (containmentFlag is not None) or (duplicateFlag is not None)) else "",
+        # FQN (see MemEntry.getFQN())
+        configID + "::" + mapfile + "::" + sectionName + ("::" + objectName if objectName not in ("", OBJECTS_IN_SECTIONS_SECTION_ENTRY, OBJECTS_IN_SECTIONS_SECTION_RESERVE) else "")
+    ])
+    return rowData
+
+
+def createReportRows(consumerCollection, compilerSpecificHeaders, start, stop):
+    """
+    Function to create the data of a batch of report rows from a columnar collection.
+    The columns of the batch are taken from the collection at once and the compiler specific values are only looked up once for every different compiler specific data.
+    :param consumerCollection: A MemEntryCollection object.
+    :param compilerSpecificHeaders: The compiler specific headers of the report.
+    :param start: The index of the first row of the batch.
+    :param stop: The index after the last row of the batch.
+    :return: List of the lists of the values of the CSV rows.
+    """
+    compilerSpecificDataColumn = consumerCollection.dictionaryColumns["compilerSpecificData"]
+    compilerSpecificValuesOfCodes = [tuple(compilerSpecificData[compilerSpecificHeader] if compilerSpecificHeader in compilerSpecificData else "" for compilerSpecificHeader in compilerSpecificHeaders)
+                                     for compilerSpecificData in compilerSpecificDataColumn.values]
+    columns = [consumerCollection.column(attribute, start, stop) if attribute != "compilerSpecificData" else map(compilerSpecificValuesOfCodes.__getitem__, compilerSpecificDataColumn.codes[start:stop])
+               for attribute in REPORT_ATTRIBUTES]
+    return [createReportRow(values) for values in zip(*columns)]
+
+
+def createReportRowBatches(consumerCollections, compilerSpecificHeaders):
+    """
+    Function to create the data of the report rows of more consumer collections in batches of REPORT_WRITE_BATCH_SIZE rows.
+    :param consumerCollections: A list of consumer collections, these are lists of MemEntry objects or MemEntryCollection objects.
+    :param compilerSpecificHeaders: The compiler specific headers of the report.
+    :return: Iterator over the batches, these are lists of the lists of the values of the rows (see createReportRows()).
+    """
+    for consumerCollection in consumerCollections:
+        # The rows are created from the columns of a columnar collection, the lists of MemEntry objects are converted first
+        if not isinstance(consumerCollection, Emma.emma_libs.memEntryCollection.MemEntryCollection):
+            consumerCollection = Emma.emma_libs.memEntryCollection.MemEntryCollection(consumerCollection)
+        for start in range(0, len(consumerCollection), REPORT_WRITE_BATCH_SIZE):
+            yield createReportRows(consumerCollection, compilerSpecificHeaders, start, start + REPORT_WRITE_BATCH_SIZE)
+
+
+def createReportHeaders(compilerSpecificHeaders):
+    """
+    Function to create the headers of a report, these are in the order of the values of the rows created by the createReportRow().
+    :param compilerSpecificHeaders: The compiler specific headers of the report.
+    :return: List of strings.
+    """
+    # Creating the list with the first part of the static headers
+    headers = [ADDR_START_HEX, ADDR_END_HEX, SIZE_HEX, ADDR_START_DEC, ADDR_END_DEC, SIZE_DEC, SIZE_HUMAN_READABLE, SECTION_NAME, OBJECT_NAME, CONFIG_ID]
+
+    # Extending it with the compiler specific headers
+    headers.extend(compilerSpecificHeaders)
+
+    # Collecting the rest of the static headers
+    headers.extend([MEM_TYPE, MEM_TYPE_TAG, CATEGORY, MAPFILE, OVERLAP_FLAG, CONTAINMENT_FLAG, DUPLICATE_FLAG, CONTAINING_OTHERS_FLAG, ADDR_START_HEX_ORIGINAL, ADDR_END_HEX_ORIGINAL, SIZE_HEX_ORIGINAL, SIZE_DEC_ORIGINAL, FQN])
+    return headers
+
+
+def createReport(consumerCollections):
+    """
+    Function to create the headers and the rows of the report of more consumer collections, e.g. for the formats that are not written by this module.
+    :param consumerCollections: A list of consumer collections, these are lists of MemEntry objects or MemEntryCollection objects.
+    :return: Tuple of the list of the headers and an iterator over the batches of the rows (see createReportRowBatches()).
+    """
+    compilerSpecificHeaders = collectCompilerSpecificHeaders(consumerCollections)
+    return createReportHeaders(compilerSpecificHeaders), createReportRowBatches(consumerCollections, compilerSpecificHeaders)
+
+
 def writeReportToDisk(reportPath, consumerCollection):
     """
     Writes the consumerCollection containing MemEntry objects to a CSV file.
     :param reportPath: A path of the CSV that needs to be created.
-    :param consumerCollection: A list of MemEntry objects.
+    :param consumerCollection: A list of MemEntry objects or a MemEntryCollection object.
+    """
+    streamReportToDisk(reportPath, [consumerCollection])
+
+
+def streamReportToDisk(reportPath, consumerCollections):
+    """
+    Writes the rows of more consumer collections one after the other to a CSV file, without concatenating the collections.
+    The headers are collected from all the collections up front, then the rows are formatted and written in batches through a large write buffer.
+    :param reportPath: A path of the CSV that needs to be created.
+    :param consumerCollections: A list of consumer collections, these are lists of MemEntry objects or MemEntryCollection objects.
+    :return: None
     """
+    compilerSpecificHeaders = collectCompilerSpecificHeaders(consumerCollections)
+    headers = createReportHeaders(compilerSpecificHeaders)
 
     # Opening the file
-    with open(reportPath, "w") as fp:
+    with open(reportPath, "w", buffering=REPORT_WRITE_BUFFER_SIZE) as fp:
         # The writer object that will be used for creating the CSV data
         writer = csv.writer(fp, delimiter=";", lineterminator="\n")
 
-        # Creating the list with the first part of the static headers
-        headers = [ADDR_START_HEX, ADDR_END_HEX, SIZE_HEX, ADDR_START_DEC, ADDR_END_DEC, SIZE_DEC, SIZE_HUMAN_READABLE, SECTION_NAME, OBJECT_NAME, CONFIG_ID]
-
-        # Extending it with the compiler specific headers
-        compilerSpecificHeaders = collectCompilerSpecificHeaders(consumerCollection)
-        headers.extend(compilerSpecificHeaders)
-
-        # Collecting the rest of the static headers
-        headers.extend([MEM_TYPE, MEM_TYPE_TAG, CATEGORY, MAPFILE, OVERLAP_FLAG, CONTAINMENT_FLAG, DUPLICATE_FLAG, CONTAINING_OTHERS_FLAG, ADDR_START_HEX_ORIGINAL, ADDR_END_HEX_ORIGINAL, SIZE_HEX_ORIGINAL, SIZE_DEC_ORIGINAL, FQN])
-
         # Writing the headers to the CSV file
         writer.writerow(headers)
 
         # Writing the data lines to the file
-        for row in consumerCollection:
-            # Collecting the first part of the static data for the current row
-            rowData = [
-                row.addressStartHex() if (row.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY) else "",
-                row.addressEndHex() if (row.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY) else "",
-                row.addressLengthHex() if (row.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY) else "",
-                row.addressStart if (row.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY) else "",
-                row.addressEnd() if (row.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY) else "",
-                row.addressLength if (row.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY) else "",
-                Emma.shared_libs.emma_helper.toHumanReadable(row.addressLength) if (row.objectName != OBJECTS_IN_SECTIONS_SECTION_ENTRY) else "",
-                row.sectionName,
-                row.objectName,
-                row.configID
-            ]
-
-            # Extending it with the data part of the compiler specific data pairs of this MemEntry object
-            for compilerSpecificHeader in compilerSpecificHeaders:
-                rowData.append(row.compilerSpecificData[compilerSpecificHeader] if compilerSpecificHeader in row.compilerSpecificData else "")
-
-            # Collecting the rest of the static data for the current row
-            rowData.extend([
-                row.memType,
-                row.memTypeTag,
-                row.category,
-                row.mapfile,
-                row.overlapFlag,
-                row.containmentFlag,
-                row.duplicateFlag,
-                row.containingOthersFlag,
-                # Addresses are modified in case of overlapping so we will post the original values so that the changes can be seen
-                row.addressStartHexOriginal() if ((row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY) or (row.overlapFlag is not None)) else "",
-                row.addressEndHexOriginal() if ((row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY) or (row.overlapFlag is not None)) else "",
-                # Lengths are modified in case of overlapping, containment and duplication so we will post the original values so that the changes can be seen
-                row.addressLengthHexOriginal() if ((row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY) or (row.overlapFlag is not None) or (row.containmentFlag is not None) or (row.duplicateFlag is not None)) else "",
-                row.addressLengthOriginal if ((row.objectName == OBJECTS_IN_SECTIONS_SECTION_ENTRY) or (row.overlapFlag is not None) or (row.containmentFlag is not None) or (row.duplicateFlag is not None)) else "",
-                # FQN
-                row.getFQN()
-            ])
-
-            # Writing the data to the file
-            writer.writerow(rowData)
+        for reportRows in createReportRowBatches(consumerCollections, compilerSpecificHeaders):
+            writer.writerows(reportRows)
@@ -0,0 +1,107 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sqlite3
+
+import Emma
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.emma_libs.memoryMap
+
+
+# The columns of every consumer collection table that get an index: the columns of an index are listed in a tuple
+INDEXED_COLUMNS = ((ADDR_START_DEC,), (CONFIG_ID, MEM_TYPE), (CATEGORY,), (FQN,))
+
+
+def quoteIdentifier(identifier):
+    """
+    Function to quote a table or column name for an SQL statement. The report headers contain spaces and brackets, so every identifier is quoted.
+    :param identifier: The name of the table or column.
+    :return: The quoted name.
+    """
+    return "\"" + identifier.replace("\"", "\"\"") + "\""
+
+
+def createDatabaseRow(reportRow, isIntegerColumn):
+    """
+    Function to convert the values of a report row to the values of a database row.
+    The missing values (these are empty strings or None in the CSV reports) are stored as NULL, the rest as integers or texts according to their columns.
+    :param reportRow: The list of the values of the row, created by the memoryMap.createReportRow().
+    :param isIntegerColumn: List with a boolean for every column that tells whether it contains integer values.
+    :return: Tuple of the values.
+    """
+    return tuple(None if (value is None or value == "") else (value if isInteger else str(value)) for value, isInteger in zip(reportRow, isIntegerColumn))
+
+
+def writeConsumerCollectionsTable(connection, tableName, consumerCollections):
+    """
+    Function to create a table from consumer collections and to fill it with their rows.
+    The table has the same columns as the CSV report of the consumer collections and is indexed by the INDEXED_COLUMNS.
+    :param connection: The sqlite3.Connection object of the database.
+    :param tableName: The name of the table, this is the type of the consumer collections (e.g. Section_Summary).
+    :param consumerCollections: A list of consumer collections, these are lists of MemEntry objects or MemEntryCollection objects.
+    :return: None
+    """
+    compilerSpecificHeaders = Emma.emma_libs.memoryMap.collectCompilerSpecificHeaders(consumerCollections)
+    headers = Emma.emma_libs.memoryMap.createReportHeaders(compilerSpecificHeaders)
+    isIntegerColumn = [header in INTEGER_REPORT_HEADERS for header in headers]
+
+    columnDefinitions = ", ".join(quoteIdentifier(header) + (" INTEGER" if isInteger else " TEXT") for header, isInteger in zip(headers, isIntegerColumn))
+    connection.execute(f"CREATE TABLE {quoteIdentifier(tableName)} ({columnDefinitions})")
+    insertStatement = f"INSERT INTO {quoteIdentifier(tableName)} VALUES ({', '.join('?' * len(headers))})"
+    for reportRows in Emma.emma_libs.memoryMap.createReportRowBatches(consumerCollections, compilerSpecificHeaders):
+        connection.executemany(insertStatement, (createDatabaseRow(reportRow, isIntegerColumn) for reportRow in reportRows))
+
+    # The indexes are created after the rows were inserted, this is faster than updating them with every row
+    for indexedColumns in INDEXED_COLUMNS:
+        indexName = tableName + "_" + "_".join(indexedColumns)
+        connection.execute(f"CREATE INDEX {quoteIdentifier(indexName)} ON {quoteIdentifier(tableName)} ({', '.join(quoteIdentifier(column) for column in indexedColumns)})")
+
+
+def writeDatabaseToDisk(databasePath, consumerCollectionsByType, projectName, compilersOfConfigIds):
+    """
+    Writes the consumer collections into an SQLite database. Every type of consumer collections is stored in its own table.
+    Additionally the database contains a metadata table with the project name, the timestamp and the versions
+    and a table with the configIDs and their compilers.
+    :param databasePath: The path of the database that needs to be created. If it already exists, it will be overwritten.
+    :param consumerCollectionsByType: Dictionary with the consumer collection types (e.g. Section_Summary) as keys and lists of consumer collections as values.
+    :param projectName: The name of the project.
+    :param compilersOfConfigIds: Dictionary with the configIDs as keys and the names of their compilers as values.
+    :return: None
+    """
+    if os.path.exists(databasePath):
+        os.remove(databasePath)
+
+    connection = sqlite3.connect(databasePath)
+    try:
+        # The database is created from scratch, if the process fails it will be incomplete anyway, so there is no need for a journal
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        with connection:
+            connection.execute(f"CREATE TABLE {quoteIdentifier(SQLITE_METADATA_TABLE)} (key TEXT PRIMARY KEY, value TEXT)")
+            connection.executemany(f"INSERT INTO {quoteIdentifier(SQLITE_METADATA_TABLE)} VALUES (?, ?)", [("projectName", projectName),
+                                                                                                         ("timestamp", Emma.emma_libs.memoryMap.TIMESTAMP),
+                                                                                                         ("emmaVersion", Emma.EMMA_VERSION),
+                                                                                                         ("formatVersion", str(SQLITE_FORMAT_VERSION))])
+            connection.execute(f"CREATE TABLE {quoteIdentifier(SQLITE_CONFIG_IDS_TABLE)} ({quoteIdentifier(CONFIG_ID)} TEXT PRIMARY KEY, compiler TEXT)")
+            connection.executemany(f"INSERT INTO {quoteIdentifier(SQLITE_CONFIG_IDS_TABLE)} VALUES (?, ?)", compilersOfConfigIds.items())
+            for collectionType, consumerCollections in consumerCollectionsByType.items():
+                writeConsumerCollectionsTable(connection, collectionType, consumerCollections)
+    finally:
+        connection.close()
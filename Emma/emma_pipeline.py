@@ -0,0 +1,139 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+# Emma Memory and Mapfile Analyser - analyser and visualiser pipeline
+
+import os
+import sys
+import timeit
+import datetime
+import argparse
+
+from pypiscout.SCout_Logger import Logger as sc
+
+import Emma
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.shared_libs.emma_helper
+import Emma.emma_libs.memoryManager
+import Emma.emma_libs.memoryMap
+import Emma.emma
+import Emma.emma_vis
+
+
+def main(arguments):
+    """
+    Emma analyser and visualiser pipeline: the mapfiles are analysed and the results are visualised in the same process.
+    The reports are handed over to the visualiser as DataFrames, so they do not need to be written, found and parsed again.
+    :param arguments: parsed arguments
+    :return: None
+    """
+    # Setup SCout
+    sc(invVerbosity=-1, actionWarning=(lambda: sys.exit(-10) if arguments.Werror is not None else None), actionError=lambda: sys.exit(-10))
+
+    sc().header("Emma Memory and Mapfile Analyser - Analyser and Visualiser", symbol="/")
+
+    # Start and display time measurement
+    TIME_START = timeit.default_timer()
+    sc().info("Started processing at", datetime.datetime.now().strftime("%H:%M:%S"))
+
+    memoryManager = Emma.emma_libs.memoryManager.MemoryManager(*Emma.emma.processArguments(arguments))
+    memoryManager.readConfiguration()
+    memoryManager.processMapfiles()
+    # The reports are only written to files if formats were selected
+    memoryManager.createReports()
+    reportFrames = memoryManager.createReportFrames()
+
+    # The visualiser results are stored next to the memStats folder, like the Emma Visualiser does it
+    resultsPath = Emma.shared_libs.emma_helper.joinPath(os.path.dirname(memoryManager.settings.outputPath), OUTPUT_DIR_VISUALISER)
+    Emma.emma_vis.visualise(memoryManager.settings.configurationPath, resultsPath, reportFrames=reportFrames, statsTimestamp=Emma.emma_libs.memoryMap.TIMESTAMP,
+                            append=arguments.append, overview=arguments.overview, categorisedImageCsv=arguments.categorised_image_csv)
+
+    # Stop and display time measurement
+    TIME_END = timeit.default_timer()
+    sc().info("Finished job at:", datetime.datetime.now().strftime("%H:%M:%S"), "(duration: " "{0:.2f}".format(TIME_END - TIME_START) + "s)")
+
+
+def initParser():
+    """
+    Prepare the parser for the Emma analyser and visualiser pipeline
+    It has the arguments of the Emma analyser and the ones of the Emma Visualiser that select its outputs.
+    We need this as a separate function for the top level sub commands (argparse).
+    :return: Set-up parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="Emma Analyser and Visualiser",
+        description="Analyses the mapfiles and visualises the results in the same process, without writing and reading the reports.",
+        epilog=EPILOG,
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        parents=[Emma.emma.initParser()],
+        conflict_handler="resolve"                                          # Since some arguments of the analyser are redefined here
+    )
+    parser.add_argument(
+        "--format",
+        help="Formats the results are additionally stored in (see the Emma analyser). If none is given, no report files are written.",
+        nargs="*",
+        choices=REPORT_FORMATS,
+        default=[]
+    )
+    parser.add_argument(
+        "--append",
+        help="Append reports to file in ./results folder",
+        action="store_true",
+        default=False
+    )
+    parser.add_argument(
+        "--overview",
+        help="Create a .html overview.",
+        action="store_true",
+        default=False
+    )
+    parser.add_argument(
+        "--categorised_image_csv",
+        "-cat_img",
+        help="Save a .csv of categories found inside the image summary",
+        action="store_true",
+        default=False
+    )
+    return parser
+
+
+def parseArgs(arguments=""):
+    """
+    Parse command line arguments
+    :param arguments: Optional arguments when nothing gets parsed
+    :return: Parsed arguments
+    """
+    parser = initParser()
+    parsedArguments = Emma.shared_libs.emma_helper.parseGivenArgStrOrStdIn(arguments, parser)
+    return parsedArguments
+
+
+def runEmmaPipeline():
+    """
+    Runs the Emma analyser and visualiser pipeline
+    :return: None
+    """
+    # Parsing the command line arguments
+    parsedArguments = parseArgs()
+
+    # Execute the pipeline
+    main(parsedArguments)
+
+
+if __name__ == "__main__":
+    runEmmaPipeline()
@@ -31,6 +31,7 @@ from pypiscout.SCout_Logger import Logger as sc
 import Emma
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 import Emma.shared_libs.emma_helper
+import Emma.emma_vis_libs.dataVisualiser
 import Emma.emma_vis_libs.dataVisualiserSections
 import Emma.emma_vis_libs.dataVisualiserObjects
 import Emma.emma_vis_libs.dataVisualiserCategorisedSections
@@ -60,37 +61,79 @@ def main(arguments):
     TIME_START = timeit.default_timer()
     sc().info("Started processing at", datetime.datetime.now().strftime("%H:%M:%S"))
 
-    imageFile = Emma.emma_vis_libs.helper.getLastModFileOrPrompt(FILE_IDENTIFIER_SECTION_SUMMARY, arguments.inOutPath, arguments.quiet, arguments.append, arguments.noprompt)
-    moduleFile = Emma.emma_vis_libs.helper.getLastModFileOrPrompt(FILE_IDENTIFIER_OBJECT_SUMMARY, arguments.inOutPath, arguments.quiet, arguments.append, arguments.noprompt)
-    objectsInSectionsFile = Emma.emma_vis_libs.helper.getLastModFileOrPrompt(FILE_IDENTIFIER_OBJECTS_IN_SECTIONS, arguments.inOutPath, arguments.quiet, arguments.append, arguments.noprompt)
+    reportFiles = {collectionType: Emma.emma_vis_libs.helper.getLastModFileOrPrompt(collectionType, arguments.inOutPath, arguments.quiet, arguments.append, arguments.noprompt)
+                   for collectionType in (FILE_IDENTIFIER_SECTION_SUMMARY, FILE_IDENTIFIER_OBJECT_SUMMARY, FILE_IDENTIFIER_OBJECTS_IN_SECTIONS)}
 
     resultsPath = Emma.shared_libs.emma_helper.joinPath(arguments.inOutPath, OUTPUT_DIR_VISUALISER)        # We don't have to check the existance of this path since this was done during parseArgs
+    visualise(arguments.projectDir, resultsPath, reportFiles, append=arguments.append, overview=arguments.overview, categorisedImageCsv=arguments.categorised_image_csv)
+
+    # Stop and display time measurement
+    TIME_END = timeit.default_timer()
+    sc().info("Finished job at:", datetime.datetime.now().strftime("%H:%M:%S"), "(duration: " + "{0:.2f}".format(TIME_END - TIME_START) + "s)")
+
+
+def visualise(projectPath, resultsPath, reportFiles=None, reportFrames=None, statsTimestamp=None, append=False, overview=False, categorisedImageCsv=False):
+    # pylint: disable=too-many-arguments
+    # Rationale: The reports can come either from files or from DataFrames and the optional outputs need to be selectable.
+
+    """
+    Creates the plots and the reports of the Emma Visualiser.
+    The reports are either read from files or handed over as DataFrames that were created in the same process (see MemoryManager.createReportFrames()).
+    Only the columns the visualiser needs are kept from them (see dataVisualiser.loadReports()).
+    :param projectPath: Path of directory holding the config files (budgets.json)
+    :param resultsPath: Path of the directory the results will be stored in
+    :param reportFiles: Dictionary with the FILE_IDENTIFIERs as keys and the paths of the reports (.csv files or a .npz bundle) as values
+    :param reportFrames: Dictionary with the FILE_IDENTIFIERs as keys and the DataFrames of the reports as values; if given, the reportFiles are not needed
+    :param statsTimestamp: The timestamp of the reportFrames (the timestamp of the reportFiles is parsed from their names)
+    :param append: Append reports to file in ./results folder
+    :param overview: Create a .html overview
+    :param categorisedImageCsv: Save a .csv of categories found inside the image summary
+    :return: None
+    """
+    reportFiles = reportFiles if reportFiles is not None else {}
+    imageFile = reportFiles.get(FILE_IDENTIFIER_SECTION_SUMMARY)
+    moduleFile = reportFiles.get(FILE_IDENTIFIER_OBJECT_SUMMARY)
+    objectsInSectionsFile = reportFiles.get(FILE_IDENTIFIER_OBJECTS_IN_SECTIONS)
+
     Emma.shared_libs.emma_helper.mkDirIfNeeded(resultsPath)
 
+    # Every report and the budgets are loaded only once, all the summaries share them
+    reports = Emma.emma_vis_libs.dataVisualiser.loadReports(reportFiles, reportFrames)
+    budgets = Emma.emma_vis_libs.dataVisualiser.readBudgets(projectPath)
+
     # Init classes for summaries
-    consumptionObjectsInSections = Emma.emma_vis_libs.dataVisualiserMemoryMap.MemoryMap(projectPath=arguments.projectDir,
+    consumptionObjectsInSections = Emma.emma_vis_libs.dataVisualiserMemoryMap.MemoryMap(projectPath=projectPath,
                                                                                         fileToUse=objectsInSectionsFile,
-                                                                                        resultsPath=resultsPath)
+                                                                                        resultsPath=resultsPath,
+                                                                                        data=reports.get(FILE_IDENTIFIER_OBJECTS_IN_SECTIONS),
+                                                                                        statsTimestamp=statsTimestamp,
+                                                                                        budgets=budgets)
     consumptionObjectsInSections.plotPieChart(plotShow=False)
 
     # Image Summary object
-    sc().info("Analysing", imageFile)
-    consumptionImage = Emma.emma_vis_libs.dataVisualiserSections.ImageConsumptionList(projectPath=arguments.projectDir,
+    sc().info("Analysing", imageFile if imageFile is not None else FILE_IDENTIFIER_SECTION_SUMMARY)
+    consumptionImage = Emma.emma_vis_libs.dataVisualiserSections.ImageConsumptionList(projectPath=projectPath,
                                                                                       fileToUse=imageFile,
-                                                                                      resultsPath=resultsPath)
+                                                                                      resultsPath=resultsPath,
+                                                                                      data=reports.get(FILE_IDENTIFIER_SECTION_SUMMARY),
+                                                                                      statsTimestamp=statsTimestamp,
+                                                                                      budgets=budgets)
 
     # Module Summary object
-    sc().info("Analysing", moduleFile)
+    sc().info("Analysing", moduleFile if moduleFile is not None else FILE_IDENTIFIER_OBJECT_SUMMARY)
     try:
-        consumptionModule = Emma.emma_vis_libs.dataVisualiserObjects.ModuleConsumptionList(projectPath=arguments.projectDir,
+        consumptionModule = Emma.emma_vis_libs.dataVisualiserObjects.ModuleConsumptionList(projectPath=projectPath,
                                                                                            fileToUse=moduleFile,
-                                                                                           resultsPath=resultsPath)
+                                                                                           resultsPath=resultsPath,
+                                                                                           data=reports.get(FILE_IDENTIFIER_OBJECT_SUMMARY),
+                                                                                           statsTimestamp=statsTimestamp,
+                                                                                           budgets=budgets)
     except ValueError:
         sc().error("Data does not contain any module/object entry - exiting...")
 
     # Object for visualisation fo image and module summary
     categorisedImage = Emma.emma_vis_libs.dataVisualiserCategorisedSections.CategorisedImageConsumptionList(resultsPath=resultsPath,
-                                                                                                            projectPath=arguments.projectDir,
+                                                                                                            projectPath=projectPath,
                                                                                                             statsTimestamp=consumptionImage.statsTimestamp,
                                                                                                             imageSumObj=consumptionImage,
                                                                                                             moduleSumObj=consumptionModule)
@@ -107,18 +150,18 @@ def main(arguments):
     # categorisedImage.plotNdisplay(plotShow=False)
 
     # Save the categorised sections as csv
-    if arguments.categorised_image_csv:
+    if categorisedImageCsv:
         categorisedImage.categorisedImagetoCSV()
 
     # Write each report to file if append mode in parsedArguments is selected
-    if arguments.append:
+    if append:
         sc().info("Appending report...")
         consumptionImage.writeReportToFile()
-        report = Emma.emma_vis_libs.dataReports.Reports(projectPath=arguments.projectDir)
+        report = Emma.emma_vis_libs.dataReports.Reports(projectPath=projectPath)
         report.plotNdisplay(plotShow=False)
 
     # Create a Markdown overview document and add all parts to it
-    if arguments.overview:
+    if overview:
         sc().info("Generating markdown report...")
         markdownFilePath = consumptionImage.createMarkdownOverview()
         consumptionModule.appendModuleConsumptionToMarkdownOverview(markdownFilePath)
@@ -126,10 +169,6 @@ def main(arguments):
         sc().info("Generating html report...")
         Emma.shared_libs.emma_helper.convertMarkdownFileToHtmlFile(markdownFilePath, (os.path.splitext(markdownFilePath)[0] + ".html"))
 
-    # Stop and display time measurement
-    TIME_END = timeit.default_timer()
-    sc().info("Finished job at:", datetime.datetime.now().strftime("%H:%M:%S"), "(duration: " + "{0:.2f}".format(TIME_END - TIME_START) + "s)")
-
 
 def initParser():
     """
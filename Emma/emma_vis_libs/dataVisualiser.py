@@ -31,6 +31,7 @@ from pypiscout.SCout_Logger import Logger as sc
 
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 import Emma.shared_libs.emma_helper
+import Emma.shared_libs.reportBundle
 
 
 def removeDataWithFlags(sourceData, rmContained=True, rmDuplicate=True, rmOverlap=True):
@@ -52,10 +53,12 @@ def removeDataWithFlags(sourceData, rmContained=True, rmDuplicate=True, rmOverla
 
     if rmDuplicate:
         # Remove the duplicates and delete the 'duplicateFlag' column
-        resolvedFlagsData = resolvedFlagsData.drop_duplicates(subset=[ADDR_START_HEX,
-                                                                      ADDR_END_HEX,
-                                                                      SIZE_HEX,
-                                                                      CONFIG_ID])
+        # The decimal addresses and sizes are compared, they are the same as the hex ones but the hex columns are not loaded (see VISUALISER_REPORT_COLUMNS)
+        duplicated = resolvedFlagsData.reset_index().duplicated(subset=[ADDR_START_DEC,
+                                                                        ADDR_END_DEC,
+                                                                        SIZE_DEC,
+                                                                        CONFIG_ID])
+        resolvedFlagsData = resolvedFlagsData[~duplicated.values]
         resolvedFlagsData = resolvedFlagsData.drop([DUPLICATE_FLAG], axis=1)
 
     if rmOverlap:
@@ -65,6 +68,17 @@ def removeDataWithFlags(sourceData, rmContained=True, rmDuplicate=True, rmOverla
     return resolvedFlagsData
 
 
+def sumByGroups(dataframe, keys):
+    """
+    Function to group a dataframe and to sum the columns of the groups
+    The categorical keys only create groups of their observed values. The groups are sorted by the keys (not every pandas version sorts the observed categorical groups).
+    :param dataframe: The dataframe
+    :param keys: List of the columns to group by
+    :return: The dataframe of the sums with the keys as index
+    """
+    return dataframe.groupby(keys, observed=True).sum().sort_index()
+
+
 def getConfigIDsFromDf(dataframe):
     """
     Function to return the possible configIDs
@@ -75,15 +89,80 @@ def getConfigIDsFromDf(dataframe):
     return [configID[0] for configID in configIDs]
 
 
+def readBudgets(projectPath):
+    """
+    Reads the budgets.json file of a project
+    :param projectPath: Path of directory holding the config files (budgets.json)
+    :return: The parsed budgets.json (dictionary)
+    """
+    filepath = Emma.shared_libs.emma_helper.joinPath(projectPath, "budgets.json")
+    try:
+        with open(filepath, "r") as fp:
+            budgets = json.load(fp)
+    except FileNotFoundError:
+        sc().error(f"The file `{os.path.abspath(filepath)}` was not found!")
+    except json.JSONDecodeError:
+        sc().error(f"JSON syntax error in `{os.path.abspath(filepath)}`!")
+    return budgets
+
+
+def selectReportColumns(reportFrame, collectionType):
+    """
+    Selects the columns of a report DataFrame the visualiser needs (see VISUALISER_REPORT_COLUMNS) and makes the ones with only a few different values categorical
+    This creates the same DataFrame as loadReport() reading the report from a file
+    :param reportFrame: DataFrame of the report with all the columns (e.g. created by MemoryManager.createReportFrames())
+    :param collectionType: The type of the consumer collections of the report (e.g. Section_Summary)
+    :return: The new DataFrame
+    """
+    columns = [column for column in reportFrame.columns if column in VISUALISER_REPORT_COLUMNS[collectionType]]
+    categoricalColumns = [column for column in columns if column in VISUALISER_CATEGORICAL_COLUMNS]
+    return reportFrame[columns].astype(dict.fromkeys(categoricalColumns, "category"))
+
+
+def loadReport(reportPath, collectionType):
+    """
+    Reads only the columns of a report the visualiser needs (see VISUALISER_REPORT_COLUMNS), the ones with only a few different values are categorical
+    :param reportPath: The path of the CSV report or of the bundle
+    :param collectionType: The type of the consumer collections of the report (e.g. Section_Summary)
+    :return: DataFrame with the addrStartDec column as index
+    """
+    return Emma.shared_libs.reportBundle.readReport(reportPath, collectionType, VISUALISER_REPORT_COLUMNS[collectionType], VISUALISER_CATEGORICAL_COLUMNS)
+
+
+def loadReports(reportFiles=None, reportFrames=None):
+    """
+    Loads every report once, so all the visualiser classes can share the DataFrames
+    :param reportFiles: Dictionary with the FILE_IDENTIFIERs as keys and the paths of the reports (.csv files or a .npz bundle) as values
+    :param reportFrames: Dictionary with the FILE_IDENTIFIERs as keys and the DataFrames of the reports as values; these are used instead of the reportFiles
+    :return: Dictionary with the FILE_IDENTIFIERs as keys and the loaded DataFrames as values
+    """
+    reportFiles = reportFiles if reportFiles is not None else {}
+    reportFrames = reportFrames if reportFrames is not None else {}
+    loadedReports = {}
+    for collectionType in VISUALISER_REPORT_COLUMNS:
+        if collectionType in reportFrames:
+            loadedReports[collectionType] = selectReportColumns(reportFrames[collectionType], collectionType)
+        elif reportFiles.get(collectionType) is not None:
+            loadedReports[collectionType] = loadReport(reportFiles[collectionType], collectionType)
+    return loadedReports
+
+
 class Visualiser:
     """
-    Abstract class for reading and holding the data from memStats .csv and budget files
+    Abstract class for reading and holding the data from memStats .csv (or .npz bundle) and budget files
+    The data can also be handed over as a DataFrame (e.g. created by the MemoryManager in the same process), then the fileToUse is not read and can be None.
     """
-    def __init__(self, fileToUse, resultsPath, projectPath):
+    def __init__(self, fileToUse, resultsPath, projectPath, collectionType, data=None, statsTimestamp=None, budgets=None):
+        # pylint: disable=too-many-arguments
+        # Rationale: The data, its timestamp and the budgets are only needed if they are not read from the files.
+
         self.projectPath = projectPath
         self.project = os.path.split(projectPath)[-1]
         self.memStatsFile = fileToUse
-        self.statsTimestamp = Emma.shared_libs.emma_helper.getTimestampFromFilename(fileToUse)  # This is the timestamp parsed from the module/image summary filename
+        self.collectionType = collectionType                                                    # The report that is read if the memStatsFile is a bundle
+        if statsTimestamp is None:
+            statsTimestamp = Emma.shared_libs.emma_helper.getTimestampFromFilename(fileToUse)  # This is the timestamp parsed from the module/image summary filename
+        self.statsTimestamp = statsTimestamp
         self.resultsPath = resultsPath
         self.projectThreshold = None
         # default header
@@ -109,36 +188,23 @@ class Visualiser:
         self.budgets = ""
         self.budgetsFilename = Emma.shared_libs.emma_helper.joinPath(self.projectPath, "budgets.json")
 
-        if not self.__readMemStatsFile():
+        if not self.__readMemStatsFile(data):
             raise ValueError("No data")
-        self.__readBudgets()
-
-    def __readBudgets(self):
-        """
-        Reads the budgets.json file
-        :return: nothing
-        """
-        self.budgets = None
-        self.projectThreshold = None
-
-        filepath = Emma.shared_libs.emma_helper.joinPath(self.projectPath, "budgets.json")
-        try:
-            with open(filepath, "r") as fp:
-                budgets = json.load(fp)
-        except FileNotFoundError:
-            sc().error(f"The file `{os.path.abspath(filepath)}` was not found!")
-        except json.JSONDecodeError:
-            sc().error(f"JSON syntax error in `{os.path.abspath(filepath)}`!")
+        # The flags are resolved once, most of the calculations use only the resolved data
+        self.resolvedData = removeDataWithFlags(self.data)
 
+        if budgets is None:
+            budgets = readBudgets(self.projectPath)
         self.budgets = budgets["Budgets"]
         self.projectThreshold = budgets["Project Threshold in %"]
 
-    def __readMemStatsFile(self):
+    def __readMemStatsFile(self, data=None):
         """
-        Reads a csv file into self.dataframe
+        Reads the needed columns of a csv file or of the report of the collectionType from a bundle into self.dataframe (see loadReport())
+        :param data: The DataFrame of the report if it is already available (see loadReports()), in this case no file is read
         :return: Pandas dataframe
         """
-        self.data = pandas.read_csv(self.memStatsFile, index_col=3, sep=";")     # 3 is column addrStartDec (see pos in header)
+        self.data = data if data is not None else loadReport(self.memStatsFile, self.collectionType)
         if self.data.empty:
             return False
         else:
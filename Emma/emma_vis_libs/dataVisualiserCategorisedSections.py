@@ -44,9 +44,9 @@ class CategorisedImageConsumptionList:
 
         # Data attributes
         self.imageSumObj = imageSumObj
-        self.imageData = Emma.emma_vis_libs.dataVisualiser.removeDataWithFlags(imageSumObj.data)
+        self.imageData = imageSumObj.resolvedData
         self.moduleSumObj = moduleSumObj
-        self.moduleData = Emma.emma_vis_libs.dataVisualiser.removeDataWithFlags(moduleSumObj.data)
+        self.moduleData = moduleSumObj.resolvedData
 
         # Attributes created from data
         self.__categorisedImage = self.__categoriseImage()
@@ -60,15 +60,15 @@ class CategorisedImageConsumptionList:
         """
         # Prepare image summary data
         self.imageData.reset_index()
-        self.imageData = self.imageData.drop([CATEGORY, ADDR_START_HEX, ADDR_END_HEX, SIZE_HEX, ADDR_END_DEC, VAS_NAME, DMA, MAPFILE, OBJECT_NAME], 1)
-        self.imageData = self.imageData.groupby([CONFIG_ID, MEM_TYPE, SECTION_NAME]).sum()
+        self.imageData = self.imageData[[CONFIG_ID, MEM_TYPE, SECTION_NAME, SIZE_DEC]]
+        self.imageData = Emma.emma_vis_libs.dataVisualiser.sumByGroups(self.imageData, [CONFIG_ID, MEM_TYPE, SECTION_NAME])
         self.imageData = self.imageData.rename(index=str, columns={SIZE_DEC: SECTION_SIZE_BYTE})
         self.imageData = self.imageData.reset_index()
 
         # Prepare module summary data
         self.moduleData = self.moduleData.reset_index()
-        self.moduleData = self.moduleData.drop([MEM_TYPE_TAG, ADDR_START_DEC, ADDR_START_HEX, ADDR_END_HEX, SIZE_HEX, ADDR_END_DEC, VAS_NAME, DMA, MAPFILE], 1)
-        self.moduleData = self.moduleData.groupby([CONFIG_ID, MEM_TYPE, SECTION_NAME, OBJECT_NAME, CATEGORY]).sum()
+        self.moduleData = self.moduleData[[CONFIG_ID, MEM_TYPE, SECTION_NAME, OBJECT_NAME, CATEGORY, SIZE_DEC]]
+        self.moduleData = Emma.emma_vis_libs.dataVisualiser.sumByGroups(self.moduleData, [CONFIG_ID, MEM_TYPE, SECTION_NAME, OBJECT_NAME, CATEGORY])
         self.moduleData = self.moduleData.rename(index=str, columns={SIZE_DEC: MODULE_SIZE_BYTE})
         self.moduleData = self.moduleData.reset_index()
 
@@ -78,7 +78,7 @@ class CategorisedImageConsumptionList:
                                         on=[CONFIG_ID, MEM_TYPE, SECTION_NAME])
 
         # Aggregate categorisedImage to desired form
-        categorisedImage = categorisedImage.groupby([CONFIG_ID, MEM_TYPE, SECTION_NAME, SECTION_SIZE_BYTE, CATEGORY, OBJECT_NAME]).sum()
+        categorisedImage = Emma.emma_vis_libs.dataVisualiser.sumByGroups(categorisedImage, [CONFIG_ID, MEM_TYPE, SECTION_NAME, SECTION_SIZE_BYTE, CATEGORY, OBJECT_NAME])
 
         return categorisedImage
 
@@ -87,10 +87,10 @@ class CategorisedImageConsumptionList:
         Initialiser function to calculate how much space the modules take up in the image summary
         :return: dataframe
         """
-        usedByModules = self.moduleData.groupby([CONFIG_ID, MEM_TYPE, CATEGORY]).sum()
+        usedByModules = Emma.emma_vis_libs.dataVisualiser.sumByGroups(self.moduleData, [CONFIG_ID, MEM_TYPE, CATEGORY])
         usedByModules = usedByModules.reset_index()
 
-        usedByImage = self.imageData.groupby([CONFIG_ID, MEM_TYPE]).sum()
+        usedByImage = Emma.emma_vis_libs.dataVisualiser.sumByGroups(self.imageData, [CONFIG_ID, MEM_TYPE])
         usedByImage = usedByImage.rename(index=str, columns={SECTION_SIZE_BYTE: "Used [Byte]"})
         usedByImage = usedByImage.reset_index()
 
@@ -98,7 +98,7 @@ class CategorisedImageConsumptionList:
                                             right=usedByModules,
                                             how='right',
                                             on=[CONFIG_ID, MEM_TYPE])
-        usedByModulesInImage = usedByModulesInImage.groupby([CONFIG_ID, MEM_TYPE, USED_BYTE, CATEGORY]).sum()
+        usedByModulesInImage = Emma.emma_vis_libs.dataVisualiser.sumByGroups(usedByModulesInImage, [CONFIG_ID, MEM_TYPE, USED_BYTE, CATEGORY])
 
         return usedByModulesInImage
 
@@ -108,7 +108,7 @@ class CategorisedImageConsumptionList:
         :return: The grouped dataframe
         """
         groupedImage = self.__categorisedImage.reset_index()
-        groupedImage = groupedImage.groupby([CONFIG_ID, MEM_TYPE, CATEGORY, SECTION_NAME, SECTION_SIZE_BYTE, OBJECT_NAME]).sum()
+        groupedImage = Emma.emma_vis_libs.dataVisualiser.sumByGroups(groupedImage, [CONFIG_ID, MEM_TYPE, CATEGORY, SECTION_NAME, SECTION_SIZE_BYTE, OBJECT_NAME])
         return groupedImage
 
     # FIXME: Colours of the legend are not working (MSc)
@@ -121,7 +121,7 @@ class CategorisedImageConsumptionList:
         usedByModulesInImage = usedByModulesInImage.reset_index().merge(right=self.imageSumObj.consumptionByMemType.reset_index().drop(['sizeDec', ], 1))
         usedByModulesInImage[MODULE_SIZE_PERCENT] = 100 * usedByModulesInImage[MODULE_SIZE_BYTE] / usedByModulesInImage[BUDGET].astype(float)
         usedByModulesInImage = usedByModulesInImage.drop([BUDGET, MODULE_SIZE_BYTE, USED_BYTE, USED_PERCENT, AVAILABLE_PERCENT], 1)
-        usedByModulesInImage = usedByModulesInImage.groupby([CONFIG_ID, MEM_TYPE, CATEGORY]).sum()
+        usedByModulesInImage = Emma.emma_vis_libs.dataVisualiser.sumByGroups(usedByModulesInImage, [CONFIG_ID, MEM_TYPE, CATEGORY])
 
         # Constants for plot
         figsize = (18, 10)
@@ -146,10 +146,10 @@ class CategorisedImageConsumptionList:
         for i in range(len(self.imageSumObj.consumptionByMemType[USED_PERCENT])):
             # Show budgets annotations in kiB
             barWidth = [p.get_width() for p in barGraph.patches][0]
-            annotationUsagePercentage = "{:.1f} %".format(self.imageSumObj.consumptionByMemType[USED_PERCENT][i])
-            annotationUsageAbsoluteValue = Emma.shared_libs.emma_helper.toHumanReadable(int(self.imageSumObj.consumptionByMemType[SIZE_DEC][i]))
-            barGraph.annotate(s=annotationUsagePercentage + "\n" + annotationUsageAbsoluteValue,
-                              xy=(i-barWidth/2, self.imageSumObj.consumptionByMemType[USED_PERCENT][i] + 0.01),         # Make annotation on the left side of each bar, xy= accepts a tuple of XY location
+            annotationUsagePercentage = "{:.1f} %".format(self.imageSumObj.consumptionByMemType[USED_PERCENT].iloc[i])
+            annotationUsageAbsoluteValue = Emma.shared_libs.emma_helper.toHumanReadable(int(self.imageSumObj.consumptionByMemType[SIZE_DEC].iloc[i]))
+            barGraph.annotate(annotationUsagePercentage + "\n" + annotationUsageAbsoluteValue,
+                              xy=(i-barWidth/2, self.imageSumObj.consumptionByMemType[USED_PERCENT].iloc[i] + 0.01),         # Make annotation on the left side of each bar, xy= accepts a tuple of XY location
                               color="#505359")
 
         # TODO : This needs to be corrected because now the legend elements have different colours from the diagram content. (AGK)
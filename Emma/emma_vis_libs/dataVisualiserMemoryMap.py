@@ -31,8 +31,11 @@ import Emma.shared_libs.emma_helper
 
 
 class MemoryMap(Emma.emma_vis_libs.dataVisualiser.Visualiser):
-    def __init__(self, projectPath, fileToUse, resultsPath):
-        super().__init__(fileToUse, resultsPath, projectPath)
+    def __init__(self, projectPath, fileToUse, resultsPath, data=None, statsTimestamp=None, budgets=None):
+        # pylint: disable=too-many-arguments
+        # Rationale: The data, its timestamp and the budgets are only needed if they are not read from the files.
+
+        super().__init__(fileToUse, resultsPath, projectPath, FILE_IDENTIFIER_OBJECTS_IN_SECTIONS, data, statsTimestamp, budgets)
         self.projectPath = projectPath
         self.project = os.path.split(projectPath)[-1]
 
@@ -42,16 +45,16 @@ class MemoryMap(Emma.emma_vis_libs.dataVisualiser.Visualiser):
         :param plotShow: [bool] if True: open window showing the plots
         :return: None
         """
-        data = Emma.emma_vis_libs.dataVisualiser.removeDataWithFlags(sourceData=self.data, rmContained=True, rmDuplicate=True)
+        data = self.resolvedData
 
         # Calculate memory used by category
         byCategory = data[[SIZE_DEC, CONFIG_ID, MEM_TYPE, CATEGORY]]
         byCategory = byCategory.rename(columns={SIZE_DEC: SIZE_DEC_BY_CATEGORY})
-        byCategory = byCategory.groupby([CONFIG_ID, MEM_TYPE, CATEGORY]).sum()
+        byCategory = Emma.emma_vis_libs.dataVisualiser.sumByGroups(byCategory, [CONFIG_ID, MEM_TYPE, CATEGORY])
         byCategory = byCategory.reset_index()
 
         totalUsed = data[[SIZE_DEC, CONFIG_ID, MEM_TYPE]]
-        totalUsed = totalUsed.groupby([CONFIG_ID, MEM_TYPE]).sum()
+        totalUsed = Emma.emma_vis_libs.dataVisualiser.sumByGroups(totalUsed, [CONFIG_ID, MEM_TYPE])
         totalUsed = totalUsed.reset_index()
 
         categoryByPercentage = pandas.merge(left=byCategory, right=totalUsed, on=[CONFIG_ID, MEM_TYPE], how='left')
@@ -59,9 +62,9 @@ class MemoryMap(Emma.emma_vis_libs.dataVisualiser.Visualiser):
         categoryByPercentage = categoryByPercentage.drop([SIZE_DEC, SIZE_DEC_BY_CATEGORY], 1)
 
         configIDs = Emma.emma_vis_libs.dataVisualiser.getConfigIDsFromDf(categoryByPercentage)
-        grouped = categoryByPercentage.groupby([CONFIG_ID])
+        grouped = categoryByPercentage.groupby([CONFIG_ID], observed=True)
         for configID in configIDs:
-            groupedByConfigID = grouped.get_group(configID).groupby([MEM_TYPE, CATEGORY]).sum()
+            groupedByConfigID = Emma.emma_vis_libs.dataVisualiser.sumByGroups(grouped.get_group(configID), [MEM_TYPE, CATEGORY])
             groupedByConfigID = groupedByConfigID.reset_index()
 
             memTypes = groupedByConfigID[MEM_TYPE].drop_duplicates().values
@@ -37,8 +37,11 @@ class ModuleConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
     does not have categories or the like they need to be added here.
     """
 
-    def __init__(self, projectPath, fileToUse, resultsPath):
-        super().__init__(fileToUse, resultsPath, projectPath)
+    def __init__(self, projectPath, fileToUse, resultsPath, data=None, statsTimestamp=None, budgets=None):
+        # pylint: disable=too-many-arguments
+        # Rationale: The data, its timestamp and the budgets are only needed if they are not read from the files.
+
+        super().__init__(fileToUse, resultsPath, projectPath, FILE_IDENTIFIER_OBJECT_SUMMARY, data, statsTimestamp, budgets)
         self.projectPath = projectPath
         self.project = os.path.split(projectPath)[-1]
         self.consumptionByCategorisedModules = self.calcConsumptionByCategorisedModules()
@@ -58,12 +61,12 @@ class ModuleConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
         Calculate and group the module data by category in percent
         :return: dataframe of grouped memStats
         """
-        # Resolve the containment/overlap/duplicate flags
-        usedByModules = Emma.emma_vis_libs.dataVisualiser.removeDataWithFlags(self.data).reset_index()
+        # The containment/overlap/duplicate flags are already resolved
+        usedByModules = self.resolvedData.reset_index()
 
         # Calculate memory used by modules
         usedByModules = usedByModules[[SIZE_DEC, CONFIG_ID, MEM_TYPE]]                  # Extract sizeDec, memType and configID
-        usedByModules = usedByModules.groupby([CONFIG_ID, MEM_TYPE]).sum()              # Group by memType and configID, sum sizeDec
+        usedByModules = Emma.emma_vis_libs.dataVisualiser.sumByGroups(usedByModules, [CONFIG_ID, MEM_TYPE])  # Group by memType and configID, sum sizeDec
         usedByModules = usedByModules.rename(columns={SIZE_DEC: "used by modules"})     # Rename sizeDec, as it is now the sum of memory used ba modules
         usedByModules = usedByModules.reset_index()                                     # Reset index for later merge
 
@@ -77,9 +80,9 @@ class ModuleConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
 
         # Normalize data
         categorized["percentage share"] = 100.0 * categorized[SIZE_DEC] / categorized["used by modules"].astype(float)  # Calculate percent value
-        categorized = categorized.groupby([CONFIG_ID, MEM_TYPE, CATEGORY]).sum()        # Group by configID, memType and category, sum module percentages
+        categorized = Emma.emma_vis_libs.dataVisualiser.sumByGroups(categorized, [CONFIG_ID, MEM_TYPE, CATEGORY])  # Group by configID, memType and category, sum module percentages
         categorized = categorized.drop([SIZE_DEC, "used by modules"], 1)                # Remove sizeDec and budget and used by modules as it's only needed for percentage calc
-        categorized = categorized.groupby([CONFIG_ID, MEM_TYPE, CATEGORY]).sum()
+        categorized = Emma.emma_vis_libs.dataVisualiser.sumByGroups(categorized, [CONFIG_ID, MEM_TYPE, CATEGORY])
 
         pandas.options.display.float_format = '{:,.2f}'.format
 
@@ -88,7 +91,7 @@ class ModuleConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
     def displayConsumptionCategorisedPie(self, consumptionPerMemory):
         title = "Categorised Memory Estimation of Modules - " + self.project + "    (Created " + self.statsTimestamp + ")"
         consumptionPerMemory = consumptionPerMemory.reset_index()
-        consumptionPerMemory = consumptionPerMemory.groupby(["configID", MEM_TYPE, "category"]).sum()
+        consumptionPerMemory = Emma.emma_vis_libs.dataVisualiser.sumByGroups(consumptionPerMemory, ["configID", MEM_TYPE, "category"])
         consumptionPerMemory = consumptionPerMemory.unstack().fillna(0)
 
         pieGraph = consumptionPerMemory.plot.pie(subplots=True,
@@ -127,7 +130,7 @@ class ModuleConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
         matplotlib.pyplot.ylabel("Partition of allocated Memory in %")
 
         matplotlib.pyplot.subplots_adjust(top=0.9, bottom=0.26, left=0.06, right=0.92)  # Adjust space around our plot
-        matplotlib.pyplot.gcf().canvas.set_window_title("Emma -- Visualiser - " + title)  # Set window name
+        matplotlib.pyplot.get_current_fig_manager().set_window_title("Emma -- Visualiser - " + title)  # Set window name
 
         return barGraph.get_figure()
 
@@ -35,8 +35,11 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
     Class holding the image data from .csv Memstats, plus methods for printing/plotting,
     file writing and .md/.html creation
     """
-    def __init__(self, projectPath, fileToUse, resultsPath):
-        super().__init__(fileToUse, resultsPath, projectPath)
+    def __init__(self, projectPath, fileToUse, resultsPath, data=None, statsTimestamp=None, budgets=None):
+        # pylint: disable=too-many-arguments
+        # Rationale: The data, its timestamp and the budgets are only needed if they are not read from the files.
+
+        super().__init__(fileToUse, resultsPath, projectPath, FILE_IDENTIFIER_SECTION_SUMMARY, data, statsTimestamp, budgets)
         self.projectPath = projectPath
         self.project = os.path.split(projectPath)[-1]
         self.consumptionByMemType = self.calcConsumptionByMemType()
@@ -69,15 +72,15 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
         :return: pandas DataFrame (sizeDec grouped by: configID > memType)
         """
 
-        # Resolve the containment/overlap/duplicate flags
-        groupedByMemType = Emma.emma_vis_libs.dataVisualiser.removeDataWithFlags(self.data)
+        # The containment/overlap/duplicate flags are already resolved
+        groupedByMemType = self.resolvedData
 
         # "Select" data that we really use
         groupedByMemType = groupedByMemType[[SIZE_DEC] + [self.header[i] for i in indices]]          # Get only columns we need
 
         # Grouping
-        groupedByMemType = groupedByMemType.groupby([self.header[i] for i in indices]).sum()     # magic numbers: see in header (Visualiser)
-        groupedByMemTypeAcc = groupedByMemType.groupby([CONFIG_ID, MEM_TYPE]).sum()
+        groupedByMemType = Emma.emma_vis_libs.dataVisualiser.sumByGroups(groupedByMemType, [self.header[i] for i in indices])     # magic numbers: see in header (Visualiser)
+        groupedByMemTypeAcc = Emma.emma_vis_libs.dataVisualiser.sumByGroups(groupedByMemType, [CONFIG_ID, MEM_TYPE])
 
         # Set formats and cast type
         pandas.options.display.float_format = '{:14,.0f}'.format
@@ -92,14 +95,14 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
         :return: pandas DataFrame (sizeDec grouped by: configID > tag)
         """
 
-        # Resolve the containment/overlap/duplicate flags
-        groupedByMemType = Emma.emma_vis_libs.dataVisualiser.removeDataWithFlags(self.data)
+        # The containment/overlap/duplicate flags are already resolved
+        groupedByMemType = self.resolvedData
 
         # "Select" data that we really use
         groupedByMemType = groupedByMemType[[SIZE_DEC] + [self.header[i] for i in indices]]          # Get only columns we need
 
         # Grouping
-        groupedByMemTypeAcc = groupedByMemType.groupby([CONFIG_ID, MEM_TYPE_TAG]).sum()
+        groupedByMemTypeAcc = Emma.emma_vis_libs.dataVisualiser.sumByGroups(groupedByMemType, [CONFIG_ID, MEM_TYPE_TAG])
 
         # Set formats and cast type
         pandas.options.display.float_format = '{:14,.0f}'.format
@@ -116,7 +119,7 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
         groupedByMemType = self.data[[self.header[i] for i in indices]]          # Get only columns we need
 
         # Grouping
-        groupedByMemTypeAcc = groupedByMemType.groupby([self.header[7], self.header[13], self.header[9]]).sum().astype(float)     # Order matters!!
+        groupedByMemTypeAcc = Emma.emma_vis_libs.dataVisualiser.sumByGroups(groupedByMemType, [self.header[7], self.header[13], self.header[9]]).astype(float)     # Order matters!!
 
         # Set formats and cast type
         pandas.options.display.float_format = '{:14,.0f}'.format
@@ -137,7 +140,7 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
         # Merge and group by configID & memType
         groupedByMemTypeAcc = groupedByMemTypeAcc.reset_index()                                                             # We need to reset the index first for merging
         groupedByMemTypeAcc = pandas.merge(groupedByMemTypeAcc, budgetsData, on=[self.header[7], self.header[9]])           # Some bars might not be shown in the graph if you forget to adapt the `configID`s in `budgets.json`
-        groupedByMemTypeAcc = groupedByMemTypeAcc.groupby([self.header[7], self.header[9]]).sum()
+        groupedByMemTypeAcc = Emma.emma_vis_libs.dataVisualiser.sumByGroups(groupedByMemTypeAcc, [self.header[7], self.header[9]])
 
         # Normalise and calculate percent (used/available)
         groupedByMemTypeAcc[USED_PERCENT] = groupedByMemTypeAcc[self.header[5]] / groupedByMemTypeAcc[BUDGET] * 100
@@ -158,7 +161,7 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
 
         # Merge and group with budgets
         groupedByMemTypeAcc = groupedByMemTypeAcc.reset_index()         # We need to reset the index first for merging
-        groupedByMemTypeAcc = groupedByMemTypeAcc.groupby([self.header[7], self.header[10]]).sum()
+        groupedByMemTypeAcc = Emma.emma_vis_libs.dataVisualiser.sumByGroups(groupedByMemTypeAcc, [self.header[7], self.header[10]])
 
         return groupedByMemTypeAcc
 
@@ -188,7 +191,7 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
                                                                                                title=title,
                                                                                                color=["#2D9CDB", "#bbbbbb"])
         matplotlib.pyplot.subplots_adjust(top=0.9, bottom=0.26, left=0.06, right=0.92)    # Adjust space around our plot
-        matplotlib.pyplot.gcf().canvas.set_window_title("Emma -- Visualiser - " + title)
+        matplotlib.pyplot.get_current_fig_manager().set_window_title("Emma -- Visualiser - " + title)
         matplotlib.pyplot.ylabel("Allocated Memory in %")
 
         # Show Values over bars in graph
@@ -196,15 +199,15 @@ class ImageConsumptionList(Emma.emma_vis_libs.dataVisualiser.Visualiser):
             if i >= len(barGraph.patches) / 2:
                 # Show budgets annotations in kiB
                 barGraph.annotate(
-                    s=Emma.shared_libs.emma_helper.toHumanReadable(int(self.consumptionByMemType[BUDGET][i % (len(barGraph.patches) / 2)])),  # Format of budget text
+                    Emma.shared_libs.emma_helper.toHumanReadable(int(self.consumptionByMemType[BUDGET].iloc[i % (len(barGraph.patches) // 2)])),  # Format of budget text
                     xy=(bar.get_x(), 100),                                                                         # Location of budget annotation, set to 100 so the annotation appears at the 100% line
                     color="#505359")
             else:
                 # Show percentage and absolute value
                 annotationUsagePercentage = "{:.1f} %".format(bar.get_height())
-                annotationUsageAbsoluteValue = Emma.shared_libs.emma_helper.toHumanReadable(int(self.consumptionByMemType[self.header[5]][i]))
+                annotationUsageAbsoluteValue = Emma.shared_libs.emma_helper.toHumanReadable(int(self.consumptionByMemType[self.header[5]].iloc[i]))
                 barGraph.annotate(
-                    s=annotationUsagePercentage + "\n" + annotationUsageAbsoluteValue,
+                    annotationUsagePercentage + "\n" + annotationUsageAbsoluteValue,
                     xy=(bar.get_x(), bar.get_height() + 0.01),
                     color="#505359")
 
@@ -31,6 +31,7 @@ def getLastModFileOrPrompt(subStringIdentifier: str, inOutPath: str, quiet: bool
     """
     If quiet: Evaluates the file to use listing all files in "<projectPath>/MemStats", then matching
     the substring given in summaryTypes and returns the newest file matching the substring
+    The bundles (.npz) contain every report, so they match any substring
     :param subStringIdentifier: Substring the list of files in the memStats directory is matched
     :param inOutPath: [string]
     :param quiet: [bool]
@@ -40,7 +41,7 @@ def getLastModFileOrPrompt(subStringIdentifier: str, inOutPath: str, quiet: bool
     """
     fileToUse = None
     path = Emma.shared_libs.emma_helper.joinPath(inOutPath, Emma.shared_libs.stringConstants.OUTPUT_DIR)
-    lastModifiedFiles = Emma.shared_libs.emma_helper.lastModifiedFilesInDir(path, ".csv")            # Newest file is last element
+    lastModifiedFiles = Emma.shared_libs.emma_helper.lastModifiedFilesInDir(path, (".csv", Emma.shared_libs.stringConstants.BUNDLE_FILE_EXTENSION))            # Newest file is last element
 
     # Check if no files were found
     if len(lastModifiedFiles) < 1:
@@ -49,8 +50,8 @@ def getLastModFileOrPrompt(subStringIdentifier: str, inOutPath: str, quiet: bool
     # Get last modified file (we NOT ONLY need this for the quiet mode)
     # Backwards iterate over file list (so newest file will be first)
     for i in range(len(lastModifiedFiles) - 1, -1, -1):
-        # Select module/image summary .csv file
-        if subStringIdentifier in lastModifiedFiles[i]:
+        # Select module/image summary .csv file or a bundle
+        if subStringIdentifier in lastModifiedFiles[i] or lastModifiedFiles[i].endswith(Emma.shared_libs.stringConstants.BUNDLE_FILE_EXTENSION):
             fileToUse = lastModifiedFiles[i]
             # Exit in first match which is the newest file as we are backwards iterating
             break
@@ -71,7 +72,7 @@ def getLastModFileOrPrompt(subStringIdentifier: str, inOutPath: str, quiet: bool
 
             if text == "y":
                 break
-            if text is not None and text != "" and os.path.isfile(text) and text.endswith(".csv"):
+            if text is not None and text != "" and os.path.isfile(text) and text.endswith((".csv", Emma.shared_libs.stringConstants.BUNDLE_FILE_EXTENSION)):
                 fileToUse = text
                 break
             else:
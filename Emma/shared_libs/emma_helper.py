@@ -79,6 +79,21 @@ def readJson(jsonInFilePath):
     return dictFromJson
 
 
+def readLinesLazily(filePath, bufferSize=FILE_READ_BUFFER_SIZE):
+    """
+    Generator to iterate over the lines of a text file without loading the whole file into the memory.
+    The file is read in chunks of bufferSize bytes and the lines are yielded one-by-one, so the memory needed does not depend on the file size.
+    :param filePath: Path of the file that will be read.
+    :param bufferSize: Size of the read buffer in bytes.
+    :return: Generator yielding the lines of the file.
+    """
+    try:
+        with open(filePath, "r", buffering=bufferSize) as fp:
+            yield from fp
+    except FileNotFoundError:
+        sc().error(f"The file `{os.path.abspath(filePath)}` was not found!")
+
+
 def writeJson(jsonOutFilePath, dictToWrite):
     """
     Function to write a JSON file
@@ -137,7 +152,7 @@ def getColourValFromString(inputString):
 def lastModifiedFilesInDir(path, extension):
     """
     :param path: Directory the files are in
-    :param extension: Only files with a specified extension are included
+    :param extension: Only files with a specified extension (or one of a tuple of extensions) are included
     :return: Sorted list of modified files
     """
     result = []
@@ -0,0 +1,270 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import json
+import array
+
+import numpy
+import pandas
+
+from pypiscout.SCout_Logger import Logger as sc
+
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+
+
+# The kinds of the columns in the bundle
+COLUMN_KIND_INTEGER = "integer"             # An int64 array with the values and a bool array that marks the missing ones
+COLUMN_KIND_BOOLEAN = "boolean"             # A bool array with the values and a bool array that marks the missing ones
+COLUMN_KIND_STRING = "string"               # A unicode array with the different values and an int32 array with their codes (-1 marks the missing ones)
+# The names of the arrays of the columns of the different kinds
+COLUMN_ARRAY_NAMES = {COLUMN_KIND_INTEGER: ("data", "missing"), COLUMN_KIND_BOOLEAN: ("data", "missing"), COLUMN_KIND_STRING: ("codes", "values")}
+
+# The keys of the arrays that are not specific to a collection type
+FORMAT_VERSION_KEY = "formatVersion"
+METADATA_KEY = "metadata"
+COLLECTION_TYPES_KEY = "collectionTypes"
+
+
+def getArrayKey(collectionType, *parts):
+    """
+    Function to create the key of an array of a collection type in the bundle.
+    :param collectionType: The type of the consumer collections (e.g. Section_Summary).
+    :param parts: The parts of the key after the collection type, e.g. the index of the column and the name of its array.
+    :return: The key, the parts separated by slashes.
+    """
+    return "/".join((collectionType,) + tuple(str(part) for part in parts))
+
+
+def isMissing(value):
+    """
+    Function to check whether a report value is missing. In the CSV reports these are the empty cells.
+    :param value: The value of a report row.
+    :return: True if the value is missing, False otherwise.
+    """
+    return value is None or (isinstance(value, str) and value == "")
+
+
+class BundleColumn:
+    """
+    Collects the values of a report column batch by batch and converts them to the arrays of the bundle.
+    The integer columns are collected in a typed array, the others are dictionary encoded, since they have only a few different values.
+    The kind of a dictionary encoded column is decided by its values once all of them are known.
+    """
+    def __init__(self, isIntegerColumn):
+        # True if the column is collected in a typed array
+        self.isIntegerColumn = isIntegerColumn
+        # The values of an integer column (0 for the missing ones) and the markers of the missing values
+        self.integers = array.array("q")
+        self.missing = bytearray()
+        # The different values of a dictionary encoded column, the codes of the rows and the dictionary with the types and values as keys and their codes as values
+        self.values = []
+        self.codes = array.array("i")
+        self.index = {}
+
+    def __encode(self, value):
+        """
+        Function to get the code of a value of a dictionary encoded column. If the value was not stored yet, it will be added to the values.
+        The type is part of the key in the index, because equal values of different types (e.g. True, 1 and 1.0) are different values in the CSV reports.
+        :param value: The value.
+        :return: The code of the value.
+        """
+        indexKey = (type(value), value)
+        code = self.index.get(indexKey)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.index[indexKey] = code
+        return code
+
+    def extend(self, values):
+        """
+        Function to append the values of a batch of rows to the column.
+        :param values: Iterable of the values.
+        :return: None
+        """
+        if self.isIntegerColumn:
+            for value in values:
+                valueIsMissing = isMissing(value)
+                self.integers.append(0 if valueIsMissing else value)
+                self.missing.append(valueIsMissing)
+        else:
+            self.codes.extend(map(self.__encode, values))
+
+    def toArrays(self):
+        """
+        Function to convert the collected values to the arrays of the bundle.
+        :return: Tuple of the kind of the column (one of the COLUMN_KIND_*) and a dictionary with the names of the arrays as keys and the arrays as values.
+        """
+        if self.isIntegerColumn:
+            return COLUMN_KIND_INTEGER, {"data": numpy.frombuffer(self.integers, dtype=numpy.int64), "missing": numpy.frombuffer(self.missing, dtype=bool)}
+
+        codes = numpy.frombuffer(self.codes, dtype=numpy.dtype(self.codes.typecode))
+        missingOfCodes = numpy.array([isMissing(value) for value in self.values], dtype=bool)
+        presentValues = [value for value in self.values if not isMissing(value)]
+        if presentValues and all(isinstance(value, bool) for value in presentValues):
+            kind, dtype = COLUMN_KIND_BOOLEAN, bool
+        elif presentValues and all(isinstance(value, int) and not isinstance(value, bool) for value in presentValues):
+            kind, dtype = COLUMN_KIND_INTEGER, numpy.int64
+        else:
+            # The texts are stored once, the codes of the rows are translated to their positions
+            translation = numpy.full(len(self.values), -1, dtype=numpy.int32)
+            translation[~missingOfCodes] = numpy.arange(len(presentValues), dtype=numpy.int32)
+            return COLUMN_KIND_STRING, {"codes": translation[codes], "values": numpy.array([str(value) for value in presentValues], dtype=str)}
+
+        dataOfCodes = numpy.array([False if isMissing(value) else value for value in self.values], dtype=dtype)
+        return kind, {"data": dataOfCodes[codes], "missing": missingOfCodes[codes]}
+
+
+def createColumnArrays(headers, reportRowBatches):
+    """
+    Function to convert the rows of a report to the arrays of its columns.
+    :param headers: The headers of the report.
+    :param reportRowBatches: Iterable of the batches of the report rows (lists of the lists of the values of the rows).
+    :return: List with a tuple of the kind of the column and the dictionary of its arrays for every column (see BundleColumn.toArrays()).
+    """
+    columns = [BundleColumn(header in INTEGER_REPORT_HEADERS) for header in headers]
+    for reportRows in reportRowBatches:
+        # Transposing the batch so every column gets its values in one go
+        for column, values in zip(columns, zip(*reportRows)):
+            column.extend(values)
+    return [column.toArrays() for column in columns]
+
+
+def createFrameColumn(kind, columnArrays):
+    """
+    Function to convert the arrays of a column to the values of a DataFrame column.
+    The values are the same as the ones pandas.read_csv() creates from the CSV report: the integer columns with missing values are float64 with NaN,
+    the missing texts are NaN and the columns without any values are float64.
+    :param kind: The kind of the column (one of the COLUMN_KIND_*).
+    :param columnArrays: Dictionary with the names of the arrays of the column as keys and the arrays as values (see BundleColumn.toArrays()).
+    :return: The numpy array of the values.
+    """
+    if kind == COLUMN_KIND_STRING:
+        codes = columnArrays["codes"]
+        values = columnArrays["values"]
+        if values.size == 0:
+            return numpy.full(codes.size, numpy.nan)
+        # The code -1 of the missing values selects the NaN that is appended to the values
+        return numpy.append(values.astype(object), numpy.nan)[codes]
+
+    column = columnArrays["data"]
+    missing = columnArrays["missing"]
+    if missing.any():
+        column = column.astype(numpy.float64 if kind == COLUMN_KIND_INTEGER else object)
+        column[missing] = numpy.nan
+    return column
+
+
+def createReportFrame(headers, reportRowBatches):
+    """
+    Function to create the DataFrame of a report directly from its rows, without writing and parsing a file.
+    The DataFrame has the same columns, values and index (addrStartDec) as the one pandas.read_csv() creates from the CSV report.
+    :param headers: The headers of the report.
+    :param reportRowBatches: Iterable of the batches of the report rows (lists of the lists of the values of the rows).
+    :return: The DataFrame.
+    """
+    columns = {header: createFrameColumn(kind, columnArrays) for header, (kind, columnArrays) in zip(headers, createColumnArrays(headers, reportRowBatches))}
+    return pandas.DataFrame(columns).set_index(ADDR_START_DEC)
+
+
+def writeBundleToDisk(bundlePath, reports, metadata):
+    """
+    Writes reports into a NumPy .npz bundle. Every column of the reports is stored in typed arrays, the texts are dictionary encoded,
+    so the bundle can be loaded into DataFrames without parsing any text (see readReportFromBundle()).
+    :param bundlePath: The path of the bundle that needs to be created. If it already exists, it will be overwritten.
+    :param reports: Dictionary with the consumer collection types (e.g. Section_Summary) as keys and tuples of the report headers
+                    and an iterable of the batches of the report rows (lists of the lists of the values of the rows) as values.
+    :param metadata: Dictionary with the metadata of the bundle (e.g. the project name), it needs to be JSON serialisable.
+    :return: None
+    """
+    arrays = {FORMAT_VERSION_KEY: numpy.array(BUNDLE_FORMAT_VERSION),
+              METADATA_KEY: numpy.array(json.dumps(metadata)),
+              COLLECTION_TYPES_KEY: numpy.array(list(reports), dtype=str)}
+    for collectionType, (headers, reportRowBatches) in reports.items():
+        kinds = []
+        for columnIndex, (kind, columnArrays) in enumerate(createColumnArrays(headers, reportRowBatches)):
+            kinds.append(kind)
+            for arrayName, columnArray in columnArrays.items():
+                arrays[getArrayKey(collectionType, columnIndex, arrayName)] = columnArray
+        arrays[getArrayKey(collectionType, "headers")] = numpy.array(headers, dtype=str)
+        arrays[getArrayKey(collectionType, "kinds")] = numpy.array(kinds, dtype=str)
+
+    with open(bundlePath, "wb") as fp:
+        numpy.savez(fp, **arrays)
+
+
+def createCategoricalFrameColumn(kind, columnArrays):
+    """
+    Function to create a categorical column of a DataFrame from the arrays of a bundle column.
+    The dictionary encoded texts are used as they are, their codes become the codes of the categories; the categories are sorted like the ones pandas.read_csv() creates.
+    :param kind: The kind of the column (one of the COLUMN_KIND_*).
+    :param columnArrays: Dictionary with the names of the arrays of the column as keys and the arrays as values (see BundleColumn.toArrays()).
+    :return: The pandas.Categorical of the values.
+    """
+    if kind != COLUMN_KIND_STRING:
+        return pandas.Categorical(createFrameColumn(kind, columnArrays))
+    values = columnArrays["values"].astype(object)
+    return pandas.Categorical.from_codes(columnArrays["codes"], values).set_categories(sorted(values))
+
+
+def readReportFromBundle(bundlePath, collectionType, columns=None, categoricalColumns=()):
+    """
+    Reads a report from a bundle created by the writeBundleToDisk() into a DataFrame.
+    The DataFrame has the same columns, values and index (addrStartDec) as the one pandas.read_csv() creates from the CSV report (see createFrameColumn()).
+    :param bundlePath: The path of the bundle.
+    :param collectionType: The type of the consumer collections that needs to be read (e.g. Section_Summary).
+    :param columns: Iterable of the headers of the columns that need to be read (including addrStartDec) or None for all the columns. The arrays of the others are not loaded.
+    :param categoricalColumns: Iterable of the headers of the columns that will be categorical.
+    :return: The DataFrame.
+    """
+    frameColumns = {}
+    with numpy.load(bundlePath, allow_pickle=False) as bundle:
+        formatVersion = int(bundle[FORMAT_VERSION_KEY])
+        if formatVersion != BUNDLE_FORMAT_VERSION:
+            sc().error(f"The bundle `{bundlePath}` has the format version {formatVersion}, only the version {BUNDLE_FORMAT_VERSION} can be read!")
+        if collectionType not in bundle[COLLECTION_TYPES_KEY]:
+            sc().error(f"The bundle `{bundlePath}` does not contain the {collectionType} report!")
+
+        headers = bundle[getArrayKey(collectionType, "headers")]
+        kinds = bundle[getArrayKey(collectionType, "kinds")]
+        for columnIndex, (header, kind) in enumerate(zip(headers, kinds)):
+            header = str(header)
+            if columns is not None and header not in columns:
+                continue
+            columnArrays = {arrayName: bundle[getArrayKey(collectionType, columnIndex, arrayName)] for arrayName in COLUMN_ARRAY_NAMES[kind]}
+            if header in categoricalColumns:
+                frameColumns[header] = createCategoricalFrameColumn(kind, columnArrays)
+            else:
+                frameColumns[header] = createFrameColumn(kind, columnArrays)
+
+    return pandas.DataFrame(frameColumns).set_index(ADDR_START_DEC)
+
+
+def readReport(reportPath, collectionType, columns=None, categoricalColumns=()):
+    """
+    Reads a report into a DataFrame, either from a CSV report or from a bundle.
+    :param reportPath: The path of the CSV report or of the bundle (recognised by its BUNDLE_FILE_EXTENSION).
+    :param collectionType: The type of the consumer collections that needs to be read from a bundle (e.g. Section_Summary). A CSV report contains only one type.
+    :param columns: Iterable of the headers of the columns that need to be read (including addrStartDec) or None for all the columns.
+    :param categoricalColumns: Iterable of the headers of the columns that will be categorical.
+    :return: The DataFrame with the addrStartDec column as index.
+    """
+    if reportPath.endswith(BUNDLE_FILE_EXTENSION):
+        return readReportFromBundle(reportPath, collectionType, columns, categoricalColumns)
+    return pandas.read_csv(reportPath, sep=";", index_col=ADDR_START_DEC, usecols=columns, dtype=dict.fromkeys(categoricalColumns, "category"))
@@ -50,6 +50,7 @@ EPILOG =\
 FILE_IDENTIFIER_SECTION_SUMMARY = "Section_Summary"
 FILE_IDENTIFIER_OBJECT_SUMMARY = "Object_Summary"
 FILE_IDENTIFIER_OBJECTS_IN_SECTIONS = "Objects_in_Sections"
+FILE_READ_BUFFER_SIZE = 1024 * 1024     # Size of the read buffer in bytes used for reading the mapfiles and the monolith files line-by-line
 FQN = "FQN"
 IGNORE_CONFIG_ID = "ignoreConfigID"
 IGNORE_MEMORY = "ignoreMemory"
@@ -65,6 +66,9 @@ MODULE_SIZE_BYTE = "Module Size [Byte]"
 MODULE_SIZE_PERCENT = "Module Size [%]"
 OVERLAP_FLAG = "Overlapped by [configID::mapfile::section::object]"     # Is is "by" and not "with" because the sec/obj which overlaps is the one with the lower start address
 PERCENTAGE = "percentage"
+REPORT_HUMAN_READABLE_SIZE_CACHE_SIZE = 65536      # Number of different sizes whose human readable format is cached during the report writing
+REPORT_WRITE_BATCH_SIZE = 10000        # Number of report rows that are formatted and written at once
+REPORT_WRITE_BUFFER_SIZE = 1024 * 1024    # Size of the write buffer in bytes used for writing the reports
 SECTION_NAME = "section"
 SECTION_SIZE_BYTE = "Section Size [Byte]"
 SIZE_DEC = "sizeDec [Byte]"
@@ -285,3 +289,40 @@ SECTIONS_TO_EXCLUDE = DWARF_SECTIONS.union(frozenset(
 ))
 
 COMPILER_NAME_GHS = "GHS"
+
+# The engines the mapfiles can be parsed with
+PARSER_ENGINE_LINES = "lines"           # The mapfile is read line-by-line and the regex patterns are searched in every line
+PARSER_ENGINE_MMAP = "mmap"             # The mapfile is memory-mapped and bytes regex patterns are run over its blocks
+PARSER_ENGINES = (PARSER_ENGINE_LINES, PARSER_ENGINE_MMAP)
+
+# The cache of the extracted mapfile elements
+CACHE_FILE_EXTENSION = ".cache"
+CACHE_TEMPORARY_FILE_EXTENSION = ".tmp"
+CACHE_HASH_CHUNK_SIZE = 1024 * 1024         # The files are hashed in chunks of this size (in bytes)
+DEFAULT_CACHE_SIZE_MB = 256                 # The default size limit of the cache directory (in MiB)
+CONFIG_ID_CACHE_KEY_TAG = "configIdResults"  # Distinguishes the keys of the configId results from the ones of the mapfile elements
+
+# The formats the reports can be written in
+REPORT_FORMAT_CSV = "csv"                   # A CSV file for every consumer collection
+REPORT_FORMAT_SQLITE = "sqlite"             # A single SQLite database with a table for every consumer collection
+REPORT_FORMAT_NPZ = "npz"                   # A single NumPy bundle with the columns of every consumer collection
+REPORT_FORMATS = (REPORT_FORMAT_CSV, REPORT_FORMAT_SQLITE, REPORT_FORMAT_NPZ)
+INTEGER_REPORT_HEADERS = (ADDR_START_DEC, ADDR_END_DEC, SIZE_DEC, SIZE_DEC_ORIGINAL)   # The report columns with integer values (or nothing), the others contain texts
+CSV_FILE_EXTENSION = ".csv"
+SQLITE_FILE_EXTENSION = ".db"
+SQLITE_REPORT_NAME = "Results"              # The database is named like the CSV reports, with this instead of the collection type
+SQLITE_METADATA_TABLE = "metadata"
+SQLITE_CONFIG_IDS_TABLE = "configIDs"
+SQLITE_FORMAT_VERSION = 1                   # Needs to be increased if the layout of the database changes
+BUNDLE_FILE_EXTENSION = ".npz"
+BUNDLE_REPORT_NAME = "Results"              # The bundle is named like the CSV reports, with this instead of the collection type
+BUNDLE_FORMAT_VERSION = 1                   # Needs to be increased if the layout of the bundle changes
+
+# The report columns the visualiser reads, the others are not loaded at all
+VISUALISER_FLAG_COLUMNS = (ADDR_START_DEC, ADDR_END_DEC, SIZE_DEC, CONFIG_ID, OVERLAP_FLAG, CONTAINMENT_FLAG, DUPLICATE_FLAG)   # Needed by every report to resolve the flags
+VISUALISER_REPORT_COLUMNS = {
+    FILE_IDENTIFIER_SECTION_SUMMARY: VISUALISER_FLAG_COLUMNS + (SECTION_NAME, MEM_TYPE, MEM_TYPE_TAG, MAPFILE),
+    FILE_IDENTIFIER_OBJECT_SUMMARY: VISUALISER_FLAG_COLUMNS + (SECTION_NAME, OBJECT_NAME, MEM_TYPE, CATEGORY),
+    FILE_IDENTIFIER_OBJECTS_IN_SECTIONS: VISUALISER_FLAG_COLUMNS + (MEM_TYPE, CATEGORY)
+}
+VISUALISER_CATEGORICAL_COLUMNS = (CONFIG_ID, MEM_TYPE, MEM_TYPE_TAG, CATEGORY, MAPFILE, SECTION_NAME)   # These have only a few different values
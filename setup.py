@@ -43,6 +43,7 @@ setuptools.setup(
                       "Markdown",
                       "matplotlib",
                       "pandas",
+                      "numpy",
                       "pypiscout>=2.0",
                       "graphviz"
                       ],
@@ -57,7 +58,8 @@ setuptools.setup(
         "console_scripts": [
             "emma=Emma.emma:runEmma",
             "emma_vis=Emma.emma_vis:runEmmaVis",
-            "emma_deltas=Emma.emma_vis:runEmmaDeltas"
+            "emma_deltas=Emma.emma_vis:runEmmaDeltas",
+            "emma_pipeline=Emma.emma_pipeline:runEmmaPipeline"
         ],
     },
     keywords=[
@@ -0,0 +1,90 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+# Emma Memory and Mapfile Analyser - benchmark of the line tokenizer against the regex pattern
+# Usage: python tests/benchmarks/benchmark_lineTokenizer.py [--lines N] [--padding N] [--trailing N] [--repeat N]
+
+
+import os
+import re
+import sys
+import timeit
+import argparse
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+import Emma.emma_libs.ghsMapfileRegexes
+
+
+def createModuleSummaryLines(numberOfLines, padding, trailing):
+    """
+    Creates module summary lines in the default GHS layout.
+    :param numberOfLines: The number of lines to create.
+    :param padding: The width the section names are padded to with spaces.
+    :param trailing: The number of whitespaces at the end of the lines.
+    :return: List of lines.
+    """
+    return [f"{(0x1000 * index):08x}+{(index % 0x1000):06x}  {'.text' + str(index % 7):<{padding}} module_{index}.o{' ' * trailing}\n" for index in range(numberOfLines)]
+
+
+def measure(extractor, groupNames, lines, repeat):
+    """
+    Measures the throughput of an extractor, including the access of the groups that are needed for the MemEntry creation.
+    :param extractor: The function that creates the line components from a line.
+    :param groupNames: The names of the groups that will be accessed.
+    :param lines: The lines the extractor will be called with.
+    :param repeat: The number of measurements, the best one will be used.
+    :return: The number of processed lines per second.
+    """
+    def run():
+        for line in lines:
+            lineComponents = extractor(line)
+            for groupName in groupNames:
+                lineComponents.group(groupName)
+    return len(lines) / min(timeit.repeat(run, number=1, repeat=repeat))
+
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Benchmark of the line tokenizer against the regex pattern of the default GHS module summary layout.")
+    parser.add_argument("--lines", help="Number of lines per layout.", type=int, default=100000)
+    parser.add_argument("--padding", help="Width the section names are padded to.", type=int, default=16)
+    parser.add_argument("--trailing", help="Number of whitespaces at the end of the lines, the module summary regex needs quadratic time in it.", type=int, default=0)
+    parser.add_argument("--repeat", help="Number of measurements, the best one is reported.", type=int, default=3)
+    arguments = parser.parse_args()
+
+    patterns = {
+        "Module Summary": (Emma.emma_libs.ghsMapfileRegexes.ModuleSummaryPattern(), createModuleSummaryLines(arguments.lines, arguments.padding, arguments.trailing))
+    }
+    for name, (pattern, lines) in patterns.items():
+        groupNames = (pattern.Groups.origin, pattern.Groups.size, pattern.Groups.section, pattern.Groups.name)
+        # Making sure that the benchmark measures the fast path of the tokenizer
+        if any(pattern.lineTokenizer(line) is None for line in lines):
+            raise ValueError("The generated " + name + " lines are not in the default layout!")
+        regexLinesPerSecond = measure(lambda line, compiledPattern=pattern.pattern: re.search(compiledPattern, line), groupNames, lines, arguments.repeat)
+        tokenizerLinesPerSecond = measure(pattern.lineTokenizer, groupNames, lines, arguments.repeat)
+        print(f"{name:<16} regex: {regexLinesPerSecond:>12,.0f} lines/s    tokenizer: {tokenizerLinesPerSecond:>12,.0f} lines/s    speed-up: {tokenizerLinesPerSecond / regexLinesPerSecond:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
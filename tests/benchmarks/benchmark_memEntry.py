@@ -0,0 +1,74 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+# Emma Memory and Mapfile Analyser - benchmark of the memory needed by the MemEntry objects
+# Usage: python tests/benchmarks/benchmark_memEntry.py [--project PATH] [--mapfiles PATH] [--scale N]
+
+
+import os
+import sys
+import argparse
+import tracemalloc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+from pypiscout.SCout_Logger import Logger as sc
+
+import Emma.shared_libs.emma_helper
+import Emma.emma_libs.configuration
+import Emma.emma_libs.mapfileProcessorFactory
+
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    The mapfiles of the project are processed --scale times and all the created MemEntry objects are kept,
+    as if the project had --scale times more mapfiles. The memory that was allocated for them is divided by their number.
+    :return: None
+    """
+    testProjectFolder = os.path.join(os.path.dirname(__file__), "..", "..", "doc", "test_project")
+    parser = argparse.ArgumentParser(description="Benchmark of the memory needed per MemEntry object created from the mapfiles of a project.")
+    parser.add_argument("--project", help="Path of directory holding the configuration.", default=testProjectFolder)
+    parser.add_argument("--mapfiles", help="The folder containing the map files.", default=os.path.join(testProjectFolder, "mapfiles"))
+    parser.add_argument("--scale", help="Number of times the mapfiles are processed.", type=int, default=200)
+    arguments = parser.parse_args()
+
+    # Only the errors are shown
+    sc()(invVerbosity=3, actionWarning=None, actionError=lambda: sys.exit(-10))
+
+    configuration = Emma.emma_libs.configuration.Configuration()
+    configuration.readConfiguration(Emma.shared_libs.emma_helper.joinPath(arguments.project), Emma.shared_libs.emma_helper.joinPath(arguments.mapfiles), True)
+
+    collections = []
+    tracemalloc.start()
+    memoryBefore = tracemalloc.get_traced_memory()[0]
+    for _ in range(arguments.scale):
+        for configId, configIdConfiguration in configuration.globalConfig.items():
+            mapfileProcessor = Emma.emma_libs.mapfileProcessorFactory.createSpecificMapfileProcesor(configIdConfiguration["compiler"])
+            collections.extend(mapfileProcessor.processMapfiles(configId, configIdConfiguration, False))
+    memoryAfter = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    numberOfEntries = sum(len(collection) for collection in collections)
+    print(f"MemEntry objects: {numberOfEntries:,}    memory: {(memoryAfter - memoryBefore) / (1024 * 1024):,.1f} MiB    bytes per entry: {(memoryAfter - memoryBefore) / numberOfEntries:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,7 +23,9 @@ import unittest
 import sys
 import os
 import shutil
+import unittest.mock
 
+import pandas.testing
 from pypiscout.SCout_Logger import Logger as sc
 from matplotlib import pyplot as plt
 
@@ -33,6 +35,13 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 
 import Emma.emma
 import Emma.emma_vis
+import Emma.emma_pipeline
+import Emma.emma_libs.memoryMap
+import Emma.emma_libs.memoryManager
+import Emma.shared_libs.reportBundle
+import Emma.emma_delta_libs.Delta
+import Emma.emma_delta_libs.FilePresenter
+import Emma.emma_delta_libs.FileSelector
 from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
 
 
@@ -90,6 +99,27 @@ class TestHelper(unittest.TestCase):
         # Creating the output folder for the results with the test case name
         os.makedirs(self.cmdLineTestOutputFolder)
 
+    def runEmmaAndReadReports(self, outputFolder, additionalArgs=()):
+        """
+        Runs the Emma on the test project and reads the CSV reports it created.
+        :param outputFolder: The output folder that will be given as the --dir parameter.
+        :param additionalArgs: Iterable of further command line arguments.
+        :return: Dictionary with the FILE_IDENTIFIERs as keys and the content of the reports (bytes) as values. The timestamps in the file names are ignored.
+        """
+        args = Emma.emma.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--dir", outputFolder, "--noprompt", *additionalArgs])
+        Emma.emma.main(args)
+
+        reports = {}
+        memStatsFolder = os.path.join(outputFolder, OUTPUT_DIR)
+        projectName = os.path.basename(self.cmdLineTestProjectFolder)
+        for file in os.listdir(memStatsFolder):
+            for collectionType in (FILE_IDENTIFIER_SECTION_SUMMARY, FILE_IDENTIFIER_OBJECT_SUMMARY, FILE_IDENTIFIER_OBJECTS_IN_SECTIONS):
+                if file.startswith(projectName + "_" + collectionType + "_") and file.endswith(CSV_FILE_EXTENSION):
+                    with open(os.path.join(memStatsFolder, file), "rb") as fp:
+                        reports[collectionType] = fp.read()
+        self.assertEqual(len(reports), 3, "Not every CSV report was found in `" + memStatsFolder + "`!")
+        return reports
+
     def deInit(self):
         """
         Clearing up the environment of the test.
@@ -175,6 +205,82 @@ class CmdEmma(TestHelper):
                                 # Rationale: The purpose here is to catch any exception.
             self.fail("Unexpected exception: " + str(e))
 
+    def test_jobs(self):
+        """
+        Check that a run with more than one job creates the same reports as a serial run
+        """
+        serialReports = self.runEmmaAndReadReports(os.path.join(self.cmdLineTestOutputFolder, "serial"))
+        parallelReports = self.runEmmaAndReadReports(os.path.join(self.cmdLineTestOutputFolder, "parallel"), ["--jobs", "2"])
+        self.assertEqual(serialReports, parallelReports)
+
+    def test_mmapParserEngine(self):
+        """
+        Check that a run with the mmap parser engine creates the same reports as the default engine
+        """
+        defaultReports = self.runEmmaAndReadReports(os.path.join(self.cmdLineTestOutputFolder, "default"))
+        mmapReports = self.runEmmaAndReadReports(os.path.join(self.cmdLineTestOutputFolder, "mmap"), ["--parser_engine", "mmap"])
+        self.assertEqual(defaultReports, mmapReports)
+
+    def test_parseCache(self):
+        """
+        Check that runs with a parse cache create the same reports as an uncached run, both when the cache is empty and when it already contains the mapfiles
+        """
+        cacheArgs = ["--cache_dir", os.path.join(self.cmdLineTestOutputFolder, "cache")]
+        uncachedReports = self.runEmmaAndReadReports(os.path.join(self.cmdLineTestOutputFolder, "uncached"))
+        emptyCacheReports = self.runEmmaAndReadReports(os.path.join(self.cmdLineTestOutputFolder, "emptyCache"), cacheArgs)
+        filledCacheReports = self.runEmmaAndReadReports(os.path.join(self.cmdLineTestOutputFolder, "filledCache"), cacheArgs)
+        self.assertTrue(os.listdir(os.path.join(self.cmdLineTestOutputFolder, "cache")))
+        self.assertEqual(uncachedReports, emptyCacheReports)
+        self.assertEqual(uncachedReports, filledCacheReports)
+
+    def test_cachedWarnings(self):
+        """
+        Check that the warnings of the processing are shown again when the results of the configIds are reused from the cache
+        """
+        args = Emma.emma.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--dir", self.cmdLineTestOutputFolder,
+                                    "--noprompt", "--cache_dir", os.path.join(self.cmdLineTestOutputFolder, "cache")])
+        warnings = []
+        for _ in range(2):
+            with unittest.mock.patch.object(sc(), "warning") as warning:
+                Emma.emma.main(args)
+            warnings.append([call.args for call in warning.call_args_list])
+        # The test project has an element that does not belong to any of the memory regions
+        self.assertTrue(any("It does not belong to any of the memory regions!" in "".join(text) for text in warnings[0]))
+        self.assertEqual(warnings[0], warnings[1])
+
+    def test_sqliteFormat(self):
+        """
+        Check that a run storing the results both as CSV reports and as an SQLite database is successful
+        """
+        try:
+            args = Emma.emma.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--dir", self.cmdLineTestOutputFolder,
+                                        "--format", "csv", "sqlite"])
+            Emma.emma.main(args)
+        except Exception as e:  # pylint: disable=broad-except
+                                # Rationale: The purpose here is to catch any exception.
+            self.fail("Unexpected exception: " + str(e))
+
+    def test_npzFormat(self):
+        """
+        Check that a run storing the results only as a NumPy bundle is successful
+        """
+        try:
+            args = Emma.emma.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--dir", self.cmdLineTestOutputFolder,
+                                        "--format", "npz"])
+            Emma.emma.main(args)
+        except Exception as e:  # pylint: disable=broad-except
+                                # Rationale: The purpose here is to catch any exception.
+            self.fail("Unexpected exception: " + str(e))
+
+    def test_invalidJobs(self):
+        """
+        Check run with a number of jobs that is less than one
+        """
+        with self.assertRaises(SystemExit) as context:
+            args = Emma.emma.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--dir", self.cmdLineTestOutputFolder, "--jobs", "0"])
+            Emma.emma.main(args)
+        self.assertEqual(context.exception.code, -10)
+
 
 class CmdEmmaVis(TestHelper):
     # pylint: disable=invalid-name
@@ -266,6 +372,120 @@ class CmdEmmaVis(TestHelper):
             self.fail("Unexpected exception: " + str(e))
 
 
+
+class CmdEmmaPipeline(TestHelper):
+    # pylint: disable=invalid-name
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>().
+
+    """
+    Class containing tests for testing the command line argument processing for the Emma analyser and visualiser pipeline.
+    """
+
+    def setUp(self):
+        self.init("CmdEmmaPipeline")
+
+    def tearDown(self):
+        self.deInit()
+
+    def test_normalRun(self):
+        """
+        Check that an ordinary run is successful and that it does not write reports if no format is given
+        """
+        try:
+            args = Emma.emma_pipeline.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--dir", self.cmdLineTestOutputFolder,
+                                                 "--overview", "--noprompt"])
+            Emma.emma_pipeline.main(args)
+            plt.close('all')
+        except Exception as e:  # pylint: disable=broad-except
+                                # Rationale: The purpose here is to catch any exception.
+            self.fail("Unexpected exception: " + str(e))
+        self.assertFalse(os.path.isdir(os.path.join(self.cmdLineTestOutputFolder, OUTPUT_DIR)))
+        self.assertTrue(os.path.isdir(os.path.join(self.cmdLineTestOutputFolder, OUTPUT_DIR_VISUALISER)))
+
+    def test_reportFrames(self):
+        """
+        Check that the reports handed over to the visualiser are the same as the DataFrames read from the CSV reports
+        """
+        args = Emma.emma_pipeline.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--dir", self.cmdLineTestOutputFolder,
+                                             "--noprompt", "--format", "csv"])
+        memoryManager = Emma.emma_libs.memoryManager.MemoryManager(*Emma.emma.processArguments(args))
+        memoryManager.readConfiguration()
+        memoryManager.processMapfiles()
+        memoryManager.createReports()
+        reportFrames = memoryManager.createReportFrames()
+
+        memStatsFolder = os.path.join(self.cmdLineTestOutputFolder, OUTPUT_DIR)
+        projectName = os.path.basename(self.cmdLineTestProjectFolder)
+        self.assertEqual(set(reportFrames), {FILE_IDENTIFIER_SECTION_SUMMARY, FILE_IDENTIFIER_OBJECT_SUMMARY, FILE_IDENTIFIER_OBJECTS_IN_SECTIONS})
+        for collectionType, reportFrame in reportFrames.items():
+            reportPath = os.path.join(memStatsFolder, projectName + "_" + collectionType + "_" + Emma.emma_libs.memoryMap.TIMESTAMP + CSV_FILE_EXTENSION)
+            pandas.testing.assert_frame_equal(reportFrame, Emma.shared_libs.reportBundle.readReport(reportPath, collectionType))
+
+    def test_help(self):
+        """
+        Check that `--help` does not raise an exception but exits with SystemExit(0)
+        """
+        with self.assertRaises(SystemExit) as context:
+            args = Emma.emma_pipeline.parseArgs(["--help"])
+            Emma.emma_pipeline.main(args)
+        self.assertEqual(context.exception.code, 0)
+
+    def test_unrecognisedArgs(self):
+        """
+        Check that an unexpected argument does raise an exception
+        """
+        with self.assertRaises(SystemExit) as context:
+            args = Emma.emma_pipeline.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder, "--blahhhhhh", "--noprompt"])
+            Emma.emma_pipeline.main(args)
+        self.assertEqual(context.exception.code, 2)
+
+class CmdEmmaDeltas(TestHelper):
+    # pylint: disable=invalid-name
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>().
+
+    """
+    Class containing tests for the Emma Deltas.
+    """
+
+    def setUp(self):
+        self.init("CmdEmmaDeltas")
+
+    def tearDown(self):
+        self.deInit()
+
+    def test_deltaOfBundles(self):
+        """
+        Check that the delta of two .npz bundles chosen with the file selector is the same as the delta of the CSV reports of the chosen summary
+        """
+        # The Emma Deltas looks for the analyses in the memStats folder of the project directory, the results of every analysis are in its own memStats folder
+        # The analyses get different timestamps, like they would if they were run one after the other, so the columns of the delta get different suffixes
+        for version, timestamp in (("version1", "2019-01-01-00h00s00"), ("version2", "2019-01-02-00h00s00")):
+            args = Emma.emma.parseArgs(["--project", self.cmdLineTestProjectFolder, "--mapfiles", self.cmdLineTestProjectMapfilesFolder,
+                                        "--dir", os.path.join(self.cmdLineTestOutputFolder, OUTPUT_DIR, version), "--noprompt", "--format", "csv", "npz"])
+            with unittest.mock.patch.object(Emma.emma_libs.memoryMap, "TIMESTAMP", timestamp):
+                Emma.emma.main(args)
+
+        fileSelector = Emma.emma_delta_libs.FileSelector.FileSelector(projectDir=self.cmdLineTestOutputFolder)
+        filePresenter = Emma.emma_delta_libs.FilePresenter.FilePresenter(fileSelector=fileSelector)
+        # Choosing the object summary and the two analyses
+        with unittest.mock.patch("builtins.input", side_effect=["1", "0 1"]), unittest.mock.patch("builtins.print"):
+            bundles = filePresenter.chooseCandidates()
+        self.assertEqual(filePresenter.getFiletype(), FILE_IDENTIFIER_OBJECT_SUMMARY)
+        self.assertEqual(len(bundles), 2)
+        self.assertTrue(all(bundle.endswith(BUNDLE_FILE_EXTENSION) for bundle in bundles))
+
+        csvReports = [os.path.join(os.path.dirname(bundle), file) for bundle in bundles for file in os.listdir(os.path.dirname(bundle))
+                      if FILE_IDENTIFIER_OBJECT_SUMMARY in file and file.endswith(CSV_FILE_EXTENSION)]
+        outfile = os.path.join(self.cmdLineTestOutputFolder, "delta.csv")
+        bundleDelta = Emma.emma_delta_libs.Delta.Delta(files=bundles, outfile=outfile, collectionType=filePresenter.getFiletype()).getDelta()
+        csvDelta = Emma.emma_delta_libs.Delta.Delta(files=csvReports, outfile=outfile, collectionType=filePresenter.getFiletype()).getDelta()
+        self.assertFalse(bundleDelta.empty)
+        # The object summary was read from the bundles, not the default section summary
+        self.assertIn(OBJECT_NAME + "_" + os.path.splitext(os.path.basename(bundles[0]))[0].replace(BUNDLE_REPORT_NAME, ""), bundleDelta.columns)
+        # The file names of the bundles and of the reports only differ in the collection type and the bundle name, so the columns get the same suffixes
+        self.assertEqual(bundleDelta.to_csv(sep=";"), csvDelta.to_csv(sep=";"))
+
+
 if __name__ == '__main__':
     if len(sys.argv) > 1:
         sys.argv.pop()
@@ -0,0 +1,46 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import collections
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+import Emma.emma_libs.memoryEntry
+
+
+def createMemEntry(addressStart, addressLength, sectionName, objectName="", configId="MCU"):
+    """
+    Function to create a MemEntry for the unit tests. The entries only differ in the given values, the other ones are the same for all of them.
+    :param addressStart: The start address of the entry.
+    :param addressLength: The length of the entry.
+    :param sectionName: The name of the section.
+    :param objectName: The name of the object, empty for the sections.
+    :param configId: The configId the entry belongs to.
+    :return: The MemEntry object.
+    """
+    compilerSpecificData = collections.OrderedDict()
+    compilerSpecificData["DMA"] = True
+    compilerSpecificData["vasName"] = ""
+    compilerSpecificData["vasSectionName"] = ""
+    return Emma.emma_libs.memoryEntry.MemEntry(configID=configId, mapfileName="mapfile.map", addressStart=addressStart, addressLength=addressLength, sectionName=sectionName,
+                                               objectName=objectName, memType="INT_FLASH", memTypeTag="", category="<Unspecified>", compilerSpecificData=compilerSpecificData)
@@ -0,0 +1,54 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+import Emma.emma_libs.categorisation
+
+
+class KeywordMatcherTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def test_match(self):
+        keywordMatcher = Emma.emma_libs.categorisation.KeywordMatcher({"Startup": ["crt0", "startup"], "Os": ["os_", "task"], "Tasks": ["task"]})
+        self.assertIsNotNone(keywordMatcher.combinedPattern)
+        self.assertEqual(keywordMatcher.match("crt0.o"), "Startup")
+        self.assertEqual(keywordMatcher.match("os_kernel.o"), "Os")
+        # If the keywords of more categories match, then the last category of the file is used
+        self.assertEqual(keywordMatcher.match("os_task.o"), "Tasks")
+        self.assertIsNone(keywordMatcher.match("main.o"))
+
+    def test_matchKeywordsWithGroups(self):
+        # The keywords reference their groups by numbers, so they can not be combined into a single pattern
+        keywordMatcher = Emma.emma_libs.categorisation.KeywordMatcher({"Doubled": [r"(\d)\1"], "Library": ["lib"]})
+        self.assertIsNone(keywordMatcher.combinedPattern)
+        self.assertEqual(keywordMatcher.match("module11.o"), "Doubled")
+        self.assertEqual(keywordMatcher.match("lib11.a"), "Library")
+        self.assertIsNone(keywordMatcher.match("module12.o"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+from pypiscout.SCout_Logger import Logger as sc
+
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.emma_libs.diskCache
+
+
+class DiskCacheTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        # Setting up the logger
+        sc()(4, actionWarning=None, actionError=lambda: sys.exit("error"))
+        self.cacheDirectory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cacheDirectory)
+
+    def getEntryCount(self):
+        return len([fileName for fileName in os.listdir(self.cacheDirectory) if fileName.endswith(CACHE_FILE_EXTENSION)])
+
+    def test_createKey(self):
+        key = Emma.emma_libs.diskCache.DiskCache.createKey("configId", {"VAS": "vasName"}, 0x100, False)
+        self.assertEqual(key, Emma.emma_libs.diskCache.DiskCache.createKey("configId", {"VAS": "vasName"}, 0x100, False))
+        self.assertNotEqual(key, Emma.emma_libs.diskCache.DiskCache.createKey("configId", {"VAS": "vasName"}, 0x100, True))
+        # The components are separated, so they can not be shifted into each other
+        self.assertNotEqual(Emma.emma_libs.diskCache.DiskCache.createKey("ab", "c"), Emma.emma_libs.diskCache.DiskCache.createKey("a", "bc"))
+
+    def test_storeAndLoad(self):
+        diskCache = Emma.emma_libs.diskCache.DiskCache(self.cacheDirectory, 1024 * 1024)
+        key = diskCache.createKey("mapfile")
+        self.assertIsNone(diskCache.load(key))
+        value = ([(0x100, 0x10, ".text", "", None)], [], ["warning"])
+        diskCache.store(key, value)
+        self.assertEqual(diskCache.load(key), value)
+        self.assertEqual(self.getEntryCount(), 1)
+
+    def test_loadCorruptedEntry(self):
+        diskCache = Emma.emma_libs.diskCache.DiskCache(self.cacheDirectory, 1024 * 1024)
+        key = diskCache.createKey("mapfile")
+        with open(os.path.join(self.cacheDirectory, key + CACHE_FILE_EXTENSION), "wb") as fp:
+            fp.write(b"This is not a cache entry.")
+        self.assertIsNone(diskCache.load(key))
+        # The corrupted entry was removed
+        self.assertEqual(self.getEntryCount(), 0)
+
+    def test_evictLeastRecentlyUsed(self):
+        diskCache = Emma.emma_libs.diskCache.DiskCache(self.cacheDirectory, 1024 * 1024)
+        keys = [diskCache.createKey("mapfile", index) for index in range(3)]
+        for index, key in enumerate(keys):
+            # Random bytes can not be compressed, so every entry is bigger than 400 kiB
+            diskCache.store(key, os.urandom(400 * 1024))
+            # Making the order of the entries unambiguous
+            entryPath = os.path.join(self.cacheDirectory, key + CACHE_FILE_EXTENSION)
+            os.utime(entryPath, (index, index))
+        # The limit was exceeded by the third entry, so the least recently used first one was removed
+        self.assertEqual(self.getEntryCount(), 2)
+        self.assertIsNone(diskCache.load(keys[0]))
+        # Using the second entry makes the third one the least recently used
+        self.assertIsNotNone(diskCache.load(keys[1]))
+        os.utime(os.path.join(self.cacheDirectory, keys[2] + CACHE_FILE_EXTENSION), (0, 0))
+        diskCache.store(keys[0], os.urandom(400 * 1024))
+        self.assertIsNone(diskCache.load(keys[2]))
+        self.assertIsNotNone(diskCache.load(keys[1]))
+        self.assertIsNotNone(diskCache.load(keys[0]))
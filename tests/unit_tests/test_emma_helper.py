@@ -92,6 +92,23 @@ class EmmaHelperTestCase(unittest.TestCase):
         os.remove(jsonTestFilePath)
         self.assertFalse(os.path.exists(jsonTestFilePath))
 
+    def test_readLinesLazily(self):
+        textTestFilePath = os.path.join(os.path.dirname(__file__), "..", "other_files", "testLines.txt")
+        self.assertFalse(os.path.exists(textTestFilePath))
+
+        linesToWrite = ["First line\n", "Second line\n", "Last line without newline"]
+        with open(textTestFilePath, "w") as fp:
+            fp.writelines(linesToWrite)
+        # A small buffer makes sure that lines spanning over more buffer chunks are handled as well
+        self.assertEqual(list(Emma.shared_libs.emma_helper.readLinesLazily(textTestFilePath, bufferSize=4)), linesToWrite)
+        self.assertEqual(list(Emma.shared_libs.emma_helper.readLinesLazily(textTestFilePath)), linesToWrite)
+
+        os.remove(textTestFilePath)
+        self.assertFalse(os.path.exists(textTestFilePath))
+        with self.assertRaises(SystemExit) as contextManager:
+            list(Emma.shared_libs.emma_helper.readLinesLazily(textTestFilePath))
+        self.assertEqual(contextManager.exception.code, "error")
+
     def test_unifyAddress(self):
         hexResult, decResult = Emma.shared_libs.emma_helper.unifyAddress("0x16")
         self.assertEqual(hexResult, "0x16")
@@ -0,0 +1,79 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+import Emma.emma_libs.ghsMapfileProcessor
+
+
+class VirtualSectionIndexTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        # Monolith table entries: [virtual, physical, offset, size, section]
+        self.monolithFileContent = [
+            [0x3000, 0x83000, 0x80000, 0x1000, ".vas_c"],
+            [0x1000, 0x81000, 0x80000, 0x1000, ".vas_a"],
+            [0x2000, 0x92000, 0x90000, 0x0800, ".other_vas"],
+            [0x2000, 0xA2000, 0xA0000, 0x0800, ".vas_b"],
+            [0x2800, 0xB2800, 0xB0000, 0x0000, ".vas_empty"]
+        ]
+
+    def test_translateAddress(self):
+        virtualSectionIndex = Emma.emma_libs.ghsMapfileProcessor.VirtualSectionIndex([".vas_a", ".vas_b", ".vas_c", ".vas_empty"], self.monolithFileContent)
+        self.assertIsNotNone(virtualSectionIndex.startAddresses)
+        self.assertEqual(virtualSectionIndex.translateAddress(0x1000, 0x1000), (0x81000, ".vas_a"))
+        self.assertEqual(virtualSectionIndex.translateAddress(0x1800, 0x10), (0x81800, ".vas_a"))
+        self.assertEqual(virtualSectionIndex.translateAddress(0x2010, 0x10), (0xA2010, ".vas_b"))
+        self.assertEqual(virtualSectionIndex.translateAddress(0x2800, 0), (0xB2800, ".vas_empty"))
+        self.assertEqual(virtualSectionIndex.translateAddress(0x3FFF, 1), (0x83FFF, ".vas_c"))
+        # Elements that are not contained by any of the sections
+        self.assertEqual(virtualSectionIndex.translateAddress(0x0800, 0x10), (None, None))
+        self.assertEqual(virtualSectionIndex.translateAddress(0x1FF0, 0x20), (None, None))
+        self.assertEqual(virtualSectionIndex.translateAddress(0x3FFF, 2), (None, None))
+        self.assertEqual(virtualSectionIndex.translateAddress(0x4000, 0x10), (None, None))
+
+    def test_translateAddressOverlappingSections(self):
+        # The sections of the other VAS are not part of the index, but if they were, then the first one in the monolith table had to be used
+        virtualSectionIndex = Emma.emma_libs.ghsMapfileProcessor.VirtualSectionIndex([".vas_b", ".other_vas"], self.monolithFileContent)
+        self.assertIsNone(virtualSectionIndex.startAddresses)
+        self.assertEqual(virtualSectionIndex.translateAddress(0x2010, 0x10), (0x92010, ".other_vas"))
+        self.assertEqual(virtualSectionIndex.translateAddress(0x1000, 0x10), (None, None))
+
+    def test_translateAddressWithoutSections(self):
+        virtualSectionIndex = Emma.emma_libs.ghsMapfileProcessor.VirtualSectionIndex([".not_in_the_monolith"], self.monolithFileContent)
+        self.assertEqual(virtualSectionIndex.translateAddress(0x1000, 0x10), (None, None))
+
+
+class LineCounterTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def test_getLineNumber(self):
+        buffer = b"first\nsecond\n\nfourth\nfifth"
+        lineCounter = Emma.emma_libs.ghsMapfileProcessor.LineCounter(buffer)
+        # The positions are usually requested in ascending order, but going back to an earlier position (e.g. to the start of a block) needs to work as well
+        for position in (0, 3, 6, 13, 14, 15, 26, 8, 0, 21):
+            self.assertEqual(lineCounter.getLineNumber(position), buffer[:position].count(b"\n") + 1)
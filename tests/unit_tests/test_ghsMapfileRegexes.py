@@ -0,0 +1,62 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+import os
+import re
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+import Emma.emma_libs.ghsMapfileRegexes
+
+
+class TokenizeModuleSummaryLineTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        self.pattern = Emma.emma_libs.ghsMapfileRegexes.ModuleSummaryPattern()
+
+    def assertSameAsRegex(self, line):
+        lineComponents = self.pattern.lineTokenizer(line)
+        self.assertIsNotNone(lineComponents)
+        match = re.search(self.pattern.pattern, line)
+        self.assertIsNotNone(match)
+        self.assertEqual(lineComponents.group(self.pattern.Groups.origin), match.group(self.pattern.Groups.origin))
+        self.assertEqual(lineComponents.group(self.pattern.Groups.size), match.group(self.pattern.Groups.size))
+        self.assertEqual(lineComponents.group(self.pattern.Groups.section).rstrip(), match.group(self.pattern.Groups.section).rstrip())
+        self.assertEqual(self.pattern.getModuleName(lineComponents), self.pattern.getModuleName(match))
+
+    def test_defaultLayout(self):
+        self.assertSameAsRegex("00030000+001500  .os              os_scheduler.o\n")
+        self.assertSameAsRegex("00030000+001500  .os              libos.a\n")
+        self.assertSameAsRegex("00030000+001500\t.text\tcrt0.o   \n")
+        self.assertSameAsRegex("00030000+001500  .text  <linker>generated\n")
+        self.assertSameAsRegex("00030000+001500  .text  " + " " * 1000 + "main.o" + " " * 1000 + "\n")
+
+    def test_otherLayouts(self):
+        # Lines that the regex either does not match or may split differently are left for the regex
+        self.assertIsNone(self.pattern.lineTokenizer("\n"))
+        self.assertIsNone(self.pattern.lineTokenizer("  Origin+Size    Section          Module\n"))
+        self.assertIsNone(self.pattern.lineTokenizer(" 00030000+001500  .os  os_tick.o\n"))
+        self.assertIsNone(self.pattern.lineTokenizer("0003000G+001500  .os  os_tick.o\n"))
+        self.assertIsNone(self.pattern.lineTokenizer("00030000+001500  .os  os_tick\n"))
+        self.assertIsNone(self.pattern.lineTokenizer("00030000+001500  .os  <linker generated>\n"))
@@ -0,0 +1,65 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+import Emma.emma_libs.mapfileProcessor
+
+
+class MemoryRegionTableTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def test_lookUp(self):
+        memoryRegionTable = Emma.emma_libs.mapfileProcessor.MemoryRegionTable({"INT_RAM": {"start": "0x2000", "end": "0x2FFF", "type": "INT_RAM"},
+                                                                               "INT_FLASH": {"start": "0x1000", "end": "0x1FFF", "type": "INT_FLASH"},
+                                                                               "EXT_RAM": {"start": "0x8000", "end": "0x8FFF", "type": "EXT_RAM"}})
+        self.assertIsNotNone(memoryRegionTable.startAddresses)
+        self.assertEqual(memoryRegionTable.lookUp(0x1000, 0x1FFF), ("INT_FLASH", "INT_FLASH"))
+        self.assertEqual(memoryRegionTable.lookUp(0x2800, 0x28FF), ("INT_RAM", "INT_RAM"))
+        self.assertEqual(memoryRegionTable.lookUp(0x8FFF, 0x8FFF), ("EXT_RAM", "EXT_RAM"))
+        # Elements that are not contained by any of the regions
+        self.assertIsNone(memoryRegionTable.lookUp(0x0800, 0x080F))
+        self.assertIsNone(memoryRegionTable.lookUp(0x1FF0, 0x200F))
+        self.assertIsNone(memoryRegionTable.lookUp(0x9000, 0x900F))
+        # The zero length elements are only compared with the start addresses, the first region in the configuration that starts before them is used
+        self.assertEqual(memoryRegionTable.lookUp(0x1800, None), ("INT_FLASH", "INT_FLASH"))
+        self.assertEqual(memoryRegionTable.lookUp(0x2800, None), ("INT_RAM", "INT_RAM"))
+        self.assertEqual(memoryRegionTable.lookUp(0x9000, None), ("INT_RAM", "INT_RAM"))
+        self.assertIsNone(memoryRegionTable.lookUp(0x0800, None))
+
+    def test_lookUpOverlappingRegions(self):
+        # The regions can not be searched with a binary search, the first region in the configuration that contains the element has to be used
+        memoryRegionTable = Emma.emma_libs.mapfileProcessor.MemoryRegionTable({"INT_RAM_HIGH": {"start": "0x2800", "end": "0x2FFF", "type": "INT_RAM"},
+                                                                               "INT_RAM": {"start": "0x2000", "end": "0x2FFF", "type": "INT_RAM"}})
+        self.assertIsNone(memoryRegionTable.startAddresses)
+        self.assertEqual(memoryRegionTable.lookUp(0x2000, 0x20FF), ("INT_RAM", "INT_RAM"))
+        self.assertEqual(memoryRegionTable.lookUp(0x2800, 0x28FF), ("INT_RAM_HIGH", "INT_RAM"))
+        self.assertEqual(memoryRegionTable.lookUp(0x27F0, 0x280F), ("INT_RAM", "INT_RAM"))
+        self.assertIsNone(memoryRegionTable.lookUp(0x2FF0, 0x300F))
+
+
+if __name__ == "__main__":
+    unittest.main()
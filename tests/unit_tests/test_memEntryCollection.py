@@ -0,0 +1,133 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+import os
+import sys
+import copy
+import collections
+import shutil
+import tempfile
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+import Emma.emma_libs.memoryEntry
+import Emma.emma_libs.memoryMap
+import Emma.emma_libs.memEntryCollection
+from tests.unit_tests.memEntryFactory import createMemEntry
+
+
+class MemEntryCollectionTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        self.sectionContainer = [createMemEntry(0x0100, 0x0100, ".text"), createMemEntry(0x0180, 0x0100, ".data"), createMemEntry(0x0300, 0, ".bss", configId="SOC")]
+        self.objectContainer = [createMemEntry(0x0100, 0x0010, ".text", "a.o"), createMemEntry(0x0110, 0x00F0, ".text", "b.o")]
+
+    def assertSameEntries(self, first, second):
+        self.assertEqual(len(first), len(second))
+        for firstElement, secondElement in zip(first, second):
+            for attribute in Emma.emma_libs.memEntryCollection.ADDRESS_COLUMNS + Emma.emma_libs.memEntryCollection.DICTIONARY_COLUMNS:
+                self.assertEqual(getattr(firstElement, attribute), getattr(secondElement, attribute))
+            self.assertEqual(firstElement.addressEnd(), secondElement.addressEnd())
+
+    def test_rows(self):
+        collection = Emma.emma_libs.memEntryCollection.MemEntryCollection(self.sectionContainer)
+        self.assertEqual(len(collection), 3)
+        self.assertSameEntries(collection, self.sectionContainer)
+        self.assertIsInstance(collection[-1], Emma.emma_libs.memoryEntry.MemEntry)
+        self.assertEqual(collection[-1].addressEnd(), None)
+        self.assertEqual(collection[0].getFQN(), self.sectionContainer[0].getFQN())
+        with self.assertRaises(IndexError):
+            _ = collection[3]
+        # The equal strings and compiler specific data are stored only once
+        self.assertEqual(len(collection.dictionaryColumns["compilerSpecificData"].values), 1)
+        self.assertEqual(len(collection.dictionaryColumns["configID"].values), 2)
+
+    def test_rowViewWritesTheColumns(self):
+        collection = Emma.emma_libs.memEntryCollection.MemEntryCollection(self.sectionContainer)
+        collection[1].category = "Data"
+        collection[1].addressStart = 0x0200
+        self.assertEqual(collection[1].category, "Data")
+        self.assertEqual(list(collection.column("addressStart")), [0x0100, 0x0200, 0x0300])
+        # A deep copy is an independent MemEntry object
+        memEntry = copy.deepcopy(collection[1])
+        self.assertNotIsInstance(memEntry, Emma.emma_libs.memEntryCollection.MemEntryView)
+        memEntry.category = "Other"
+        self.assertEqual(collection[1].category, "Data")
+
+    def test_extend(self):
+        collection = Emma.emma_libs.memEntryCollection.MemEntryCollection(self.sectionContainer[:1])
+        collection.extend(Emma.emma_libs.memEntryCollection.MemEntryCollection(self.sectionContainer[1:]))
+        self.assertSameEntries(collection, self.sectionContainer)
+        self.assertSameEntries(collection[1:], self.sectionContainer[1:])
+
+    def test_equalValuesOfDifferentTypes(self):
+        # True, 1 and 1.0 are equal and have the same hash, but they need to get different codes
+        column = Emma.emma_libs.memEntryCollection.DictionaryEncodedColumn()
+        for value in (True, 1, 1.0, 1):
+            column.append(value)
+        self.assertEqual([type(value) for value in column.decode()], [bool, int, float, int])
+        self.assertEqual(len(column.values), 3)
+        # The same applies to the values of the compiler specific data
+        compilerSpecificDataColumn = Emma.emma_libs.memEntryCollection.DictionaryEncodedColumn()
+        for value in (True, 1):
+            compilerSpecificDataColumn.append(collections.OrderedDict([("DMA", value)]))
+        self.assertEqual([type(data["DMA"]) for data in compilerSpecificDataColumn.decode()], [bool, int])
+        # The index is rebuilt with the same keys after unpickling
+        unpickledColumn = copy.deepcopy(column)
+        self.assertEqual(unpickledColumn.encode(1.0), 2)
+        self.assertEqual(unpickledColumn.encode(True), 0)
+
+    def test_memoryMapFunctions(self):
+        collection = Emma.emma_libs.memEntryCollection.MemEntryCollection(self.sectionContainer)
+        Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(collection, Emma.emma_libs.memoryEntry.SectionEntry)
+        Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(self.sectionContainer, Emma.emma_libs.memoryEntry.SectionEntry)
+        self.assertSameEntries(collection, self.sectionContainer)
+        self.assertSameEntries(Emma.emma_libs.memoryMap.calculateObjectsInSections(collection, Emma.emma_libs.memEntryCollection.MemEntryCollection(self.objectContainer)),
+                               Emma.emma_libs.memoryMap.calculateObjectsInSections(self.sectionContainer, self.objectContainer))
+
+    def test_writeReportToDisk(self):
+        outputFolder = tempfile.mkdtemp()
+        try:
+            objectsInSections = Emma.emma_libs.memoryMap.calculateObjectsInSections(self.sectionContainer, self.objectContainer)
+            listReportPath = os.path.join(outputFolder, "list.csv")
+            collectionReportPath = os.path.join(outputFolder, "collection.csv")
+            Emma.emma_libs.memoryMap.writeReportToDisk(listReportPath, objectsInSections)
+            Emma.emma_libs.memoryMap.writeReportToDisk(collectionReportPath, Emma.emma_libs.memEntryCollection.MemEntryCollection(objectsInSections))
+            with open(listReportPath) as listReport, open(collectionReportPath) as collectionReport:
+                self.assertEqual(listReport.read(), collectionReport.read())
+        finally:
+            shutil.rmtree(outputFolder)
+
+    def test_streamReportToDisk(self):
+        outputFolder = tempfile.mkdtemp()
+        try:
+            objectsInSections = Emma.emma_libs.memoryMap.calculateObjectsInSections(self.sectionContainer, self.objectContainer)
+            concatenatedReportPath = os.path.join(outputFolder, "concatenated.csv")
+            streamedReportPath = os.path.join(outputFolder, "streamed.csv")
+            # The streamed report of the parts of a collection needs to be the same as the report of the whole collection
+            Emma.emma_libs.memoryMap.writeReportToDisk(concatenatedReportPath, Emma.emma_libs.memEntryCollection.MemEntryCollection(objectsInSections))
+            Emma.emma_libs.memoryMap.streamReportToDisk(streamedReportPath, [Emma.emma_libs.memEntryCollection.MemEntryCollection(objectsInSections[:3]), [], objectsInSections[3:]])
+            with open(concatenatedReportPath) as concatenatedReport, open(streamedReportPath) as streamedReport:
+                self.assertEqual(concatenatedReport.read(), streamedReport.read())
+        finally:
+            shutil.rmtree(outputFolder)
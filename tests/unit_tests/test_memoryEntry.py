@@ -216,6 +216,62 @@ class MemEntryTestCase(unittest.TestCase, TestData):
         self.assertEqual(otherMemEntry < self.basicMemEntry, False)
         self.assertEqual(otherMemEntry > self.basicMemEntry, True)
 
+    def test_sortMemEntries(self):
+        memEntries = []
+        for addressStart, objectName in ((0x3000, "First"), (0x1000, "Second"), (0x3000, "Third"), (0x2000, "Fourth"), (0x1000, "Fifth")):
+            memEntries.append(Emma.emma_libs.memoryEntry.MemEntry(configID=self.configID, mapfileName=self.mapfileName,
+                                                                  addressStart=addressStart, addressLength=self.addressLength, addressEnd=None,
+                                                                  sectionName=self.sectionName, objectName=objectName,
+                                                                  memType=self.memType, memTypeTag=self.memTypeTag, category=self.category,
+                                                                  compilerSpecificData=self.compilerSpecificData))
+        Emma.emma_libs.memoryEntry.sortMemEntries(memEntries)
+        # The entries with equal addressStart values need to keep their original order
+        self.assertEqual([memEntry.objectName for memEntry in memEntries], ["Second", "Fifth", "Fourth", "First", "Third"])
+
+    def test_addressEndIsUpdated(self):
+        self.basicMemEntry.addressStart = self.addressStart + 0x10
+        self.assertEqual(self.basicMemEntry.addressEnd(), self.addressEnd + 0x10)
+        self.basicMemEntry.addressLength = 0
+        self.assertIsNone(self.basicMemEntry.addressEnd())
+        self.basicMemEntry.setAddressesGivenEnd(self.addressEnd)
+        self.assertEqual(self.basicMemEntry.addressEnd(), self.addressEnd)
+
+    def test_compilerSpecificDataSchema(self):
+        schema = Emma.emma_libs.memoryEntry.CompilerSpecificDataSchema(("DMA", "vasName", "vasSectionName"))
+        compilerSpecificData = schema.create((self.vasName is None), self.vasName, self.vasSectionName)
+        # The equal data are shared
+        self.assertIs(schema.create((self.vasName is None), self.vasName, self.vasSectionName), compilerSpecificData)
+        self.assertIsNot(schema.create(True, None, None), compilerSpecificData)
+        # It can be used the same way as the collections.OrderedDict
+        self.assertEqual(list(compilerSpecificData.keys()), ["DMA", "vasName", "vasSectionName"])
+        self.assertEqual(compilerSpecificData, self.compilerSpecificData)
+        with self.assertRaises(TypeError):
+            compilerSpecificData["DMA"] = True                  # pylint: disable=unsupported-assignment-operation
+                                                                # Rationale: This test checks that the data can not be changed.
+        memEntry = Emma.emma_libs.memoryEntry.MemEntry(configID=self.configID, mapfileName=self.mapfileName, addressStart=self.addressStart, addressLength=self.addressLength,
+                                                       compilerSpecificData=compilerSpecificData)
+        self.assertFalse(self.actionErrorWasCalled)
+        self.assertIs(memEntry.compilerSpecificData, compilerSpecificData)
+
+    def test_createDerivedEntry(self):
+        self.basicMemEntry.overlapFlag = "Overlapping"
+        derivedEntry = self.basicMemEntry.createDerivedEntry(objectName="Derived", addressStart=self.addressStart + 0x10, addressLength=0x20)
+        self.assertEqual(derivedEntry.objectName, "Derived")
+        self.assertEqual(derivedEntry.addressStart, self.addressStart + 0x10)
+        self.assertEqual(derivedEntry.addressEnd(), self.addressStart + 0x2F)
+        # The other attributes are the ones of the source entry, including its original addresses
+        self.assertEqual(derivedEntry.sectionName, self.sectionName)
+        self.assertEqual(derivedEntry.overlapFlag, "Overlapping")
+        self.assertEqual(derivedEntry.addressStartOriginal, self.addressStart)
+        self.assertEqual(derivedEntry.addressLengthOriginal, self.addressLength)
+        # A mutable compiler specific data is not shared
+        self.assertEqual(derivedEntry.compilerSpecificData, self.basicMemEntry.compilerSpecificData)
+        self.assertIsNot(derivedEntry.compilerSpecificData, self.basicMemEntry.compilerSpecificData)
+        # Changing the derived entry does not influence the source entry
+        derivedEntry.addressLength = 0
+        self.assertEqual(self.basicMemEntry.addressLength, self.addressLength)
+        self.assertEqual(self.basicMemEntry.createDerivedEntry().objectName, self.objectName)
+
     def test___calculateAddressEnd(self):
         # pylint: disable=protected-access
         # Rationale: This test was specificly written to access this private method.
@@ -19,6 +19,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>
 
 import os
 import sys
+import random
 import collections
 import unittest
 
@@ -131,6 +132,38 @@ class ResolveDuplicateContainmentOverlapTestCase(unittest.TestCase):
         self.assertEqual(resolvedMemEntry.addressStartOriginal, originalMemEntry.addressStart)
         self.assertEqual(resolvedMemEntry.addressLengthOriginal, originalMemEntry.addressLength)
 
+    def test__sweepLineMatchesComparingAllPairs(self):
+        def createRandomCollection(randomGenerator):
+            collection = []
+            for _ in range(randomGenerator.randint(1, 30)):
+                compilerSpecificData = collections.OrderedDict()
+                compilerSpecificData["DMA"] = True
+                compilerSpecificData["vasName"] = ""
+                compilerSpecificData["vasSectionName"] = ""
+                collection.append(Emma.emma_libs.memoryEntry.MemEntry(configID=randomGenerator.choice(("MCU", "SOC")), mapfileName=randomGenerator.choice(("a.map", "b.map")),
+                                                                      addressStart=randomGenerator.randint(0, 64), addressLength=randomGenerator.choice((0, 1, 4, 8, 16, 24)),
+                                                                      sectionName=randomGenerator.choice((".text", ".data")), objectName=randomGenerator.choice(("", "a.o", "b.o")),
+                                                                      compilerSpecificData=compilerSpecificData))
+            Emma.emma_libs.memoryEntry.sortMemEntries(collection)
+            return collection
+
+        def resolveByComparingAllPairs(collection, memEntryHandler):
+            # The reference: every element is compared with every other one
+            for actualElement in collection:
+                for otherElement in collection:
+                    Emma.emma_libs.memoryMap.resolveElementPair(actualElement, otherElement, memEntryHandler)
+
+        randomGenerator = random.Random(0)
+        for memEntryHandler in (Emma.emma_libs.memoryEntry.SectionEntry, Emma.emma_libs.memoryEntry.ObjectEntry):
+            for _ in range(300):
+                collection = createRandomCollection(randomGenerator)
+                referenceCollection = [memEntry.createDerivedEntry() for memEntry in collection]
+                Emma.emma_libs.memoryMap.resolveDuplicateContainmentOverlap(collection, memEntryHandler)
+                resolveByComparingAllPairs(referenceCollection, memEntryHandler)
+                for memEntry, referenceMemEntry in zip(collection, referenceCollection):
+                    for attribute in ("addressStart", "addressLength", "duplicateFlag", "containmentFlag", "overlapFlag", "containingOthersFlag", "overlappingOthersFlag"):
+                        self.assertEqual(getattr(memEntry, attribute), getattr(referenceMemEntry, attribute))
+
     def test__singleSection(self):
         """
         S  |---|
@@ -940,5 +973,52 @@ class CalculateObjectsInSectionsTestCase(unittest.TestCase):
         self.checkSectionReserve(objectsInSections[13], sectionContainer[3], FOURTH_SECTION_ADDRESS_START, FOURTH_SECTION_ADDRESS_END)
 
 
+    def test_multipleConfigIds(self):
+        # pylint: disable=too-many-locals
+        # Rationale: These constants are needed to set up the used sections and objects.
+
+        """
+        S (MCU)   |------|------|
+        S (SOC)       |------|
+        O (MCU)   |--|        |--|
+        O (SOC)       |--|
+        """
+        # Creating the sections and objects for the test
+        FIRST_SECTION_ADDRESS_START = 0x0100
+        FIRST_SECTION_ADDRESS_END = 0x01FF
+        SECOND_SECTION_ADDRESS_START = 0x0200
+        SECOND_SECTION_ADDRESS_END = 0x02FF
+        OTHER_SECTION_ADDRESS_START = 0x0180
+        OTHER_SECTION_ADDRESS_END = 0x027F
+        FIRST_OBJECT_ADDRESS_START = 0x0100
+        FIRST_OBJECT_ADDRESS_END = 0x017F
+        SECOND_OBJECT_ADDRESS_START = 0x0280
+        SECOND_OBJECT_ADDRESS_END = 0x02FF
+        OTHER_OBJECT_ADDRESS_START = 0x0180
+        OTHER_OBJECT_ADDRESS_END = 0x01FF
+        sectionContainer, objectContainer = createMemEntryObjects([MemEntryData(FIRST_SECTION_ADDRESS_START, FIRST_SECTION_ADDRESS_END),
+                                                                   MemEntryData(OTHER_SECTION_ADDRESS_START, OTHER_SECTION_ADDRESS_END, configId="SOC"),
+                                                                   MemEntryData(SECOND_SECTION_ADDRESS_START, SECOND_SECTION_ADDRESS_END)],
+                                                                  [MemEntryData(FIRST_OBJECT_ADDRESS_START, FIRST_OBJECT_ADDRESS_END),
+                                                                   MemEntryData(OTHER_OBJECT_ADDRESS_START, OTHER_OBJECT_ADDRESS_END, configId="SOC"),
+                                                                   MemEntryData(SECOND_OBJECT_ADDRESS_START, SECOND_OBJECT_ADDRESS_END)])
+        # Calculating the objectsInSections list
+        objectsInSections = Emma.emma_libs.memoryMap.calculateObjectsInSections(sectionContainer, objectContainer)
+
+        # Check the number of created elements: firstSectionEntry + firstObject + firstSectionReserve +
+        #                                       otherSectionEntry + otherObject + otherSectionReserve +
+        #                                       secondSectionEntry + secondSectionReserve + secondObject
+        self.assertEqual(len(objectsInSections), 9)
+        # The objects of a configID must only fill the sections of the same configID
+        self.checkSectionEntry(objectsInSections[0], sectionContainer[0])
+        self.assertEqualObjects(objectsInSections[1], objectContainer[0])
+        self.checkSectionReserve(objectsInSections[2], sectionContainer[0], (FIRST_OBJECT_ADDRESS_END + 1), FIRST_SECTION_ADDRESS_END)
+        self.checkSectionEntry(objectsInSections[3], sectionContainer[1])
+        self.assertEqualObjects(objectsInSections[4], objectContainer[1])
+        self.checkSectionReserve(objectsInSections[5], sectionContainer[1], (OTHER_OBJECT_ADDRESS_END + 1), OTHER_SECTION_ADDRESS_END)
+        self.checkSectionEntry(objectsInSections[6], sectionContainer[2])
+        self.checkSectionReserve(objectsInSections[7], sectionContainer[2], SECOND_SECTION_ADDRESS_START, (SECOND_OBJECT_ADDRESS_START - 1))
+        self.assertEqualObjects(objectsInSections[8], objectContainer[2])
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,128 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+import numpy
+import pandas
+import pandas.testing
+from pypiscout.SCout_Logger import Logger as sc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.shared_libs.reportBundle
+import Emma.emma_libs.memoryMap
+import Emma.emma_libs.memEntryCollection
+from tests.unit_tests.memEntryFactory import createMemEntry
+
+
+class ReportBundleTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        # Setting up the logger so the errors exit like in the Emma applications
+        sc()(4, actionWarning=None, actionError=lambda: sys.exit(-10))
+        self.outputFolder = tempfile.mkdtemp()
+        self.bundlePath = os.path.join(self.outputFolder, "results" + BUNDLE_FILE_EXTENSION)
+        sectionContainer = [createMemEntry(0x0100, 0x0100, ".text"), createMemEntry(0x0300, 0x0100, ".data", configId="SOC")]
+        objectContainer = [createMemEntry(0x0100, 0x0010, ".text", "a.o"), createMemEntry(0x0110, 0x00F0, ".text", "b.o"), createMemEntry(0x0300, 0x0000, ".data", "c.o", "SOC")]
+        self.consumerCollections = {FILE_IDENTIFIER_SECTION_SUMMARY: [Emma.emma_libs.memEntryCollection.MemEntryCollection(sectionContainer[:1]), sectionContainer[1:]],
+                                    FILE_IDENTIFIER_OBJECTS_IN_SECTIONS: [Emma.emma_libs.memoryMap.calculateObjectsInSections(sectionContainer, objectContainer)]}
+        reports = {collectionType: Emma.emma_libs.memoryMap.createReport(consumerCollections) for collectionType, consumerCollections in self.consumerCollections.items()}
+        Emma.shared_libs.reportBundle.writeBundleToDisk(self.bundlePath, reports, {"projectName": "project"})
+
+    def tearDown(self):
+        shutil.rmtree(self.outputFolder)
+
+    def test_readReportFromBundle(self):
+        # The DataFrames read from the bundle are the same as the ones read from the CSV reports, including the types of the columns
+        for collectionType, consumerCollections in self.consumerCollections.items():
+            reportPath = os.path.join(self.outputFolder, collectionType + CSV_FILE_EXTENSION)
+            Emma.emma_libs.memoryMap.streamReportToDisk(reportPath, consumerCollections)
+            pandas.testing.assert_frame_equal(Emma.shared_libs.reportBundle.readReport(self.bundlePath, collectionType), Emma.shared_libs.reportBundle.readReport(reportPath, collectionType))
+
+    def test_createReportFrame(self):
+        # The DataFrames created in the same process are the same as the ones read from the CSV reports
+        for collectionType, consumerCollections in self.consumerCollections.items():
+            reportPath = os.path.join(self.outputFolder, collectionType + CSV_FILE_EXTENSION)
+            Emma.emma_libs.memoryMap.streamReportToDisk(reportPath, consumerCollections)
+            reportFrame = Emma.shared_libs.reportBundle.createReportFrame(*Emma.emma_libs.memoryMap.createReport(consumerCollections))
+            pandas.testing.assert_frame_equal(reportFrame, Emma.shared_libs.reportBundle.readReport(reportPath, collectionType))
+
+    def test_readSelectedColumns(self):
+        # Only the selected columns are read, the categorical ones are the same from the bundle and from the CSV reports
+        for collectionType, consumerCollections in self.consumerCollections.items():
+            reportPath = os.path.join(self.outputFolder, collectionType + CSV_FILE_EXTENSION)
+            Emma.emma_libs.memoryMap.streamReportToDisk(reportPath, consumerCollections)
+            columns = VISUALISER_REPORT_COLUMNS[collectionType]
+            reportFrame = Emma.shared_libs.reportBundle.readReport(self.bundlePath, collectionType, columns, VISUALISER_CATEGORICAL_COLUMNS)
+            pandas.testing.assert_frame_equal(reportFrame, Emma.shared_libs.reportBundle.readReport(reportPath, collectionType, columns, VISUALISER_CATEGORICAL_COLUMNS))
+            self.assertEqual(set(reportFrame.columns) | {reportFrame.index.name}, set(columns))
+            self.assertEqual(reportFrame[CONFIG_ID].dtype.name, "category")
+            self.assertEqual(list(reportFrame[CONFIG_ID].cat.categories), ["MCU", "SOC"])
+
+    def test_bundleLayout(self):
+        with numpy.load(self.bundlePath, allow_pickle=False) as bundle:
+            self.assertEqual(int(bundle["formatVersion"]), BUNDLE_FORMAT_VERSION)
+            self.assertEqual(json.loads(str(bundle["metadata"])), {"projectName": "project"})
+            self.assertEqual(list(bundle["collectionTypes"]), [FILE_IDENTIFIER_SECTION_SUMMARY, FILE_IDENTIFIER_OBJECTS_IN_SECTIONS])
+            headers = list(bundle["Section_Summary/headers"])
+            kinds = dict(zip(headers, bundle["Section_Summary/kinds"]))
+            self.assertEqual(kinds[SIZE_DEC], Emma.shared_libs.reportBundle.COLUMN_KIND_INTEGER)
+            self.assertEqual(kinds["DMA"], Emma.shared_libs.reportBundle.COLUMN_KIND_BOOLEAN)
+            self.assertEqual(kinds[CONFIG_ID], Emma.shared_libs.reportBundle.COLUMN_KIND_STRING)
+            # The texts are dictionary encoded, every different value is stored once
+            configIdIndex = headers.index(CONFIG_ID)
+            self.assertEqual(list(bundle[f"Section_Summary/{configIdIndex}/values"]), ["MCU", "SOC"])
+            self.assertEqual(list(bundle[f"Section_Summary/{configIdIndex}/codes"]), [0, 1])
+
+    def test_equalValuesOfDifferentTypes(self):
+        # True, 1 and 1.0 are equal, but they are different values in the CSV reports, so they need to get different codes
+        column = Emma.shared_libs.reportBundle.BundleColumn(False)
+        column.extend([True, 1, 1.0, "x", 1])
+        kind, columnArrays = column.toArrays()
+        self.assertEqual(kind, Emma.shared_libs.reportBundle.COLUMN_KIND_STRING)
+        self.assertEqual(list(columnArrays["values"]), ["True", "1", "1.0", "x"])
+        self.assertEqual(list(columnArrays["codes"]), [0, 1, 2, 3, 1])
+        # A column of booleans and integers is not read back as a boolean column, the values are the same as the ones read from the CSV report
+        sectionContainer = [createMemEntry(0x0100, 0x0100, ".text"), createMemEntry(0x0200, 0x0100, ".data")]
+        sectionContainer[1].compilerSpecificData["DMA"] = 1
+        reportPath = os.path.join(self.outputFolder, FILE_IDENTIFIER_SECTION_SUMMARY + CSV_FILE_EXTENSION)
+        Emma.emma_libs.memoryMap.streamReportToDisk(reportPath, [sectionContainer])
+        Emma.shared_libs.reportBundle.writeBundleToDisk(self.bundlePath, {FILE_IDENTIFIER_SECTION_SUMMARY: Emma.emma_libs.memoryMap.createReport([sectionContainer])}, {})
+        reportFrame = Emma.shared_libs.reportBundle.readReport(self.bundlePath, FILE_IDENTIFIER_SECTION_SUMMARY)
+        pandas.testing.assert_frame_equal(reportFrame, Emma.shared_libs.reportBundle.readReport(reportPath, FILE_IDENTIFIER_SECTION_SUMMARY))
+        self.assertEqual(list(reportFrame["DMA"]), ["True", "1"])
+
+    def test_missingCollectionType(self):
+        with self.assertRaises(SystemExit):
+            Emma.shared_libs.reportBundle.readReport(self.bundlePath, FILE_IDENTIFIER_OBJECT_SUMMARY)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Emma - Emma Memory and Mapfile Analyser
+Copyright (C) 2019 The Emma authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+
+import os
+import sys
+import csv
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+# pylint: disable=wrong-import-position
+# Rationale: This module needs to access modules that are above them in the folder structure.
+
+from Emma.shared_libs.stringConstants import *                           # pylint: disable=unused-wildcard-import,wildcard-import
+import Emma.emma_libs.memoryMap
+import Emma.emma_libs.memEntryCollection
+import Emma.emma_libs.reportDatabase
+from tests.unit_tests.memEntryFactory import createMemEntry
+
+
+class ReportDatabaseTestCase(unittest.TestCase):
+    # pylint: disable=invalid-name, missing-docstring
+    # Rationale: Tests need to have the following method names in order to be discovered: test_<METHOD_NAME>(). It is not necessary to add a docstring for every unit test.
+
+    def setUp(self):
+        self.outputFolder = tempfile.mkdtemp()
+        sectionContainer = [createMemEntry(0x0100, 0x0100, ".text"), createMemEntry(0x0300, 0x0100, ".data", configId="SOC")]
+        objectContainer = [createMemEntry(0x0100, 0x0010, ".text", "a.o"), createMemEntry(0x0110, 0x00F0, ".text", "b.o")]
+        self.consumerCollections = {FILE_IDENTIFIER_SECTION_SUMMARY: [Emma.emma_libs.memEntryCollection.MemEntryCollection(sectionContainer[:1]), sectionContainer[1:]],
+                                    FILE_IDENTIFIER_OBJECTS_IN_SECTIONS: [Emma.emma_libs.memoryMap.calculateObjectsInSections(sectionContainer, objectContainer)]}
+
+    def tearDown(self):
+        shutil.rmtree(self.outputFolder)
+
+    def test_writeDatabaseToDisk(self):
+        databasePath = os.path.join(self.outputFolder, "results.db")
+        Emma.emma_libs.reportDatabase.writeDatabaseToDisk(databasePath, self.consumerCollections, "project", {"MCU": "GHS", "SOC": "GHS"})
+        connection = sqlite3.connect(databasePath)
+        try:
+            metadata = dict(connection.execute("SELECT key, value FROM metadata"))
+            self.assertEqual(metadata["projectName"], "project")
+            self.assertEqual(metadata["timestamp"], Emma.emma_libs.memoryMap.TIMESTAMP)
+            self.assertEqual(connection.execute("SELECT configID, compiler FROM configIDs ORDER BY configID").fetchall(), [("MCU", "GHS"), ("SOC", "GHS")])
+            # The addresses are stored as integers, the missing values as NULL
+            self.assertEqual(connection.execute(f"SELECT addrStartDec, \"{SIZE_DEC}\", configID, \"{OVERLAP_FLAG}\" FROM Section_Summary").fetchall(), [(0x0100, 0x0100, "MCU", None), (0x0300, 0x0100, "SOC", None)])
+            self.assertEqual(connection.execute(f"SELECT COUNT(*) FROM Objects_in_Sections WHERE \"{OBJECT_NAME}\" = ?", (OBJECTS_IN_SECTIONS_SECTION_ENTRY,)).fetchone()[0], 2)
+            # The queries of the indexed columns are using the indexes
+            queryPlan = connection.execute("EXPLAIN QUERY PLAN SELECT * FROM Objects_in_Sections WHERE configID = ? AND memType = ?", ("MCU", "INT_FLASH")).fetchall()
+            self.assertIn("USING INDEX", queryPlan[0][-1])
+        finally:
+            connection.close()
+
+    def test_tablesHaveTheColumnsOfTheReports(self):
+        databasePath = os.path.join(self.outputFolder, "results.db")
+        reportPath = os.path.join(self.outputFolder, "report.csv")
+        Emma.emma_libs.reportDatabase.writeDatabaseToDisk(databasePath, self.consumerCollections, "project", {"MCU": "GHS", "SOC": "GHS"})
+        Emma.emma_libs.memoryMap.streamReportToDisk(reportPath, self.consumerCollections[FILE_IDENTIFIER_OBJECTS_IN_SECTIONS])
+        with open(reportPath) as fp:
+            reportRows = list(csv.reader(fp, delimiter=";"))
+        connection = sqlite3.connect(databasePath)
+        try:
+            cursor = connection.execute("SELECT * FROM Objects_in_Sections")
+            self.assertEqual([column[0] for column in cursor.description], reportRows[0])
+            # Apart from the missing values, the values are the same as in the CSV report
+            databaseRows = [["" if value is None else str(value) for value in row] for row in cursor]
+            self.assertEqual(databaseRows, reportRows[1:])
+        finally:
+            connection.close()
+
+
+if __name__ == "__main__":
+    unittest.main()